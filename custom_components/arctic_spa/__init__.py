@@ -2,35 +2,225 @@
 
 from __future__ import annotations
 
+import logging
+import time
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_API_KEY, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 
 from .api import ArcticSpaClient
-from .coordinator import ArcticSpaCoordinator
+from .const import (
+    CONF_COMMAND_JOURNAL,
+    CONF_DEDICATED_CONNECTOR,
+    CONF_LOCAL_HOST,
+    CONF_SCAN_INTERVAL,
+    CONF_STATUS_CAPTURE,
+    CONF_TELEMETRY,
+    CONNECTIONS_PER_SPA,
+    DOMAIN,
+    LIVE_OPTIONS,
+    LOCAL_RETRY_SECONDS,
+    OPTION_DEFAULTS,
+)
+from .coordinator import (
+    ArcticSpaCoordinator,
+    heating_store,
+    journal_store,
+    status_capture,
+    telemetry_store,
+)
+from .entity import excluded_keys
+from .services import async_setup_services
+from .transport import AiohttpTransport, FallbackTransport, Transport, create_session
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+    from .local import LocalTransport
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.BINARY_SENSOR,
     Platform.SWITCH,
     Platform.NUMBER,
+    Platform.WATER_HEATER,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Arctic Spa services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Arctic Spa from a config entry."""
-    session = async_get_clientsession(hass)
-    client = ArcticSpaClient(entry.data[CONF_API_KEY], session=session)
+    start = time.monotonic()
+    if entry.options.get(CONF_DEDICATED_CONNECTOR, False):
+        session = _async_acquire_dedicated_session(hass, entry)
+    else:
+        session = async_get_clientsession(hass)
+    transport: Transport = AiohttpTransport(session)
+    local: LocalTransport | None = None
+    if address := entry.options.get(CONF_LOCAL_HOST):
+        from .local import LocalTransport, parse_address
+
+        local = LocalTransport(*parse_address(address))
+        transport = FallbackTransport(local, transport, LOCAL_RETRY_SECONDS)
+    client = ArcticSpaClient(entry.data[CONF_API_KEY], transport=transport)
     coordinator = ArcticSpaCoordinator(hass, client, entry)
-    await coordinator.async_config_entry_first_refresh()
+    if local is not None:
+        coordinator.local = local
+        local.push_listener = coordinator.async_handle_push
+    if entry.options.get(CONF_COMMAND_JOURNAL, False):
+        await coordinator.async_enable_journal()
+    await coordinator.async_load_heating_model()
+    if entry.options.get(CONF_STATUS_CAPTURE, False):
+        coordinator.async_enable_capture()
+    if entry.options.get(CONF_TELEMETRY, False):
+        coordinator.async_enable_telemetry()
+    refresh_start = time.monotonic()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await client.close()
+        await _async_release_dedicated_session(hass, entry)
+        raise
 
     entry.runtime_data = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    platforms_start = time.monotonic()
+    _async_remove_excluded_entities(hass, entry)
+    coordinator.platforms = _async_enabled_platforms(hass, entry)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    end = time.monotonic()
+    coordinator.setup_timings = {
+        "prepare": round(refresh_start - start, 4),
+        "first_refresh": round(platforms_start - refresh_start, 4),
+        "platforms": round(end - platforms_start, 4),
+    }
+    _LOGGER.debug(
+        "Set up %s in %.3fs (%s), platforms %s",
+        entry.title,
+        end - start,
+        coordinator.setup_timings,
+        coordinator.platforms,
+    )
     return True
 
 
+@callback
+def _async_remove_excluded_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the registry entries of entities the entry's options leave out."""
+    registry = er.async_get(hass)
+    excluded = excluded_keys(entry.options)
+    for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity.unique_id.removeprefix(f"{entry.entry_id}_") in excluded:
+            registry.async_remove(entity.entity_id)
+
+
+@callback
+def _async_enabled_platforms(hass: HomeAssistant, entry: ConfigEntry) -> list[Platform]:
+    """Return the platforms to load, skipping those whose entities are all disabled.
+
+    Enabling one of their entities reloads the entry, which loads the platform again.
+    """
+    all_disabled: dict[str, bool] = {}
+    for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+        all_disabled[entity.domain] = all_disabled.get(entity.domain, True) and entity.disabled
+    return [platform for platform in PLATFORMS if not all_disabled.get(platform, False)]
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running spa, reloading only when needed.
+
+    Poll interval, timeouts, retries, deadbands and hedging are applied in
+    place so entities stay available; any other option reloads the entry.
+    """
+    coordinator: ArcticSpaCoordinator = entry.runtime_data
+    previous = coordinator.options
+    changed = {
+        key
+        for key in previous.keys() | entry.options.keys()
+        if previous.get(key, OPTION_DEFAULTS.get(key))
+        != entry.options.get(key, OPTION_DEFAULTS.get(key))
+    }
+    if not changed <= LIVE_OPTIONS:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    interval = coordinator.update_interval
+    coordinator.async_apply_options(entry.options)
+    if coordinator.update_interval != interval:
+        # Poll now so the new interval is scheduled from this poll
+        await coordinator.async_request_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unloaded = await hass.config_entries.async_unload_platforms(entry, entry.runtime_data.platforms)
+    if unloaded:
+        await entry.runtime_data.async_flush_capture()
+        await entry.runtime_data.client.close()
+        await _async_release_dedicated_session(hass, entry)
+    return unloaded
+
+
+@callback
+def _async_acquire_dedicated_session(hass: HomeAssistant, entry: ConfigEntry) -> ClientSession:
+    """Return the pooled session shared by all spas that opted in, creating it if needed.
+
+    The pool is sized for every configured spa, and its keep-alive for the
+    longest poll interval of the spas that opted in, when it is first created.
+    Spas added and poll intervals changed later use it as it is until every
+    spa using it has been unloaded, e.g. on a restart.
+    """
+    shared = hass.data.setdefault(DOMAIN, {})
+    if "session" not in shared:
+        entries = hass.config_entries.async_entries(DOMAIN)
+        poll_interval = max(
+            other.options.get(CONF_SCAN_INTERVAL, OPTION_DEFAULTS[CONF_SCAN_INTERVAL])
+            for other in entries
+            if other.options.get(CONF_DEDICATED_CONNECTOR, False)
+        )
+        session = shared["session"] = create_session(
+            CONNECTIONS_PER_SPA * len(entries), poll_interval
+        )
+        shared["session_users"] = set()
+
+        async def _async_close_session(_event: Event) -> None:
+            await session.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    shared["session_users"].add(entry.entry_id)
+    return shared["session"]
+
+
+async def _async_release_dedicated_session(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Close the pooled session once the last spa using it is unloaded."""
+    shared = hass.data.get(DOMAIN, {})
+    users = shared.get("session_users")
+    if users is None or entry.entry_id not in users:
+        return
+    users.discard(entry.entry_id)
+    if not users:
+        del shared["session_users"]
+        await shared.pop("session").close()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data when a config entry is deleted."""
+    await journal_store(hass, entry.entry_id).async_remove()
+    await heating_store(hass, entry.entry_id).async_remove()
+    await hass.async_add_executor_job(status_capture(hass, entry.entry_id).remove)
+    await hass.async_add_executor_job(telemetry_store(hass, entry.entry_id).remove)
@@ -2,16 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import math
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from enum import StrEnum
+from enum import IntEnum, StrEnum
+from functools import partial
+from typing import TypeVar
 
 import aiohttp
 
+from .const import (
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_POLL_RETRIES,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_STATUS_TIMEOUT,
+)
+from .transport import AiohttpTransport, Transport, TransportError
+
+try:
+    import orjson
+except ImportError:  # orjson ships with Home Assistant but is optional here
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 API_BASE_URL = "https://api.myarcticspa.com/v2/spa"
 
+# Hedged GETs: each GET earns a fraction of a hedge so hedges stay within ~10 %
+# extra requests, and hedging waits for enough samples to know the p95
+_HEDGE_BUDGET_PER_REQUEST = 0.1
+_HEDGE_MIN_SAMPLES = 20
+_HEDGE_MIN_DELAY = 1.0
+
+_T = TypeVar("_T")
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 class PumpState(StrEnum):
     """Pump states."""
@@ -28,7 +59,7 @@ class LightState(StrEnum):
     ON = "on"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpaStatus:
     """Parsed spa status."""
 
@@ -74,6 +105,144 @@ class SpaStatus:
         )
 
 
+class LatencyStats:
+    """Rolling window of request latencies with summary statistics."""
+
+    __slots__ = ("_samples", "count", "errors", "last")
+
+    def __init__(self, window: int | None = 100) -> None:
+        """Initialize the stats with a sample window; None keeps every sample."""
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.errors = 0
+        self.last: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Record a successful sample."""
+        self._samples.append(seconds)
+        self.count += 1
+        self.last = seconds
+
+    def record_error(self) -> None:
+        """Record a failed request."""
+        self.errors += 1
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile of the window, or None if empty."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def histogram(self, bounds: tuple[float, ...]) -> dict[str, int]:
+        """Return counts of windowed samples per upper bound, plus an overflow bucket."""
+        buckets = {f"le_{bound:g}": 0 for bound in bounds}
+        buckets[f"gt_{bounds[-1]:g}"] = 0
+        for sample in self._samples:
+            for bound in bounds:
+                if sample <= bound:
+                    buckets[f"le_{bound:g}"] += 1
+                    break
+            else:
+                buckets[f"gt_{bounds[-1]:g}"] += 1
+        return buckets
+
+    def as_dict(self) -> dict:
+        """Return a summary suitable for diagnostics."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "last": self.last,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": max(self._samples, default=None),
+        }
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Last 200 response of a GET endpoint, kept for conditional requests."""
+
+    headers: dict[str, str]
+    data: dict
+    status: SpaStatus | None = None
+
+
+class RequestPriority(IntEnum):
+    """Request priorities, most urgent first."""
+
+    COMMAND = 0
+    CONFIRM = 1
+    POLL = 2
+
+
+class RequestScheduler:
+    """Priority gate for the requests of one client.
+
+    At most ``max_concurrent`` requests are in flight, and queued requests start
+    in priority order. Background polls also wait while any command is running,
+    and a command that starts cancels in-flight polls; those are retried once the
+    command is done, so interactive requests never queue behind a slow poll.
+    """
+
+    def __init__(self, max_concurrent: int = 4) -> None:
+        """Initialize the scheduler."""
+        self._max_concurrent = max_concurrent
+        self._condition = asyncio.Condition()
+        self._running: Counter[RequestPriority] = Counter()
+        self._waiting: Counter[RequestPriority] = Counter()
+        self._polls: dict[asyncio.Future, bool] = {}
+        self.preempted = 0
+
+    def _can_start(self, priority: RequestPriority) -> bool:
+        """Return True if a request of this priority may start now."""
+        if self._running.total() >= self._max_concurrent:
+            return False
+        if any(self._waiting[other] for other in RequestPriority if other < priority):
+            return False
+        return not (priority is RequestPriority.POLL and self._running[RequestPriority.COMMAND])
+
+    def _preempt_polls(self) -> None:
+        """Cancel in-flight polls so they are retried after the command."""
+        for task, preempted in self._polls.items():
+            if not preempted:
+                self._polls[task] = True
+                task.cancel()
+                self.preempted += 1
+
+    async def run(self, priority: RequestPriority, request: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``request`` once the scheduler admits it, retrying preempted polls."""
+        while True:
+            async with self._condition:
+                self._waiting[priority] += 1
+                try:
+                    await self._condition.wait_for(lambda: self._can_start(priority))
+                finally:
+                    self._waiting[priority] -= 1
+                    self._condition.notify_all()
+                self._running[priority] += 1
+                if priority is RequestPriority.COMMAND:
+                    self._preempt_polls()
+            try:
+                if priority is not RequestPriority.POLL:
+                    return await request()
+                task = asyncio.ensure_future(request())
+                self._polls[task] = False
+                try:
+                    return await task
+                except asyncio.CancelledError:
+                    if not self._polls[task]:
+                        raise
+                    _LOGGER.debug("Status poll preempted by a command, retrying")
+                finally:
+                    del self._polls[task]
+            finally:
+                async with self._condition:
+                    self._running[priority] -= 1
+                    self._condition.notify_all()
+
+
 class ArcticSpaApiError(Exception):
     """Base exception for Arctic Spa API errors."""
 
@@ -86,85 +255,286 @@ class ArcticSpaConnectionError(ArcticSpaApiError):
     """Connection error."""
 
 
+class ArcticSpaPayloadError(ArcticSpaApiError):
+    """Malformed response payload."""
+
+
+# Status payload schema: (JSON key, accepted types, required). Exact type checks
+# keep booleans out of numeric fields; JSON null is accepted for optional keys.
+_STATUS_SCHEMA: tuple[tuple[str, tuple[type, ...], bool], ...] = (
+    ("connected", (bool,), True),
+    ("temperatureF", (int,), False),
+    ("setpointF", (int,), False),
+    ("lights", (str,), False),
+    ("pump1", (str,), False),
+    ("pump2", (str,), False),
+    ("spaboy_connected", (bool,), False),
+    ("spaboy_producing", (bool,), False),
+    ("ph", (float, int), False),
+    ("ph_status", (str,), False),
+    ("orp", (int,), False),
+    ("orp_status", (str,), False),
+    ("filter_status", (str,), False),
+    ("filtration_duration", (int,), False),
+    ("filtration_frequency", (int,), False),
+    ("filter_suspension", (str,), False),
+    ("errors", (list,), False),
+)
+
+
+def decode_status(raw: bytes) -> dict:
+    """Decode and validate a /status payload in one pass over the raw bytes.
+
+    Raises ArcticSpaPayloadError on invalid JSON, a missing required key or a
+    value of the wrong type, instead of letting SpaStatus fall back to defaults.
+    An optional field sent as null is dropped, so readers see it as missing and
+    use their default rather than None.
+    """
+    try:
+        data = _loads(raw)
+    except ValueError as err:
+        raise ArcticSpaPayloadError(f"Invalid JSON in status payload: {err}") from err
+    if not isinstance(data, dict):
+        raise ArcticSpaPayloadError("Status payload is not a JSON object")
+    for key, types, required in _STATUS_SCHEMA:
+        value = data.get(key)
+        if value is None:
+            if required:
+                raise ArcticSpaPayloadError(f"Status payload is missing {key!r}")
+            data.pop(key, None)
+            continue
+        if type(value) not in types:
+            raise ArcticSpaPayloadError(
+                f"Status field {key!r} has type {type(value).__name__}, "
+                f"expected {' or '.join(t.__name__ for t in types)}"
+            )
+    if not all(type(error) is str for error in data.get("errors", ())):
+        raise ArcticSpaPayloadError("Status field 'errors' must be a list of strings")
+    return data
+
+
+_DECODERS: dict[str, Callable[[bytes], dict]] = {"status": decode_status}
+
+
 class ArcticSpaClient:
     """Client for the Arctic Spa cloud API.
 
     API documentation: https://api.myarcticspa.com/docs
     """
 
-    def __init__(self, api_key: str, session: aiohttp.ClientSession | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        session: aiohttp.ClientSession | None = None,
+        hedge: bool = False,
+        base_url: str = API_BASE_URL,
+        transport: Transport | None = None,
+    ) -> None:
         """Initialize the client.
 
         Args:
             api_key: Arctic Spa API key from myarcticspa.com
             session: Optional aiohttp session (one will be created if not provided)
+            hedge: Send a second GET when the first is slower than the observed p95
+            base_url: API root, e.g. a local stand-in server for testing
+            transport: Carries the requests; defaults to aiohttp over ``session``
         """
         self._api_key = api_key
-        self._session = session
-        self._own_session = session is None
-
-    @property
-    def _headers(self) -> dict[str, str]:
-        """Return request headers."""
-        return {
-            "X-API-KEY": self._api_key,
+        self._base_url = base_url.rstrip("/")
+        self._headers = {
+            "X-API-KEY": api_key,
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
         }
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-            self._own_session = True
-        return self._session
+        self._cache: dict[str, _CachedResponse] = {}
+        self.not_modified = 0
+        # Seconds spent decoding the last GET's body (0 for a 304)
+        self.last_decode = 0.0
+        self._transport = transport or AiohttpTransport(session)
+        self.get_stats = LatencyStats()
+        self.put_stats = LatencyStats()
+        self.scheduler = RequestScheduler()
+        self.hedge = hedge
+        self.hedged = 0
+        # Tunable at runtime; read on every request
+        self.get_timeout: float = DEFAULT_STATUS_TIMEOUT
+        self.put_timeout: float = DEFAULT_COMMAND_TIMEOUT
+        self.poll_retries = DEFAULT_POLL_RETRIES
+        self.retry_delay: float = DEFAULT_RETRY_DELAY
+        self._hedge_budget = 0.0
+        # Called with (endpoint, payload, error or None) after every PUT
+        self.command_listener: Callable[[str, dict, Exception | None], None] | None = None
 
     async def close(self) -> None:
-        """Close the session if we own it."""
-        if self._own_session and self._session and not self._session.closed:
-            await self._session.close()
+        """Close the transport."""
+        await self._transport.close()
+
+    def set_api_key(self, api_key: str) -> None:
+        """Use a new API key from the next request on.
+
+        Cached validators were obtained with the old key, so they are dropped
+        and the next status poll is unconditional.
+        """
+        self._api_key = api_key
+        self._headers = {**self._headers, "X-API-KEY": api_key}
+        self._cache.clear()
 
-    async def _get(self, endpoint: str) -> dict:
-        """Send a GET request."""
-        session = await self._get_session()
+    async def _get(self, endpoint: str, priority: RequestPriority = RequestPriority.POLL) -> dict:
+        """Send a GET request through the scheduler, retrying connection failures.
+
+        A failed GET is retried up to ``poll_retries`` times, waiting
+        ``retry_delay`` seconds before the first retry and doubling each time.
+        """
+        attempt = 0
+        while True:
+            send = self._send_get_hedged if self.hedge else self._send_get
+            try:
+                return await self.scheduler.run(priority, partial(send, endpoint))
+            except ArcticSpaConnectionError as err:
+                if attempt >= self.poll_retries:
+                    raise
+                delay = self.retry_delay * 2**attempt
+                attempt += 1
+                _LOGGER.debug("GET %s failed (%s), retrying in %.1fs", endpoint, err, delay)
+                await asyncio.sleep(delay)
+
+    def _hedge_delay(self) -> float | None:
+        """Return how long to wait before hedging a GET, or None if no hedge is allowed."""
+        self._hedge_budget = min(1.0, self._hedge_budget + _HEDGE_BUDGET_PER_REQUEST)
+        if self._hedge_budget < 1.0 or self.get_stats.count < _HEDGE_MIN_SAMPLES:
+            return None
+        return max(_HEDGE_MIN_DELAY, self.get_stats.percentile(95))
+
+    async def _send_get_hedged(self, endpoint: str) -> dict:
+        """Send a GET, racing a second copy if the first is slower than usual.
+
+        The first successful response wins and the other request is cancelled.
+        """
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._send_get(endpoint)
+
+        tasks = [asyncio.ensure_future(self._send_get(endpoint))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return tasks[0].result()
+
+            _LOGGER.debug("GET %s slower than %.2fs, sending hedge request", endpoint, delay)
+            self._hedge_budget -= 1.0
+            self.hedged += 1
+            tasks.append(asyncio.ensure_future(self._send_get(endpoint)))
+            pending = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _send_get(self, endpoint: str) -> dict:
+        """Send a GET request.
+
+        When the server supplied an ETag or Last-Modified, the request is made
+        conditional and a 304 returns the cached data object without decoding.
+        """
+        cached = self._cache.get(endpoint)
+        self.last_decode = 0.0
+        start = time.monotonic()
         try:
-            async with session.get(
-                f"{API_BASE_URL}/{endpoint}",
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as resp:
-                if resp.status == 401:
-                    raise ArcticSpaAuthError("Invalid API key")
-                if resp.status != 200:
-                    raise ArcticSpaApiError(f"API returned status {resp.status}")
-                return await resp.json()
-        except aiohttp.ClientError as err:
+            resp = await self._transport.request(
+                "GET",
+                f"{self._base_url}/{endpoint}",
+                cached.headers if cached else self._headers,
+                self.get_timeout,
+            )
+            if resp.status == 401:
+                raise ArcticSpaAuthError("Invalid API key")
+            if resp.status == 304 and cached:
+                self.not_modified += 1
+                data = cached.data
+            elif resp.status != 200:
+                raise ArcticSpaApiError(f"API returned status {resp.status}")
+            else:
+                decode_start = time.monotonic()
+                data = _DECODERS.get(endpoint, _loads)(resp.body)
+                self.last_decode = time.monotonic() - decode_start
+                self._cache_response(endpoint, resp.headers, data)
+        except TransportError as err:
+            self.get_stats.record_error()
             raise ArcticSpaConnectionError(f"Connection error: {err}") from err
+        except ArcticSpaApiError:
+            self.get_stats.record_error()
+            raise
+        self.get_stats.record(time.monotonic() - start)
+        return data
+
+    def _cache_response(self, endpoint: str, headers, data: dict) -> None:
+        """Remember a response's validators for the next conditional request."""
+        validators = {}
+        if etag := headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        if validators:
+            self._cache[endpoint] = _CachedResponse({**self._headers, **validators}, data)
+        else:
+            self._cache.pop(endpoint, None)
 
     async def _put(self, endpoint: str, payload: dict) -> None:
+        """Send a PUT request through the scheduler, raising on any error."""
+        try:
+            await self.scheduler.run(
+                RequestPriority.COMMAND, partial(self._send_put, endpoint, payload)
+            )
+        except ArcticSpaApiError as err:
+            if self.command_listener is not None:
+                self.command_listener(endpoint, payload, err)
+            raise
+        if self.command_listener is not None:
+            self.command_listener(endpoint, payload, None)
+
+    async def _send_put(self, endpoint: str, payload: dict) -> None:
         """Send a PUT request, raising on any error."""
-        session = await self._get_session()
+        start = time.monotonic()
         try:
-            async with session.put(
-                f"{API_BASE_URL}/{endpoint}",
-                headers=self._headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status == 401:
-                    raise ArcticSpaAuthError("Invalid API key")
-                if resp.status != 200:
-                    raise ArcticSpaApiError(f"PUT {endpoint} returned status {resp.status}")
-        except aiohttp.ClientError as err:
+            resp = await self._transport.request(
+                "PUT", f"{self._base_url}/{endpoint}", self._headers, self.put_timeout, payload
+            )
+            if resp.status == 401:
+                raise ArcticSpaAuthError("Invalid API key")
+            if resp.status != 200:
+                raise ArcticSpaApiError(f"PUT {endpoint} returned status {resp.status}")
+        except TransportError as err:
+            self.put_stats.record_error()
             raise ArcticSpaConnectionError(f"Connection error on PUT {endpoint}: {err}") from err
-
-    async def async_get_status(self) -> SpaStatus:
-        """Get current spa status."""
-        data = await self._get("status")
-        return SpaStatus.from_dict(data)
-
-    async def async_get_status_raw(self) -> dict:
+        except ArcticSpaApiError:
+            self.put_stats.record_error()
+            raise
+        self.put_stats.record(time.monotonic() - start)
+
+    async def async_get_status(self, priority: RequestPriority = RequestPriority.POLL) -> SpaStatus:
+        """Get current spa status, reusing the parsed status when unchanged."""
+        data = await self._get("status", priority)
+        cached = self._cache.get("status")
+        if cached is None or cached.data is not data:
+            return SpaStatus.from_dict(data)
+        if cached.status is None:
+            cached.status = SpaStatus.from_dict(data)
+        return cached.status
+
+    async def async_get_status_raw(self, priority: RequestPriority = RequestPriority.POLL) -> dict:
         """Get current spa status as raw dict (for coordinator)."""
-        return await self._get("status")
+        return await self._get("status", priority)
+
+    async def async_put(self, endpoint: str, payload: dict) -> None:
+        """Send a raw command, e.g. one replayed from the command journal."""
+        await self._put(endpoint, payload)
 
     # ── Lights ──
 
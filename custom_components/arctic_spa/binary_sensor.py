@@ -2,84 +2,84 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .entity import ArcticSpaEntity
-
-BINARY_SENSORS = [
-    # (key, name, device_class, icon, value_fn, entity_category)
-    (
-        "connected",
-        "Connected",
-        BinarySensorDeviceClass.CONNECTIVITY,
-        None,
-        lambda d: d.get("connected", False),
-        EntityCategory.DIAGNOSTIC,
+from .entity import ArcticSpaEntity, included
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArcticSpaBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes an Arctic Spa binary sensor; shared by the sensors of every spa."""
+
+    value_fn: Callable[[dict], bool]
+
+
+BINARY_SENSORS: tuple[ArcticSpaBinarySensorEntityDescription, ...] = (
+    ArcticSpaBinarySensorEntityDescription(
+        key="connected",
+        name="Connected",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        value_fn=lambda d: d.get("connected", False),
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    (
-        "spaboy_connected",
-        "SpaBoy Connected",
-        BinarySensorDeviceClass.CONNECTIVITY,
-        None,
-        lambda d: d.get("spaboy_connected", False),
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaBinarySensorEntityDescription(
+        key="spaboy_connected",
+        name="SpaBoy Connected",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        value_fn=lambda d: d.get("spaboy_connected", False),
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    (
-        "spaboy_producing",
-        "SpaBoy Producing",
-        None,
-        "mdi:flask",
-        lambda d: d.get("spaboy_producing", False),
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaBinarySensorEntityDescription(
+        key="spaboy_producing",
+        name="SpaBoy Producing",
+        icon="mdi:flask",
+        value_fn=lambda d: d.get("spaboy_producing", False),
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    (
-        "lights",
-        "Lights",
-        BinarySensorDeviceClass.LIGHT,
-        None,
-        lambda d: d.get("lights") == "on",
-        None,
+    ArcticSpaBinarySensorEntityDescription(
+        key="lights",
+        name="Lights",
+        device_class=BinarySensorDeviceClass.LIGHT,
+        value_fn=lambda d: d.get("lights") == "on",
     ),
-    (
-        "filter_suspension",
-        "Filter Suspension",
-        None,
-        "mdi:air-filter",
-        lambda d: d.get("filter_suspension") == "on",
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaBinarySensorEntityDescription(
+        key="filter_suspension",
+        name="Filter Suspension",
+        icon="mdi:air-filter",
+        value_fn=lambda d: d.get("filter_suspension") == "on",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    (
-        "pump1_running",
-        "Pump 1 Running",
-        BinarySensorDeviceClass.RUNNING,
-        None,
-        lambda d: d.get("pump1", "off") != "off",
-        None,
+    ArcticSpaBinarySensorEntityDescription(
+        key="pump1_running",
+        name="Pump 1 Running",
+        device_class=BinarySensorDeviceClass.RUNNING,
+        value_fn=lambda d: d.get("pump1", "off") != "off",
     ),
-    (
-        "pump2_running",
-        "Pump 2 Running",
-        BinarySensorDeviceClass.RUNNING,
-        None,
-        lambda d: d.get("pump2", "off") != "off",
-        None,
+    ArcticSpaBinarySensorEntityDescription(
+        key="pump2_running",
+        name="Pump 2 Running",
+        device_class=BinarySensorDeviceClass.RUNNING,
+        value_fn=lambda d: d.get("pump2", "off") != "off",
     ),
-    (
-        "has_errors",
-        "Has Errors",
-        BinarySensorDeviceClass.PROBLEM,
-        None,
-        lambda d: len(d.get("errors", [])) > 0,
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaBinarySensorEntityDescription(
+        key="has_errors",
+        name="Has Errors",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=lambda d: len(d.get("errors", [])) > 0,
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -91,29 +91,29 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     async_add_entities(
-        ArcticSpaBinarySensor(
-            coordinator, entry.entry_id, key, name, dev_cls, icon, value_fn, entity_cat
+        included(
+            entry,
+            (
+                ArcticSpaBinarySensor(coordinator, entry.entry_id, description)
+                for description in BINARY_SENSORS
+            ),
         )
-        for key, name, dev_cls, icon, value_fn, entity_cat in BINARY_SENSORS
     )
 
 
 class ArcticSpaBinarySensor(ArcticSpaEntity, BinarySensorEntity):
     """Representation of an Arctic Spa binary sensor."""
 
-    def __init__(  # noqa: PLR0913
-        self, coordinator, entry_id, key, name, device_class, icon, value_fn, entity_category
-    ):
+    entity_description: ArcticSpaBinarySensorEntityDescription
+
+    def __init__(self, coordinator, entry_id, description: ArcticSpaBinarySensorEntityDescription):
         """Initialize the binary sensor."""
-        super().__init__(coordinator, entry_id, key, name)
-        self._attr_device_class = device_class
-        self._attr_icon = icon
-        self._value_fn = value_fn
-        self._attr_entity_category = entity_category
+        super().__init__(coordinator, entry_id, description.key)
+        self.entity_description = description
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
         if self.coordinator.data is None:
             return None
-        return self._value_fn(self.coordinator.data)
+        return self.entity_description.value_fn(self.coordinator.data)
@@ -0,0 +1,92 @@
+"""Compressed, rotated capture of raw spa status payloads.
+
+Captures let field issues (a flapping ``connected``, odd ``filter_status``
+values) be replayed through the coordinator later, and give benchmarks real
+traffic to work with. Records are buffered in memory and written in batches;
+each batch is appended to the file as its own gzip member, which gzip readers
+decompress as one stream.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+
+class StatusCapture:
+    """Timestamped status payloads in a gzip JSON-lines file with rotation.
+
+    ``append`` and ``drain`` run in the event loop; ``write`` does file I/O and
+    belongs in an executor. Once the file reaches ``max_bytes`` it is rotated to
+    ``<name>.1``, ``<name>.2``, … and only ``backups`` old files are kept.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int, backups: int) -> None:
+        """Initialize the capture."""
+        self.path = Path(path)
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._buffer: list[tuple[float, dict]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of records waiting to be written."""
+        return len(self._buffer)
+
+    def append(self, timestamp: float, data: dict) -> None:
+        """Buffer a payload received at ``timestamp`` (seconds since the epoch)."""
+        self._buffer.append((timestamp, data))
+
+    def drain(self) -> list[tuple[float, dict]]:
+        """Return and clear the buffered records."""
+        records, self._buffer = self._buffer, []
+        return records
+
+    def write(self, records: Iterable[tuple[float, dict]]) -> None:
+        """Append records to the capture file, rotating it when full."""
+        lines = "".join(json.dumps([timestamp, data]) + "\n" for timestamp, data in records)
+        if not lines:
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as file:
+                file.write(lines)
+            if self.path.stat().st_size >= self._max_bytes:
+                self._rotate()
+
+    def _backup(self, index: int) -> Path:
+        """Return the path of the ``index``-th rotated file (0 is the live file)."""
+        return self.path.with_name(f"{self.path.name}.{index}") if index else self.path
+
+    def _rotate(self) -> None:
+        """Shift the live file and backups down by one, dropping the oldest."""
+        if not self._backups:
+            self.path.unlink()
+            return
+        for index in range(self._backups, 0, -1):
+            source = self._backup(index - 1)
+            if source.exists():
+                source.replace(self._backup(index))
+
+    def files(self) -> list[Path]:
+        """Return the existing capture files, oldest first."""
+        candidates = (self._backup(index) for index in range(self._backups, -1, -1))
+        return [path for path in candidates if path.exists()]
+
+    def remove(self) -> None:
+        """Delete the capture file and its backups."""
+        with self._lock:
+            for path in self.files():
+                path.unlink()
+
+
+def read_capture(paths: Iterable[str | Path]) -> Iterator[tuple[float, dict]]:
+    """Yield ``(timestamp, payload)`` records from capture files in order."""
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                timestamp, data = json.loads(line)
+                yield timestamp, data
@@ -0,0 +1,215 @@
+"""Command line tool for the Arctic Spa API client.
+
+Polls or load-tests the API without Home Assistant running, using the same
+client the integration uses::
+
+    python -m custom_components.arctic_spa.cli poll --api-key KEY --count 10 --interval 5
+    python -m custom_components.arctic_spa.cli load --api-key KEY --requests 200 --concurrency 8
+    python -m custom_components.arctic_spa.cli stand-in --port 8484
+
+When Home Assistant is not installed, run the file directly instead:
+``python custom_components/arctic_spa/cli.py poll ...``. API keys may also be
+given as a comma-separated ``ARCTIC_SPA_API_KEYS`` environment variable.
+``stand-in`` serves a simulated spa bridge for ``--local`` and the integration's
+local bridge option to talk to.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+if not __package__:
+    # Executed as a script: load the modules as a bare package so their relative
+    # imports work without running the integration's Home Assistant __init__
+    import types
+
+    __package__ = "arctic_spa"
+    _package = types.ModuleType(__package__)
+    _package.__path__ = [os.path.dirname(os.path.abspath(__file__))]
+    sys.modules.setdefault(__package__, _package)
+
+from .api import (  # noqa: E402
+    API_BASE_URL,
+    ArcticSpaApiError,
+    ArcticSpaClient,
+    LatencyStats,
+    RequestScheduler,
+)
+from .local import DEFAULT_LOCAL_PORT, LocalSpaServer, LocalTransport, parse_address  # noqa: E402
+from .transport import create_session  # noqa: E402
+
+
+def _label(api_key: str) -> str:
+    """Return a printable, non-secret label for an API key."""
+    return f"…{api_key[-4:]}"
+
+
+def _format_stats(stats: LatencyStats) -> str:
+    """Format latency stats as a single line in milliseconds."""
+
+    def ms(value: float | None) -> str:
+        return "-" if value is None else f"{value * 1000:.0f}ms"
+
+    return (
+        f"ok={stats.count} errors={stats.errors} p50={ms(stats.percentile(50))} "
+        f"p95={ms(stats.percentile(95))} p99={ms(stats.percentile(99))} "
+        f"max={ms(stats.percentile(100))}"
+    )
+
+
+async def _async_poll(args: argparse.Namespace, clients: dict[str, ArcticSpaClient]) -> None:
+    """Poll every spa concurrently, ``args.count`` times."""
+    record = open(args.record, "a", encoding="utf-8") if args.record else None
+    try:
+        for round_number in range(args.count):
+            if round_number:
+                await asyncio.sleep(args.interval)
+            results = await asyncio.gather(
+                *(client.async_get_status_raw() for client in clients.values()),
+                return_exceptions=True,
+            )
+            for (label, client), result in zip(clients.items(), results, strict=True):
+                if isinstance(result, ArcticSpaApiError):
+                    print(f"{label} error: {result}")
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                print(
+                    f"{label} {client.get_stats.last * 1000:.0f}ms "
+                    f"temp={result.get('temperatureF')}F connected={result.get('connected')}"
+                )
+                if record:
+                    record.write(json.dumps({"t": time.time(), "spa": label, "status": result}))
+                    record.write("\n")
+    finally:
+        if record:
+            record.close()
+
+
+async def _async_load(args: argparse.Namespace, clients: dict[str, ArcticSpaClient]) -> None:
+    """Send ``args.requests`` GETs per spa from ``args.concurrency`` workers per spa."""
+    interval = 1 / args.rate if args.rate else 0.0
+    next_slot = time.monotonic()
+
+    async def worker(client: ArcticSpaClient, remaining: list[int]) -> None:
+        nonlocal next_slot
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            if interval:
+                slot, next_slot = next_slot, max(next_slot, time.monotonic()) + interval
+                await asyncio.sleep(max(0.0, slot - time.monotonic()))
+            try:
+                await client.async_get_status_raw()
+            except ArcticSpaApiError:
+                pass  # counted in client.get_stats
+
+    workers = []
+    for client in clients.values():
+        remaining = [args.requests]
+        workers.extend(worker(client, remaining) for _ in range(args.concurrency))
+    start = time.monotonic()
+    await asyncio.gather(*workers)
+    elapsed = time.monotonic() - start
+    total = sum(client.get_stats.count + client.get_stats.errors for client in clients.values())
+    print(f"{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)")
+
+
+async def _async_stand_in(args: argparse.Namespace) -> None:
+    """Serve a simulated spa bridge until interrupted."""
+    server = LocalSpaServer(host=args.host, port=args.port)
+    await server.start()
+    print(f"Simulated spa bridge listening on {server.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(prog="arctic_spa", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--api-key",
+        action="append",
+        dest="api_keys",
+        default=[],
+        help="API key (repeat for several spas)",
+    )
+    parser.add_argument("--base-url", default=API_BASE_URL, help="API root URL")
+    parser.add_argument("--hedge", action="store_true", help="enable hedged GETs")
+    parser.add_argument("--local", metavar="HOST[:PORT]", help="talk to a local spa bridge")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    poll = commands.add_parser("poll", help="poll status and print latencies")
+    poll.add_argument("--count", type=int, default=1, help="number of polls per spa")
+    poll.add_argument("--interval", type=float, default=60, help="seconds between polls")
+    poll.add_argument("--record", help="append raw status payloads to this JSON-lines file")
+
+    load = commands.add_parser("load", help="send many GETs and report latency percentiles")
+    load.add_argument("--requests", type=int, default=100, help="requests per spa")
+    load.add_argument("--concurrency", type=int, default=4, help="concurrent requests per spa")
+    load.add_argument("--rate", type=float, default=0, help="max requests/second (0: no limit)")
+
+    stand_in = commands.add_parser("stand-in", help="serve a simulated local spa bridge")
+    stand_in.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    stand_in.add_argument("--port", type=int, default=DEFAULT_LOCAL_PORT, help="port")
+    return parser
+
+
+async def async_main(argv: list[str] | None = None) -> int:
+    """Run the command line tool."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "stand-in":
+        await _async_stand_in(args)
+        return 0
+    api_keys = args.api_keys or [
+        key for key in os.environ.get("ARCTIC_SPA_API_KEYS", "").split(",") if key
+    ]
+    if not api_keys:
+        parser.error("no API key given (use --api-key or ARCTIC_SPA_API_KEYS)")
+
+    concurrency = args.concurrency if args.command == "load" else 1
+    session = create_session(pool_size=concurrency * len(api_keys))
+    clients = {
+        _label(key): ArcticSpaClient(
+            key,
+            session=session,
+            hedge=args.hedge,
+            base_url=args.base_url,
+            transport=LocalTransport(*parse_address(args.local)) if args.local else None,
+        )
+        for key in api_keys
+    }
+    for client in clients.values():
+        # Let every worker have a request in flight and report percentiles over
+        # every request rather than the client's rolling window
+        client.scheduler = RequestScheduler(concurrency)
+        client.get_stats = LatencyStats(window=None)
+    try:
+        if args.command == "poll":
+            await _async_poll(args, clients)
+        else:
+            await _async_load(args, clients)
+    finally:
+        for client in clients.values():
+            await client.close()
+        await session.close()
+
+    for label, client in clients.items():
+        print(f"{label} GET {_format_stats(client.get_stats)}")
+    return 0 if all(client.get_stats.count for client in clients.values()) else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point."""
+    return asyncio.run(async_main(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""Spa commands and their confirmation in the status payload.
+
+Kept free of Home Assistant so the confirm loop, supersede and timeout rules
+and scene ordering can be exercised against the simulated spa.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .api import ArcticSpaApiError, ArcticSpaClient, LatencyStats, LightState, PumpState
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PendingCommand:
+    """A command that has been accepted by the API but not yet seen in /status."""
+
+    expected: dict[str, Any]
+    sent: float
+
+
+class CommandTracker:
+    """Commands accepted by the API, tracked until the spa's status reflects them.
+
+    The time from sending a command to its confirmation is recorded in
+    ``stats``; commands still unconfirmed after ``timeout`` seconds count as
+    errors and are dropped.
+    """
+
+    def __init__(self, stats: LatencyStats, timeout: float) -> None:
+        """Initialize the tracker."""
+        self.stats = stats
+        self.timeout = timeout
+        self.pending: list[PendingCommand] = []
+
+    def track(self, expected: dict[str, Any], sent: float) -> None:
+        """Track a command; it supersedes pending commands for the same status fields."""
+        self.pending = [
+            pending for pending in self.pending if not pending.expected.keys() & expected
+        ]
+        self.pending.append(PendingCommand(expected, sent))
+
+    def resolve(self, data: dict, now: float) -> list[tuple[PendingCommand, float]]:
+        """Resolve pending commands against a status payload.
+
+        Returns the commands that timed out, with the seconds since they were sent.
+        """
+        still_pending = []
+        timed_out = []
+        for command in self.pending:
+            elapsed = now - command.sent
+            if all(data.get(key) == value for key, value in command.expected.items()):
+                self.stats.record(elapsed)
+            elif elapsed > self.timeout:
+                self.stats.record_error()
+                timed_out.append((command, elapsed))
+            else:
+                still_pending.append(command)
+        self.pending = still_pending
+        return timed_out
+
+    async def async_confirm(
+        self,
+        fetch: Callable[[], Awaitable[dict]],
+        on_status: Callable[[dict], None],
+        delays: Iterable[float],
+    ) -> None:
+        """Fetch the status after each delay until no command is pending.
+
+        ``on_status`` receives every fetched status and is expected to resolve
+        it. Gives up quietly on error or once the delays are exhausted; the
+        regular poll keeps resolving whatever is still pending.
+        """
+        for delay in delays:
+            await asyncio.sleep(delay)
+            try:
+                data = await fetch()
+            except ArcticSpaApiError as err:
+                _LOGGER.debug("Confirm poll failed, waiting for the next update: %s", err)
+                return
+            on_status(data)
+            if not self.pending:
+                return
+
+
+async def async_send_scene(
+    client: ArcticSpaClient,
+    set_boost: Callable[[bool], Awaitable[None]],
+    data: dict,
+    *,
+    lights: bool | None = None,
+    pump1: PumpState | str | None = None,
+    pump2: PumpState | str | None = None,
+    setpoint: int | None = None,
+    filtration_duration: int | None = None,
+    filtration_frequency: int | None = None,
+    boost: bool | None = None,
+) -> tuple[dict[str, Any], list[Exception]]:
+    """Send several settings at once.
+
+    Independent PUTs are sent concurrently. Boost heats towards the setpoint,
+    so a setpoint change is sent first and boost only after it succeeds. A
+    filtration change fills in the setting it leaves out from ``data``, the
+    current status. Returns the status fields the successful commands should
+    change and the errors of the others.
+    """
+    steps: list[tuple[Awaitable[None], dict[str, Any]]] = []
+
+    if lights is not None:
+        state = LightState.ON if lights else LightState.OFF
+        steps.append((client.async_set_lights(state), {"lights": str(state)}))
+    for pump_id, pump_state in ((1, pump1), (2, pump2)):
+        if pump_state is not None:
+            steps.append(
+                (client.async_set_pump(pump_id, pump_state), {f"pump{pump_id}": str(pump_state)})
+            )
+    if filtration_duration is not None or filtration_frequency is not None:
+        duration = int(
+            filtration_duration
+            if filtration_duration is not None
+            else data.get("filtration_duration", 1)
+        )
+        frequency = int(
+            filtration_frequency
+            if filtration_frequency is not None
+            else data.get("filtration_frequency", 1)
+        )
+        steps.append(
+            (
+                client.async_set_filtration(duration, frequency),
+                {"filtration_duration": duration, "filtration_frequency": frequency},
+            )
+        )
+    if setpoint is not None or boost is not None:
+        steps.append(
+            (
+                _async_set_heating(client, set_boost, setpoint, boost),
+                {"setpointF": setpoint} if setpoint is not None else {},
+            )
+        )
+
+    results = await asyncio.gather(*(command for command, _ in steps), return_exceptions=True)
+
+    expected: dict[str, Any] = {}
+    errors: list[Exception] = []
+    for (_, step_expected), result in zip(steps, results, strict=True):
+        if isinstance(result, Exception):
+            errors.append(result)
+        else:
+            expected.update(step_expected)
+    return expected, errors
+
+
+async def _async_set_heating(
+    client: ArcticSpaClient,
+    set_boost: Callable[[bool], Awaitable[None]],
+    setpoint: int | None,
+    boost: bool | None,
+) -> None:
+    """Send a setpoint change followed by boost, in that order."""
+    if setpoint is not None:
+        await client.async_set_temperature(setpoint)
+    if boost is not None:
+        await set_boost(boost)
@@ -7,10 +7,38 @@ import logging
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_API_KEY
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .api import ArcticSpaAuthError, ArcticSpaClient, ArcticSpaConnectionError
-from .const import DOMAIN
+from .const import (
+    CONF_COMMAND_JOURNAL,
+    CONF_COMMAND_TIMEOUT,
+    CONF_DEDICATED_CONNECTOR,
+    CONF_ENTITY_PROFILE,
+    CONF_HEDGE_REQUESTS,
+    CONF_LOCAL_HOST,
+    CONF_ORP_DEADBAND,
+    CONF_PH_DEADBAND,
+    CONF_POLL_RETRIES,
+    CONF_RETRY_DELAY,
+    CONF_SCAN_INTERVAL,
+    CONF_STATUS_CAPTURE,
+    CONF_STATUS_TIMEOUT,
+    CONF_TELEMETRY,
+    DOMAIN,
+    ENTITY_PROFILES,
+    OPTION_DEFAULTS,
+    PROFILE_STANDARD,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +52,12 @@ class ArcticSpaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow handler."""
+        return ArcticSpaOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
@@ -42,6 +76,7 @@ class ArcticSpaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(
                     title="Arctic Spa",
                     data={CONF_API_KEY: api_key},
+                    options={CONF_ENTITY_PROFILE: PROFILE_STANDARD},
                 )
             except ArcticSpaAuthError:
                 errors["base"] = "invalid_auth"
@@ -75,7 +110,13 @@ class ArcticSpaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
                 entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
                 self.hass.config_entries.async_update_entry(entry, data={CONF_API_KEY: api_key})
-                await self.hass.config_entries.async_reload(entry.entry_id)
+                if entry.state is config_entries.ConfigEntryState.LOADED:
+                    # Swap the key on the running client so entities keep their state
+                    coordinator = entry.runtime_data
+                    coordinator.client.set_api_key(api_key)
+                    await coordinator.async_request_refresh()
+                else:
+                    await self.hass.config_entries.async_reload(entry.entry_id)
                 return self.async_abort(reason="reauth_successful")
             except ArcticSpaAuthError:
                 errors["base"] = "invalid_auth"
@@ -91,3 +132,96 @@ class ArcticSpaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders=_DESCRIPTION_PLACEHOLDERS,
         )
+
+
+def _number(minimum: float, maximum: float, step: float, unit: str | None = None):
+    """Return a number box selector."""
+    return NumberSelector(
+        NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=step,
+            unit_of_measurement=unit,
+            mode=NumberSelectorMode.BOX,
+        )
+    )
+
+
+class ArcticSpaOptionsFlow(config_entries.OptionsFlow):
+    """Handle Arctic Spa options."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = {**OPTION_DEFAULTS, **self.config_entry.options}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_ENTITY_PROFILE,
+                        default=options[CONF_ENTITY_PROFILE],
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=list(ENTITY_PROFILES),
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=CONF_ENTITY_PROFILE,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL,
+                        default=options[CONF_SCAN_INTERVAL],
+                    ): _number(10, 3600, 1, "s"),
+                    vol.Optional(
+                        CONF_STATUS_TIMEOUT,
+                        default=options[CONF_STATUS_TIMEOUT],
+                    ): _number(1, 60, 1, "s"),
+                    vol.Optional(
+                        CONF_COMMAND_TIMEOUT,
+                        default=options[CONF_COMMAND_TIMEOUT],
+                    ): _number(1, 60, 1, "s"),
+                    vol.Optional(
+                        CONF_POLL_RETRIES,
+                        default=options[CONF_POLL_RETRIES],
+                    ): _number(0, 5, 1),
+                    vol.Optional(
+                        CONF_RETRY_DELAY,
+                        default=options[CONF_RETRY_DELAY],
+                    ): _number(0.5, 30, 0.5, "s"),
+                    vol.Optional(
+                        CONF_PH_DEADBAND,
+                        default=options[CONF_PH_DEADBAND],
+                    ): _number(0, 1, 0.01, "pH"),
+                    vol.Optional(
+                        CONF_ORP_DEADBAND,
+                        default=options[CONF_ORP_DEADBAND],
+                    ): _number(0, 100, 1, "mV"),
+                    vol.Optional(
+                        CONF_COMMAND_JOURNAL,
+                        default=options[CONF_COMMAND_JOURNAL],
+                    ): bool,
+                    vol.Optional(
+                        CONF_DEDICATED_CONNECTOR,
+                        default=options[CONF_DEDICATED_CONNECTOR],
+                    ): bool,
+                    vol.Optional(
+                        CONF_HEDGE_REQUESTS,
+                        default=options[CONF_HEDGE_REQUESTS],
+                    ): bool,
+                    vol.Optional(
+                        CONF_STATUS_CAPTURE,
+                        default=options[CONF_STATUS_CAPTURE],
+                    ): bool,
+                    vol.Optional(
+                        CONF_TELEMETRY,
+                        default=options[CONF_TELEMETRY],
+                    ): bool,
+                    vol.Optional(
+                        CONF_LOCAL_HOST,
+                        description={"suggested_value": options.get(CONF_LOCAL_HOST)},
+                    ): str,
+                }
+            ),
+        )
@@ -2,3 +2,131 @@
 
 DOMAIN = "arctic_spa"
 SCAN_INTERVAL_SECONDS = 60
+
+# Request timeouts (seconds) and status poll retries; connection failures are
+# retried after the delay, doubling for every further attempt
+DEFAULT_STATUS_TIMEOUT = 15
+DEFAULT_COMMAND_TIMEOUT = 10
+DEFAULT_POLL_RETRIES = 0
+DEFAULT_RETRY_DELAY = 2
+
+# Number of recent raw status payloads kept for diagnostics
+RAW_HISTORY_SIZE = 10
+
+# Delays (seconds) between confirm polls after a command, stopping once confirmed
+CONFIRM_POLL_DELAYS = (1, 2, 4)
+
+# Commands not reflected in /status within this many seconds fire an event
+COMMAND_CONFIRM_TIMEOUT_SECONDS = 180
+EVENT_COMMAND_NOT_CONFIRMED = f"{DOMAIN}_command_not_confirmed"
+
+# Upper bounds (seconds) of the command latency histogram buckets
+ACTUATION_HISTOGRAM_BOUNDS = (1, 2, 5, 10, 30, 60, 120)
+
+# Options
+CONF_COMMAND_JOURNAL = "command_journal"
+CONF_DEDICATED_CONNECTOR = "dedicated_connector"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_STATUS_CAPTURE = "status_capture"
+CONF_TELEMETRY = "telemetry"
+CONF_ENTITY_PROFILE = "entity_profile"
+CONF_LOCAL_HOST = "local_host"
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_STATUS_TIMEOUT = "status_timeout"
+CONF_COMMAND_TIMEOUT = "command_timeout"
+CONF_POLL_RETRIES = "poll_retries"
+CONF_RETRY_DELAY = "retry_delay"
+CONF_PH_DEADBAND = "ph_deadband"
+CONF_ORP_DEADBAND = "orp_deadband"
+
+# Options applied to the running coordinator and client; changing any other
+# option reloads the entry
+LIVE_OPTIONS = frozenset(
+    {
+        CONF_SCAN_INTERVAL,
+        CONF_STATUS_TIMEOUT,
+        CONF_COMMAND_TIMEOUT,
+        CONF_POLL_RETRIES,
+        CONF_RETRY_DELAY,
+        CONF_PH_DEADBAND,
+        CONF_ORP_DEADBAND,
+        CONF_HEDGE_REQUESTS,
+    }
+)
+
+# Entity profiles and the keys of the entities each leaves out. Standard drops
+# entities that mirror a control or another sensor; minimal also drops those
+# the water heater covers.
+PROFILE_FULL = "full"
+PROFILE_STANDARD = "standard"
+PROFILE_MINIMAL = "minimal"
+_MIRRORED_ENTITY_KEYS = frozenset(
+    {
+        "lights",  # Lights switch
+        "pump1_running",  # Pump 1 Jets switch, Pump 1 State sensor
+        "pump2_running",  # Pump 2 Jets switch, Pump 2 State sensor
+        "has_errors",  # Errors sensor
+        "filtration_duration",  # Filtration Duration number
+        "filtration_frequency",  # Filtration Frequency number
+    }
+)
+ENTITY_PROFILES: dict[str, frozenset[str]] = {
+    PROFILE_FULL: frozenset(),
+    PROFILE_STANDARD: _MIRRORED_ENTITY_KEYS,
+    PROFILE_MINIMAL: _MIRRORED_ENTITY_KEYS
+    | {"temperature", "setpoint", "temperature_setpoint", "boost_switch"},
+}
+
+# Value each option takes while it is not stored, as the options form shows it
+OPTION_DEFAULTS = {
+    CONF_ENTITY_PROFILE: PROFILE_FULL,
+    CONF_SCAN_INTERVAL: SCAN_INTERVAL_SECONDS,
+    CONF_STATUS_TIMEOUT: DEFAULT_STATUS_TIMEOUT,
+    CONF_COMMAND_TIMEOUT: DEFAULT_COMMAND_TIMEOUT,
+    CONF_POLL_RETRIES: DEFAULT_POLL_RETRIES,
+    CONF_RETRY_DELAY: DEFAULT_RETRY_DELAY,
+    CONF_PH_DEADBAND: 0,
+    CONF_ORP_DEADBAND: 0,
+    CONF_COMMAND_JOURNAL: False,
+    CONF_DEDICATED_CONNECTOR: False,
+    CONF_HEDGE_REQUESTS: False,
+    CONF_STATUS_CAPTURE: False,
+    CONF_TELEMETRY: False,
+}
+
+# After the local bridge fails, requests go to the cloud for this many seconds
+# before the bridge is tried again
+LOCAL_RETRY_SECONDS = 60
+
+# Keep-alive connections per spa in the dedicated connection pool
+CONNECTIONS_PER_SPA = 2
+
+# Command journal: queued commands expire after this many seconds and are
+# replayed this many seconds apart, after a random delay of up to the jitter
+JOURNAL_TTL_SECONDS = 3600
+JOURNAL_REPLAY_INTERVAL_SECONDS = 2
+JOURNAL_REPLAY_JITTER_SECONDS = 10
+JOURNAL_STORAGE_VERSION = 1
+
+# Largest number of raw samples a telemetry query returns without downsampling
+TELEMETRY_QUERY_MAX_SAMPLES = 10_000
+
+# Hourly statistics rows passed to the recorder per import call
+STATISTICS_IMPORT_BATCH_HOURS = 720
+
+# Update cycle watchdog: warn (at most once per interval) when the event-loop
+# part of a poll exceeds the budget; loop lag is probed at this interval
+CYCLE_BUDGET_SECONDS = 0.05
+CYCLE_WARNING_INTERVAL_SECONDS = 3600
+LOOP_LAG_PROBE_SECONDS = 0.05
+
+# Pre-heat planner: heating time margin and storage of the learned model
+READY_MARGIN_SECONDS = 600
+HEATING_MODEL_STORAGE_VERSION = 1
+HEATING_MODEL_SAVE_DELAY_SECONDS = 600
+
+# Status capture: payloads are written in batches of this many records to a
+# gzip file rotated at this size, keeping this many rotated files
+CAPTURE_FLUSH_RECORDS = 10
+CAPTURE_MAX_BYTES = 5 * 1024 * 1024
+CAPTURE_BACKUPS = 2
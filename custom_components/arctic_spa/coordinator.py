@@ -2,19 +2,127 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import random
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import ArcticSpaApiError, ArcticSpaAuthError, ArcticSpaClient
-from .const import SCAN_INTERVAL_SECONDS
+from .api import (
+    ArcticSpaApiError,
+    ArcticSpaAuthError,
+    ArcticSpaClient,
+    ArcticSpaConnectionError,
+    LatencyStats,
+    PumpState,
+    RequestPriority,
+    decode_status,
+)
+from .commands import CommandTracker, async_send_scene
+from .const import (
+    CAPTURE_BACKUPS,
+    CAPTURE_FLUSH_RECORDS,
+    CAPTURE_MAX_BYTES,
+    COMMAND_CONFIRM_TIMEOUT_SECONDS,
+    CONF_COMMAND_TIMEOUT,
+    CONF_HEDGE_REQUESTS,
+    CONF_ORP_DEADBAND,
+    CONF_PH_DEADBAND,
+    CONF_POLL_RETRIES,
+    CONF_RETRY_DELAY,
+    CONF_SCAN_INTERVAL,
+    CONF_STATUS_TIMEOUT,
+    CONFIRM_POLL_DELAYS,
+    CYCLE_BUDGET_SECONDS,
+    CYCLE_WARNING_INTERVAL_SECONDS,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_POLL_RETRIES,
+    DEFAULT_RETRY_DELAY,
+    DEFAULT_STATUS_TIMEOUT,
+    DOMAIN,
+    EVENT_COMMAND_NOT_CONFIRMED,
+    HEATING_MODEL_SAVE_DELAY_SECONDS,
+    HEATING_MODEL_STORAGE_VERSION,
+    JOURNAL_REPLAY_INTERVAL_SECONDS,
+    JOURNAL_REPLAY_JITTER_SECONDS,
+    JOURNAL_STORAGE_VERSION,
+    JOURNAL_TTL_SECONDS,
+    LOOP_LAG_PROBE_SECONDS,
+    RAW_HISTORY_SIZE,
+    READY_MARGIN_SECONDS,
+    SCAN_INTERVAL_SECONDS,
+)
+from .heating import HeatingModel, ReadyPlan, plan_ready
+from .journal import CommandJournal
+from .watchdog import CycleWatchdog
+
+if TYPE_CHECKING:
+    # Optional features; imported when enabled to keep setup fast
+    from .capture import StatusCapture
+    from .local import LocalTransport
+    from .profiling import Profiler
+    from .telemetry import TelemetryStore
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+def journal_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the storage backing the command journal of a config entry."""
+    return Store(hass, JOURNAL_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.journal")
+
+
+def heating_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the storage backing the learned heating model of a config entry."""
+    return Store(hass, HEATING_MODEL_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.heating")
+
+
+def status_capture(hass: HomeAssistant, entry_id: str) -> StatusCapture:
+    """Return the raw status capture of a config entry."""
+    from .capture import StatusCapture
+
+    return StatusCapture(
+        hass.config.path(DOMAIN, f"{entry_id}.capture.jsonl.gz"),
+        CAPTURE_MAX_BYTES,
+        CAPTURE_BACKUPS,
+    )
+
+
+def telemetry_store(hass: HomeAssistant, entry_id: str) -> TelemetryStore:
+    """Return the on-disk telemetry history of a config entry."""
+    from .telemetry import TelemetryStore
+
+    return TelemetryStore(hass.config.path(DOMAIN, f"{entry_id}.telemetry.bin"))
+
+
+def _profiled(  # noqa: UP047
+    func: Callable[..., Coroutine[Any, Any, _T]],
+) -> Callable[..., Coroutine[Any, Any, _T]]:
+    """Include a coordinator coroutine in a requested profile."""
+
+    @wraps(func)
+    async def wrapper(self: ArcticSpaCoordinator, *args: Any, **kwargs: Any) -> _T:
+        with self._profile():
+            return await func(self, *args, **kwargs)
+
+    return wrapper
+
 
 class ArcticSpaCoordinator(DataUpdateCoordinator[dict]):
     """Coordinator to poll the Arctic Spa API."""
@@ -27,14 +135,596 @@ class ArcticSpaCoordinator(DataUpdateCoordinator[dict]):
             name="Arctic Spa",
             update_interval=timedelta(seconds=SCAN_INTERVAL_SECONDS),
             config_entry=entry,
+            # Unchanged payloads (e.g. a 304 from the API) skip the entity fan-out
+            always_update=False,
         )
         self.client = client
+        # Shared by every entity of the spa
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Arctic Spa",
+            manufacturer="Arctic Spas",
+            model="McKinley",
+        )
+        self.poll_stats = LatencyStats()
+        self.actuation_stats = LatencyStats()
+        self.raw_history: deque[tuple[datetime, dict]] = deque(maxlen=RAW_HISTORY_SIZE)
+        self.entity_writes: Counter[str] = Counter()
+        self.commands = CommandTracker(self.actuation_stats, COMMAND_CONFIRM_TIMEOUT_SECONDS)
+        self._confirm_task: asyncio.Task | None = None
+        # Boost state isn't exposed in the status API, track locally
+        self.boost = False
+        self._boost_listeners: list[Callable[[], None]] = []
+        self.journal: CommandJournal | None = None
+        self._journal_store: Store | None = None
+        self._replay_task: asyncio.Task | None = None
+        self.capture: StatusCapture | None = None
+        self._capture_task: asyncio.Task | None = None
+        self.telemetry: TelemetryStore | None = None
+        # Samples waiting for the telemetry writer, which appends them in order
+        self._telemetry_queue: list[tuple[float, dict]] = []
+        self._telemetry_task: asyncio.Task | None = None
+        self.local: LocalTransport | None = None
+        self.heating_model = HeatingModel()
+        self._heating_store: Store | None = None
+        self.ready_plan: ReadyPlan | None = None
+        self._cancel_ready_timer: Callable[[], None] | None = None
+        # The started plan whose boost is on until it has heated, and its end timer
+        self._boost_plan: ReadyPlan | None = None
+        self._cancel_boost_timer: Callable[[], None] | None = None
+        entry.async_on_unload(self._async_cancel_ready_plan)
+        self.watchdog = CycleWatchdog(CYCLE_BUDGET_SECONDS, LOOP_LAG_PROBE_SECONDS)
+        self._last_cycle_warning = -CYCLE_WARNING_INTERVAL_SECONDS
+        self.profiler: Profiler | None = None
+        # Minimum change of a status value before its sensor reports it, by status key
+        self.deadbands: dict[str, float] = {}
+        self.options: dict[str, Any] = {}
+        self.async_apply_options(entry.options)
+        # Filled in by async_setup_entry
+        self.platforms: list[str] = []
+        self.setup_timings: dict[str, float] = {}
+
+    @_profiled
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh and notify listeners as one timed update cycle."""
+        self.watchdog.begin()
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            self._async_end_cycle()
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply the live-tunable options to the coordinator and client.
+
+        New timeouts and retries apply from the next request and a new poll
+        interval from the next scheduled poll.
+        """
+        self.options = dict(options)
+        self.update_interval = timedelta(
+            seconds=options.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL_SECONDS)
+        )
+        client = self.client
+        client.get_timeout = options.get(CONF_STATUS_TIMEOUT, DEFAULT_STATUS_TIMEOUT)
+        client.put_timeout = options.get(CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT)
+        client.poll_retries = int(options.get(CONF_POLL_RETRIES, DEFAULT_POLL_RETRIES))
+        client.retry_delay = options.get(CONF_RETRY_DELAY, DEFAULT_RETRY_DELAY)
+        client.hedge = options.get(CONF_HEDGE_REQUESTS, False)
+        self.deadbands = {
+            "ph": options.get(CONF_PH_DEADBAND, 0),
+            "orp": options.get(CONF_ORP_DEADBAND, 0),
+        }
+
+    @callback
+    def _async_end_cycle(self) -> None:
+        """Close the watchdog cycle, warning if it blocked the loop for too long."""
+        cycle = self.watchdog.end()
+        if cycle is None:
+            return
+        now = time.monotonic()
+        if now - self._last_cycle_warning < CYCLE_WARNING_INTERVAL_SECONDS:
+            return
+        self._last_cycle_warning = now
+        _LOGGER.warning(
+            "Arctic Spa update blocked the event loop for %.0f ms (budget %.0f ms): "
+            "decode %.0f ms, processing %.0f ms, entity updates %.0f ms; "
+            "worst loop lag during the cycle %.0f ms",
+            cycle["sync"] * 1000,
+            self.watchdog.budget * 1000,
+            cycle["decode"] * 1000,
+            cycle["process"] * 1000,
+            cycle["fanout"] * 1000,
+            cycle["lag"] * 1000,
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities of new data, timing the fan-out."""
+        start = time.monotonic()
+        super().async_update_listeners()
+        self.watchdog.record("fanout", time.monotonic() - start)
 
     async def _async_update_data(self) -> dict:
         """Fetch data from the API."""
+        start = time.monotonic()
         try:
-            return await self.client.async_get_status_raw()
+            data = await self.client.async_get_status_raw()
         except ArcticSpaAuthError as err:
+            self.poll_stats.record_error()
             raise ConfigEntryAuthFailed(str(err)) from err
         except ArcticSpaApiError as err:
+            self.poll_stats.record_error()
             raise UpdateFailed(str(err)) from err
+        elapsed = time.monotonic() - start
+        self.poll_stats.record(elapsed)
+        self.watchdog.record("http", elapsed - self.client.last_decode)
+        self.watchdog.record("decode", self.client.last_decode)
+        self._async_handle_status(data)
+        return data
+
+    @callback
+    def _async_handle_status(self, data: dict) -> None:
+        """Run a new status sample, polled or pushed, through every consumer."""
+        process_start = time.monotonic()
+        now = time.time()
+        if self.telemetry is not None:
+            self._telemetry_queue.append((now, data))
+            if self._telemetry_task is None or self._telemetry_task.done():
+                self._telemetry_task = self.config_entry.async_create_background_task(
+                    self.hass, self._async_write_telemetry(), "arctic_spa telemetry"
+                )
+        if (
+            self.heating_model.observe(
+                now, data.get("temperatureF"), data.get("setpointF"), self.boost
+            )
+            and self._heating_store is not None
+        ):
+            self._heating_store.async_delay_save(
+                self.heating_model.as_dict, HEATING_MODEL_SAVE_DELAY_SECONDS
+            )
+        if self._boost_plan is not None and self._boost_plan.heated(now, data.get("temperatureF")):
+            self._async_end_plan_boost()
+        if self.capture is not None:
+            self.capture.append(now, data)
+            if len(self.capture) >= CAPTURE_FLUSH_RECORDS:
+                self._async_start_capture_writer()
+        self._async_process_status(data)
+        if (
+            self.journal
+            and data.get("connected")
+            and (self._replay_task is None or self._replay_task.done())
+        ):
+            self._replay_task = self.config_entry.async_create_background_task(
+                self.hass, self._async_replay_journal(), "arctic_spa journal replay"
+            )
+        self.watchdog.record("process", time.monotonic() - process_start)
+
+    @callback
+    def _async_process_status(self, data: dict) -> None:
+        """Record a fresh status payload and resolve pending commands against it."""
+        self.raw_history.append((dt_util.utcnow(), data))
+
+        for command, elapsed in self.commands.resolve(data, time.monotonic()):
+            _LOGGER.warning(
+                "Command %s not confirmed by the spa after %.0f seconds",
+                command.expected,
+                elapsed,
+            )
+            self.hass.bus.async_fire(
+                EVENT_COMMAND_NOT_CONFIRMED,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "expected": command.expected,
+                    "elapsed": round(elapsed, 1),
+                },
+            )
+
+    @_profiled
+    async def async_send_command(
+        self, command: Awaitable[None], expected: dict[str, Any] | None = None
+    ) -> None:
+        """Await a client command and track it until /status reflects ``expected``."""
+        sent = time.monotonic()
+        await command
+        if expected:
+            self._async_track_command(expected, sent)
+
+    @_profiled
+    async def async_set_boost(self, on: bool) -> None:
+        """Set boost mode, remember the state locally and notify boost listeners.
+
+        Only the entities showing boost are written, not every coordinator listener.
+        """
+        await self.client.async_set_boost(on)
+        self.boost = on
+        for listener in list(self._boost_listeners):
+            listener()
+
+    @callback
+    def async_add_boost_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call ``listener`` whenever boost is set; return a function that removes it."""
+        self._boost_listeners.append(listener)
+
+        @callback
+        def remove() -> None:
+            self._boost_listeners.remove(listener)
+
+        return remove
+
+    @_profiled
+    async def async_apply_scene(
+        self,
+        *,
+        lights: bool | None = None,
+        pump1: PumpState | str | None = None,
+        pump2: PumpState | str | None = None,
+        setpoint: int | None = None,
+        filtration_duration: int | None = None,
+        filtration_frequency: int | None = None,
+        boost: bool | None = None,
+    ) -> None:
+        """Apply several settings at once with a single confirm-poll loop.
+
+        See async_send_scene for the order the commands are sent in. Raises the
+        first error once every other command has completed.
+        """
+        sent = time.monotonic()
+        expected, errors = await async_send_scene(
+            self.client,
+            self.async_set_boost,
+            self.data or {},
+            lights=lights,
+            pump1=pump1,
+            pump2=pump2,
+            setpoint=setpoint,
+            filtration_duration=filtration_duration,
+            filtration_frequency=filtration_frequency,
+            boost=boost,
+        )
+        if expected:
+            self._async_track_command(expected, sent)
+        if errors:
+            raise errors[0]
+
+    @callback
+    def _async_track_command(self, expected: dict[str, Any], sent: float) -> None:
+        """Track a command and (re)start the confirm-poll loop.
+
+        A newer command for the same status fields supersedes an older pending one.
+        Each tracked command restarts a short confirm-poll loop instead of relying
+        on a single refresh that may race the spa applying the change.
+        """
+        self.commands.track(expected, sent)
+        if self._confirm_task is not None and not self._confirm_task.done():
+            self._confirm_task.cancel()
+        self._confirm_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self.commands.async_confirm(
+                partial(self.client.async_get_status_raw, RequestPriority.CONFIRM),
+                self._async_confirmed_status,
+                CONFIRM_POLL_DELAYS,
+            ),
+            "arctic_spa confirm poll",
+        )
+
+    @callback
+    def async_handle_push(self, body: bytes) -> None:
+        """Update from a status body pushed by the local bridge.
+
+        Unlike async_set_updated_data this leaves the poll schedule alone, so
+        frequent pushes do not hold off the regular polls.
+        """
+        try:
+            data = decode_status(body)
+        except ArcticSpaApiError as err:
+            _LOGGER.debug("Ignoring malformed status push: %s", err)
+            return
+        self._async_handle_status(data)
+        if data == self.data:
+            return
+        self.data = data
+        self.async_update_listeners()
+
+    @callback
+    def _async_confirmed_status(self, data: dict) -> None:
+        """Update from a status fetched to confirm pending commands."""
+        self._async_process_status(data)
+        self.async_set_updated_data(data)
+
+    async def async_enable_journal(self) -> None:
+        """Load the persisted command journal and start journaling failed commands."""
+        self._journal_store = journal_store(self.hass, self.config_entry.entry_id)
+        self.journal = CommandJournal(JOURNAL_TTL_SECONDS, await self._journal_store.async_load())
+        self.client.command_listener = self._async_command_result
+
+    @callback
+    def _async_command_result(self, endpoint: str, payload: dict, err: Exception | None) -> None:
+        """Queue commands that failed to reach the cloud; forget superseded ones."""
+        if err is None:
+            changed = self.journal.discard(endpoint)
+        elif isinstance(err, ArcticSpaConnectionError):
+            changed = self.journal.record(endpoint, payload, time.time())
+            if changed:
+                _LOGGER.warning("Arctic Spa unreachable, queued %s command for replay", endpoint)
+        else:
+            return
+        if changed:
+            self._async_save_journal()
+
+    @callback
+    def _async_save_journal(self) -> None:
+        """Schedule a save of the command journal."""
+        self._journal_store.async_delay_save(self.journal.as_list, 1)
+
+    async def _async_replay_journal(self) -> None:
+        """Replay queued commands in order, spaced out, until done or unreachable again.
+
+        A random initial delay keeps many spas recovering from the same outage
+        from replaying at once.
+        """
+        await asyncio.sleep(random.uniform(0, JOURNAL_REPLAY_JITTER_SECONDS))
+        replayed = 0
+        for entry in self.journal.pending(time.time()):
+            if self.journal.get(entry.endpoint) is not entry:
+                continue  # superseded while we were replaying
+            if replayed:
+                await asyncio.sleep(JOURNAL_REPLAY_INTERVAL_SECONDS)
+            try:
+                if entry.endpoint == "boost":
+                    # Boost is only tracked locally, so update it and its entities too
+                    await self.async_set_boost(entry.payload.get("state") == "on")
+                else:
+                    await self.client.async_put(entry.endpoint, entry.payload)
+            except ArcticSpaConnectionError as err:
+                _LOGGER.debug("Journal replay interrupted: %s", err)
+                break
+            except ArcticSpaApiError as err:
+                _LOGGER.warning("Dropping queued %s command: %s", entry.endpoint, err)
+                self.journal.discard(entry.endpoint)
+            else:
+                replayed += 1
+        self._async_save_journal()
+        if replayed:
+            _LOGGER.info("Replayed %s queued Arctic Spa command(s)", replayed)
+            await self.async_request_refresh()
+
+    @callback
+    def async_enable_telemetry(self) -> None:
+        """Start appending every polled status to the on-disk telemetry history."""
+        self.telemetry = telemetry_store(self.hass, self.config_entry.entry_id)
+
+    async def _async_write_telemetry(self) -> None:
+        """Append queued samples to the telemetry history until the queue is empty.
+
+        Only this task writes, one executor job at a time, so samples reach
+        the file in the order they were taken.
+        """
+        while self._telemetry_queue:
+            samples, self._telemetry_queue = self._telemetry_queue, []
+            try:
+                await self.hass.async_add_executor_job(self.telemetry.extend, samples)
+            except OSError as err:
+                _LOGGER.warning("Failed to write %s telemetry sample(s): %s", len(samples), err)
+
+    @callback
+    def async_enable_capture(self) -> None:
+        """Start capturing every polled status payload to disk."""
+        self.capture = status_capture(self.hass, self.config_entry.entry_id)
+
+        async def _async_flush_on_stop(_event: Event) -> None:
+            await self.async_flush_capture()
+
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_flush_on_stop)
+        )
+
+    async def async_flush_capture(self) -> None:
+        """Write buffered status payloads to the capture file and wait until written."""
+        if self.capture is not None:
+            await self._async_start_capture_writer()
+
+    @callback
+    def _async_start_capture_writer(self) -> asyncio.Task:
+        """Return the capture writer task, starting it unless it is running."""
+        if self._capture_task is None or self._capture_task.done():
+            self._capture_task = self.config_entry.async_create_background_task(
+                self.hass, self._async_write_capture(), "arctic_spa capture flush"
+            )
+        return self._capture_task
+
+    async def _async_write_capture(self) -> None:
+        """Drain the capture buffer to disk, batch after batch, until it is empty.
+
+        Batches buffered while a write is running are picked up by the same
+        loop instead of a second writer, keeping the gzip stream in order.
+        """
+        while records := self.capture.drain():
+            await self.hass.async_add_executor_job(self.capture.write, records)
+
+    async def async_replay(self, records: Iterable[tuple[float, dict]], speed: float = 0) -> int:
+        """Feed captured status payloads through the coordinator and its entities.
+
+        ``speed`` scales the captured spacing between payloads (10 replays ten
+        times faster than real time); 0 replays as fast as the event loop allows.
+        Historical payloads only reach the entities: they are not resolved
+        against pending commands or added to the raw history. Returns the
+        number of payloads replayed.
+        """
+        replayed = 0
+        previous: float | None = None
+        for timestamp, data in records:
+            if speed and previous is not None:
+                await asyncio.sleep(max(0.0, timestamp - previous) / speed)
+            else:
+                await asyncio.sleep(0)
+            previous = timestamp
+            self.async_set_updated_data(data)
+            replayed += 1
+        return replayed
+
+    @callback
+    def async_start_profile(self, runs: int) -> None:
+        """Profile the next ``runs`` refreshes and commands."""
+        from .profiling import Profiler
+
+        self.profiler = Profiler(runs)
+
+    @contextmanager
+    def _profile(self) -> Iterator[None]:
+        """Add the enclosed refresh or command to the requested profile, if any."""
+        profiler = self.profiler
+        if profiler is None:
+            yield
+            return
+        try:
+            with profiler.run():
+                yield
+        finally:
+            # Also runs when the operation raised, so a final failing run still
+            # writes the profile
+            if self.profiler is profiler and profiler.error is not None:
+                self.profiler = None
+                _LOGGER.warning("Arctic Spa profile cancelled: %s", profiler.error)
+            elif self.profiler is profiler and profiler.finished:
+                self.profiler = None
+                self.config_entry.async_create_background_task(
+                    self.hass, self._async_write_profile(profiler), "arctic_spa profile"
+                )
+
+    async def _async_write_profile(self, profiler: Profiler) -> None:
+        """Save a finished profile to the config directory and announce it."""
+        from homeassistant.components import persistent_notification
+
+        stamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+        base = self.hass.config.path(DOMAIN, f"profile_{self.config_entry.entry_id}_{stamp}")
+        prof, summary = await self.hass.async_add_executor_job(profiler.write, base)
+        _LOGGER.info("Arctic Spa profile written to %s (summary in %s)", prof, summary)
+        persistent_notification.async_create(
+            self.hass,
+            f"Profile of {self.config_entry.title} written to `{prof}`; "
+            f"the text summary is in `{summary}`.",
+            title="Arctic Spa profile ready",
+            notification_id=f"{DOMAIN}_profile_{self.config_entry.entry_id}",
+        )
+
+    async def async_load_heating_model(self) -> None:
+        """Load the learned heating model and keep saving it as it learns."""
+        self._heating_store = heating_store(self.hass, self.config_entry.entry_id)
+        self.heating_model = HeatingModel(await self._heating_store.async_load())
+
+    @callback
+    def async_schedule_ready(
+        self, ready_by: float, target: int, boost: bool | None = None
+    ) -> ReadyPlan:
+        """Plan to have the spa at ``target`` by ``ready_by``.
+
+        The plan replaces any earlier one and starts right away if heating must
+        start now, otherwise from a timer at its start time.
+        """
+        data = self.data or {}
+        temperature = data.get("temperatureF")
+        setpoint = data.get("setpointF")
+        if temperature is None or setpoint is None:
+            raise HomeAssistantError("The spa has not reported its temperature yet")
+        # A replaced plan's boost stays on; the new plan takes over turning it off
+        boost_owned = self._boost_plan is not None
+        self._async_cancel_ready_plan()
+        self.ready_plan = plan_ready(
+            self.heating_model,
+            time.time(),
+            ready_by,
+            temperature,
+            setpoint,
+            target,
+            boost,
+            READY_MARGIN_SECONDS,
+        )
+        plan = self.ready_plan
+        _LOGGER.debug("Planned pre-heat: %s", plan)
+        if plan.start <= time.time():
+            self._async_start_ready_plan(plan, boost_owned)
+        else:
+
+            @callback
+            def _async_start(_now: datetime) -> None:
+                self._async_start_ready_plan(plan, boost_owned)
+
+            self._cancel_ready_timer = async_track_point_in_utc_time(
+                self.hass, _async_start, dt_util.utc_from_timestamp(plan.start)
+            )
+        return plan
+
+    @callback
+    def _async_cancel_ready_plan(self) -> None:
+        """Drop the pending pre-heat plan and its start timer, if any.
+
+        A started plan's boost end timer is cancelled too.
+        """
+        self.ready_plan = None
+        if self._cancel_ready_timer is not None:
+            self._cancel_ready_timer()
+            self._cancel_ready_timer = None
+        self._async_drop_plan_boost()
+
+    @callback
+    def _async_start_ready_plan(self, plan: ReadyPlan, boost_owned: bool) -> None:
+        """Start heating for a pre-heat plan."""
+        self.ready_plan = None
+        self._cancel_ready_timer = None
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_run_ready_plan(plan, boost_owned), "arctic_spa pre-heat"
+        )
+
+    async def _async_run_ready_plan(self, plan: ReadyPlan, boost_owned: bool) -> None:
+        """Raise the setpoint and enable boost as planned.
+
+        Boost turned on by the plan, or by a plan it replaced (``boost_owned``),
+        is turned off again once the spa has heated: at the target temperature
+        or at the plan's expected ready time. Boost the user turned on is left
+        alone.
+        """
+        _LOGGER.info("Starting pre-heat to %s°F, boost %s", plan.target, plan.boost)
+        if boost_owned and not plan.boost:
+            self._async_end_plan_boost()
+        enables_boost = plan.boost and (boost_owned or not self.boost)
+        try:
+            await self.async_apply_scene(setpoint=plan.target, boost=True if plan.boost else None)
+        except ArcticSpaApiError as err:
+            _LOGGER.warning("Failed to start pre-heat: %s", err)
+        if not enables_boost or not self.boost:
+            return
+        self._async_drop_plan_boost()
+        self._boost_plan = plan
+
+        @callback
+        def _async_end(_now: datetime) -> None:
+            self._cancel_boost_timer = None
+            self._async_end_plan_boost()
+
+        self._cancel_boost_timer = async_track_point_in_utc_time(
+            self.hass, _async_end, dt_util.utc_from_timestamp(plan.expected_ready)
+        )
+
+    @callback
+    def _async_drop_plan_boost(self) -> None:
+        """Stop tracking a started plan's boost and cancel its end timer."""
+        self._boost_plan = None
+        if self._cancel_boost_timer is not None:
+            self._cancel_boost_timer()
+            self._cancel_boost_timer = None
+
+    @callback
+    def _async_end_plan_boost(self) -> None:
+        """Turn off the boost a pre-heat plan turned on."""
+        self._async_drop_plan_boost()
+        if self.boost:
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_stop_boost(), "arctic_spa pre-heat boost"
+            )
+
+    async def _async_stop_boost(self) -> None:
+        """Turn boost off, logging rather than raising on failure."""
+        try:
+            await self.async_set_boost(False)
+        except ArcticSpaApiError as err:
+            _LOGGER.warning("Failed to turn off pre-heat boost: %s", err)
@@ -0,0 +1,63 @@
+"""Diagnostics support for Arctic Spa."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY
+from homeassistant.core import HomeAssistant
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    client = coordinator.client
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception)
+            if coordinator.last_exception
+            else None,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "poll": coordinator.poll_stats.as_dict(),
+            "actuation": coordinator.actuation_stats.as_dict(),
+            "watchdog": coordinator.watchdog.as_dict(),
+            "setup_timings": coordinator.setup_timings,
+            "platforms": [str(platform) for platform in coordinator.platforms],
+            "heating_model": coordinator.heating_model.as_dict(),
+            "ready_plan": asdict(coordinator.ready_plan) if coordinator.ready_plan else None,
+            "pending_commands": [
+                {"expected": command.expected, "sent": command.sent}
+                for command in coordinator.commands.pending
+            ],
+        },
+        "local": {
+            "host": coordinator.local.host,
+            "port": coordinator.local.port,
+            "connected": coordinator.local.connected,
+            "pushes": coordinator.local.pushes,
+        }
+        if coordinator.local
+        else None,
+        "client": {
+            "get": client.get_stats.as_dict(),
+            "put": client.put_stats.as_dict(),
+            "preempted_polls": client.scheduler.preempted,
+            "hedged_requests": client.hedged,
+            "not_modified": client.not_modified,
+        },
+        "entity_writes": dict(coordinator.entity_writes),
+        "recent_status": [
+            {"received": received.isoformat(), "data": async_redact_data(data, TO_REDACT)}
+            for received, data in coordinator.raw_history
+        ],
+    }
@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_ENTITY_PROFILE, ENTITY_PROFILES, PROFILE_FULL
 from .coordinator import ArcticSpaCoordinator
 
 
+def excluded_keys(options: Mapping[str, Any]) -> frozenset[str]:
+    """Return the keys of the entities a config entry's entity profile leaves out.
+
+    Entries created before profiles existed keep every entity.
+    """
+    return ENTITY_PROFILES.get(options.get(CONF_ENTITY_PROFILE), ENTITY_PROFILES[PROFILE_FULL])
+
+
+def included(entry: ConfigEntry, entities: Iterable[ArcticSpaEntity]) -> list[ArcticSpaEntity]:
+    """Return the entities a config entry's options include."""
+    excluded = excluded_keys(entry.options)
+    return [entity for entity in entities if entity._key not in excluded]
+
+
 class ArcticSpaEntity(CoordinatorEntity[ArcticSpaCoordinator]):
-    """Base class for Arctic Spa entities."""
+    """Base class for Arctic Spa entities.
+
+    Anything that is the same for every spa lives on the class or in a shared
+    entity description rather than on each instance.
+    """
 
     _attr_has_entity_name = True
 
@@ -19,20 +43,22 @@ class ArcticSpaEntity(CoordinatorEntity[ArcticSpaCoordinator]):
         coordinator: ArcticSpaCoordinator,
         entry_id: str,
         key: str,
-        name: str,
+        name: str | None | UndefinedType = UNDEFINED,
     ) -> None:
-        """Initialize the entity."""
+        """Initialize the entity; without ``name`` it comes from the entity description."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry_id}_{key}"
-        self._attr_name = name
-        self._entry_id = entry_id
+        if name is not UNDEFINED:
+            self._attr_name = name
+        self._key = key
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine, counting writes for diagnostics."""
+        self.coordinator.entity_writes[self._key] += 1
+        super().async_write_ha_state()
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info to link this entity to the spa device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry_id)},
-            name="Arctic Spa",
-            manufacturer="Arctic Spas",
-            model="McKinley",
-        )
+        return self.coordinator.device_info
@@ -0,0 +1,146 @@
+"""Heating model learned from status samples, and a pre-heat planner.
+
+The model keeps exponentially decayed sums of temperature change and time for
+three modes: heating, heating with boost, and idle (cooling). Each rate is the
+decayed degrees per hour, blended with a prior so a new spa starts with
+sensible numbers. Summing over many one-minute samples copes with the API
+reporting whole degrees.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+HEAT = "heat"
+BOOST = "boost"
+IDLE = "idle"
+
+# Prior rates (°F per hour) and how many hours of data they are worth
+PRIOR_RATES = {HEAT: 4.0, BOOST: 6.0, IDLE: -1.0}
+PRIOR_HOURS = 2.0
+
+# Older data halves in weight every this many hours of samples in a mode
+HALF_LIFE_HOURS = 48.0
+
+# Samples further apart than this (s) are not used (missed polls, restarts)
+MAX_SAMPLE_GAP = 900
+
+# The heater is taken to be calling for heat when the setpoint is this far above
+# the water temperature
+HEAT_DEADBAND = 1.0
+
+
+class HeatingModel:
+    """Incrementally learned heating and cooling rates of one spa."""
+
+    def __init__(self, data: dict | None = None) -> None:
+        """Initialize the model, optionally from ``as_dict`` output."""
+        self._sums: dict[str, list[float]] = {mode: [0.0, 0.0] for mode in PRIOR_RATES}
+        for mode, sums in (data or {}).get("sums", {}).items():
+            if mode in self._sums:
+                self._sums[mode] = [float(sums[0]), float(sums[1])]
+        self._previous: tuple[float, float, float, bool] | None = None
+
+    def observe(self, timestamp: float, temperature, setpoint, boost: bool) -> bool:
+        """Learn from a sample; return True if the model changed."""
+        if not isinstance(temperature, int | float) or not isinstance(setpoint, int | float):
+            self._previous = None
+            return False
+        previous, self._previous = self._previous, (timestamp, temperature, setpoint, boost)
+        if previous is None:
+            return False
+        last_time, last_temperature, last_setpoint, last_boost = previous
+        seconds = timestamp - last_time
+        if not 0 < seconds <= MAX_SAMPLE_GAP:
+            return False
+        if last_setpoint - last_temperature >= HEAT_DEADBAND:
+            mode = BOOST if last_boost else HEAT
+        elif last_setpoint < last_temperature:
+            mode = IDLE
+        else:
+            return False  # holding temperature; tells us nothing
+        hours = seconds / 3600
+        decay = 0.5 ** (hours / HALF_LIFE_HOURS)
+        sums = self._sums[mode]
+        sums[0] = sums[0] * decay + (temperature - last_temperature)
+        sums[1] = sums[1] * decay + hours
+        return True
+
+    def rate(self, mode: str) -> float:
+        """Return the expected temperature change in °F per hour for a mode."""
+        degrees, hours = self._sums[mode]
+        return (degrees + PRIOR_RATES[mode] * PRIOR_HOURS) / (hours + PRIOR_HOURS)
+
+    def as_dict(self) -> dict:
+        """Return the model as a JSON-serializable dict."""
+        return {
+            "sums": {mode: list(sums) for mode, sums in self._sums.items()},
+            "rates": {mode: round(self.rate(mode), 2) for mode in PRIOR_RATES},
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ReadyPlan:
+    """When to start heating so the spa reaches ``target`` by ``ready_by``."""
+
+    start: float
+    ready_by: float
+    target: int
+    boost: bool
+    expected_ready: float
+
+    def heated(self, now: float, temperature: float | None) -> bool:
+        """Return True once the target is reached or the spa should be ready by now."""
+        return now >= self.expected_ready or (
+            temperature is not None and temperature >= self.target
+        )
+
+
+def plan_ready(
+    model: HeatingModel,
+    now: float,
+    ready_by: float,
+    temperature: float,
+    setpoint: float,
+    target: int,
+    boost: bool | None = None,
+    margin: float = 0.0,
+) -> ReadyPlan:
+    """Return the latest start that reaches ``target`` by ``ready_by``.
+
+    Until the start the water cools at the idle rate, but not below the
+    current setpoint, which the heater keeps holding. ``margin`` seconds are
+    added to the heating time. With ``boost`` None, boost is used only when
+    heating normally cannot make it in time; if even that is too slow, the plan
+    starts now and ``expected_ready`` says when the spa will be ready.
+    """
+    idle_rate = min(model.rate(IDLE), 0.0)
+    floor = min(temperature, setpoint)
+
+    def heating_seconds(delay: float, mode: str) -> float:
+        """Time to heat if heating starts ``delay`` seconds from now."""
+        start_temperature = max(temperature + idle_rate * delay / 3600, floor)
+        needed = max(0.0, target - start_temperature)
+        return needed / max(model.rate(mode), 0.1) * 3600 + (margin if needed else 0.0)
+
+    def latest_start(mode: str) -> float | None:
+        """Latest delay that still makes it, or None if starting now is too late."""
+        window = ready_by - now
+        if window < 0 or heating_seconds(0.0, mode) > window:
+            return None
+        low, high = 0.0, window
+        for _ in range(40):
+            middle = (low + high) / 2
+            if middle + heating_seconds(middle, mode) <= window:
+                low = middle
+            else:
+                high = middle
+        return low
+
+    modes = [BOOST] if boost else [HEAT] if boost is False else [HEAT, BOOST]
+    for mode in modes:
+        delay = latest_start(mode)
+        if delay is not None:
+            return ReadyPlan(now + delay, ready_by, target, mode == BOOST, ready_by)
+    mode = modes[-1]
+    return ReadyPlan(now, ready_by, target, mode == BOOST, now + heating_seconds(0.0, mode))
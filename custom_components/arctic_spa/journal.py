@@ -0,0 +1,64 @@
+"""Offline command journal for Arctic Spa."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    """A command that could not be delivered."""
+
+    endpoint: str
+    payload: dict
+    queued_at: float
+    seq: int
+
+
+class CommandJournal:
+    """Undelivered commands, collapsed per endpoint so the last value wins."""
+
+    def __init__(self, ttl: float, entries: list[dict] | None = None) -> None:
+        """Initialize the journal, optionally from previously saved entries."""
+        self._ttl = ttl
+        self._entries: dict[str, JournalEntry] = {}
+        for raw in entries or []:
+            entry = JournalEntry(**raw)
+            self._entries[entry.endpoint] = entry
+        self._seq = max((entry.seq for entry in self._entries.values()), default=0)
+
+    def __len__(self) -> int:
+        """Return the number of queued commands."""
+        return len(self._entries)
+
+    def get(self, endpoint: str) -> JournalEntry | None:
+        """Return the queued command for an endpoint, if any."""
+        return self._entries.get(endpoint)
+
+    def record(self, endpoint: str, payload: dict, now: float) -> bool:
+        """Queue a command, replacing any older command for the same endpoint.
+
+        Re-recording an identical command keeps its original age so a failed
+        replay does not extend its lifetime. Returns True if the journal changed.
+        """
+        existing = self._entries.get(endpoint)
+        if existing is not None and existing.payload == payload:
+            return False
+        self._seq += 1
+        self._entries[endpoint] = JournalEntry(endpoint, payload, now, self._seq)
+        return True
+
+    def discard(self, endpoint: str) -> bool:
+        """Drop the queued command for an endpoint. Returns True if one was queued."""
+        return self._entries.pop(endpoint, None) is not None
+
+    def pending(self, now: float) -> list[JournalEntry]:
+        """Drop expired commands and return the rest in the order they were queued."""
+        for endpoint, entry in list(self._entries.items()):
+            if now - entry.queued_at > self._ttl:
+                del self._entries[endpoint]
+        return sorted(self._entries.values(), key=lambda entry: entry.seq)
+
+    def as_list(self) -> list[dict]:
+        """Return the journal in a JSON-serialisable form."""
+        return [asdict(entry) for entry in sorted(self._entries.values(), key=lambda e: e.seq)]
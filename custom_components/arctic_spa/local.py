@@ -0,0 +1,272 @@
+"""Local network transport to a spa bridge, with state pushes.
+
+The bridge sits on the spa's LAN and speaks JSON lines over TCP. Every message
+is a header line followed by a body line (empty when there is no body), so
+status bodies reach the client's decoder as raw bytes, exactly as the cloud
+API's would. Requests mirror the cloud API's endpoints::
+
+    → {"id": 1, "method": "GET", "path": "status"}
+    →
+    ← {"id": 1, "status": 200}
+    ← {"connected": true, "temperatureF": 101, ...}
+
+    → {"id": 2, "method": "PUT", "path": "lights"}
+    → {"state": "on"}
+    ← {"id": 2, "status": 200}
+    ←
+
+Whenever the spa state changes the bridge pushes it to every client::
+
+    ← {"push": "status"}
+    ← {"connected": true, "temperatureF": 101, ...}
+
+LocalSpaServer is a software stand-in for the bridge backed by a FakeSpa, for
+developing and testing without a spa.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Callable, Mapping
+
+from .transport import FakeSpa, Transport, TransportError, TransportResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LOCAL_PORT = 8484
+
+_CONNECT_TIMEOUT = 3
+# Backoff between attempts to reopen the push connection, doubling up to the maximum
+_RECONNECT_DELAY = 1.0
+_RECONNECT_MAX_DELAY = 60.0
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """Split ``host`` or ``host:port`` into host and port."""
+    host, _, port = address.strip().rpartition(":")
+    if not host or not port.isdigit():
+        return address.strip(), DEFAULT_LOCAL_PORT
+    return host, int(port)
+
+
+def _encode(header: dict, body: bytes = b"") -> bytes:
+    """Frame a message as a header line and a body line."""
+    return json.dumps(header).encode() + b"\n" + body + b"\n"
+
+
+class LocalTransport(Transport):
+    """Transport to a spa bridge on the local network.
+
+    The connection is opened by the first request and kept open to receive
+    pushes, which are passed to ``push_listener`` as raw status bodies. If the
+    connection drops, the next request reconnects. While a push listener is
+    set, a background task also reconnects on its own, with backoff, so pushes
+    resume without waiting for a request.
+    """
+
+    def __init__(self, host: str, port: int = DEFAULT_LOCAL_PORT) -> None:
+        """Initialize the transport."""
+        self.host = host
+        self.port = port
+        self._push_listener: Callable[[bytes], None] | None = None
+        self.pushes = 0
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future[TransportResponse]] = {}
+        self._next_id = 0
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the connection to the bridge is open."""
+        return self._writer is not None
+
+    @property
+    def push_listener(self) -> Callable[[bytes], None] | None:
+        """Return the function receiving pushed status bodies."""
+        return self._push_listener
+
+    @push_listener.setter
+    def push_listener(self, listener: Callable[[bytes], None] | None) -> None:
+        """Set the push receiver; keep the connection open while there is one."""
+        self._push_listener = listener
+        if listener is None:
+            if self._reconnect_task is not None:
+                self._reconnect_task.cancel()
+                self._reconnect_task = None
+        elif self._reconnect_task is None:
+            self._reconnect_task = asyncio.create_task(self._keep_connected())
+
+    async def _keep_connected(self) -> None:
+        """Open the connection, and reopen it whenever it drops, until cancelled."""
+        delay = _RECONNECT_DELAY
+        while True:
+            try:
+                await self._connect()
+            except TransportError as err:
+                _LOGGER.debug("%s; retrying in %.0f s", err, delay)
+                await asyncio.sleep(delay)
+                delay = min(2 * delay, _RECONNECT_MAX_DELAY)
+                continue
+            delay = _RECONNECT_DELAY
+            if (reader_task := self._reader_task) is not None:
+                await asyncio.wait((reader_task,))
+            await asyncio.sleep(delay)
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        """Return the open connection, opening it if needed."""
+        async with self._connect_lock:
+            if self._writer is None:
+                try:
+                    reader, writer = await asyncio.wait_for(
+                        asyncio.open_connection(self.host, self.port), _CONNECT_TIMEOUT
+                    )
+                except (OSError, TimeoutError) as err:
+                    raise TransportError(
+                        f"Cannot reach spa bridge at {self.host}:{self.port}: {err}"
+                    ) from err
+                self._writer = writer
+                self._reader_task = asyncio.create_task(self._read(reader, writer))
+                _LOGGER.debug("Connected to spa bridge at %s:%s", self.host, self.port)
+            return self._writer
+
+    async def _read(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Dispatch responses and pushes until the connection closes."""
+        try:
+            while header_line := await reader.readline():
+                body = (await reader.readline()).rstrip(b"\n")
+                header = json.loads(header_line)
+                if "id" in header:
+                    status = header["status"]
+                    future = self._pending.pop(header["id"], None)
+                    if future is not None and not future.done():
+                        future.set_result(TransportResponse(status, {}, body))
+                elif header.get("push") == "status":
+                    self.pushes += 1
+                    if self._push_listener is not None:
+                        self._push_listener(body)
+        except (OSError, ValueError, KeyError) as err:
+            _LOGGER.debug("Spa bridge connection failed: %s", err)
+        finally:
+            if self._writer is writer:
+                self._disconnect()
+
+    def _disconnect(self) -> None:
+        """Drop the connection and fail the requests waiting on it."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(TransportError("Spa bridge closed the connection"))
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        json_payload: dict | None = None,
+    ) -> TransportResponse:
+        """Send a request to the bridge and wait for its response."""
+        writer = await self._connect()
+        self._next_id += 1
+        request_id = self._next_id
+        future = self._pending[request_id] = asyncio.get_running_loop().create_future()
+        header = {"id": request_id, "method": method, "path": url.split("/spa/", 1)[-1]}
+        body = json.dumps(json_payload).encode() if json_payload is not None else b""
+        try:
+            writer.write(_encode(header, body))
+            await writer.drain()
+            return await asyncio.wait_for(future, timeout)
+        except (OSError, TimeoutError) as err:
+            self._disconnect()
+            raise TransportError(str(err) or type(err).__name__) from err
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self) -> None:
+        """Stop reconnecting and close the connection."""
+        for task in (self._reconnect_task, self._reader_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._reconnect_task = None
+        self._reader_task = None
+        self._disconnect()
+
+
+class LocalSpaServer:
+    """Software stand-in for a spa bridge, backed by a FakeSpa.
+
+    Commands are applied to the spa and every change, including readings
+    changed through ``update``, is pushed to all connected clients.
+    """
+
+    def __init__(self, spa: FakeSpa | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Initialize the server; port 0 picks a free port on start."""
+        self.spa = spa or FakeSpa()
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+        self._clients: set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Disconnect every client and stop listening."""
+        for writer in self._clients:
+            writer.close()
+        self._clients.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def update(self, **changes) -> None:
+        """Change readings, as the spa itself would, and push the new state."""
+        self.spa.update(**changes)
+        self._push()
+
+    def _status(self) -> bytes:
+        return json.dumps(self.spa.state).encode()
+
+    def _push(self) -> None:
+        """Send the current state to every client."""
+        message = _encode({"push": "status"}, self._status())
+        for writer in self._clients:
+            writer.write(message)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection."""
+        self._clients.add(writer)
+        try:
+            while header_line := await reader.readline():
+                body = (await reader.readline()).rstrip(b"\n")
+                header = json.loads(header_line)
+                response = {"id": header["id"], "status": 200}
+                if header["method"] == "GET":
+                    if header["path"] == "status":
+                        writer.write(_encode(response, self._status()))
+                    else:
+                        writer.write(_encode({**response, "status": 404}))
+                elif self.spa.apply(header["path"], json.loads(body or b"{}")):
+                    writer.write(_encode(response))
+                    self._push()
+                else:
+                    writer.write(_encode({**response, "status": 404}))
+                await writer.drain()
+        except (OSError, ValueError, KeyError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
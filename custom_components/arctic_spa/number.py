@@ -12,7 +12,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import ArcticSpaApiError
-from .entity import ArcticSpaEntity
+from .entity import ArcticSpaEntity, included
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,11 +26,14 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     async_add_entities(
-        [
-            ArcticSpaTemperature(coordinator, entry.entry_id),
-            ArcticSpaFiltrationDuration(coordinator, entry.entry_id),
-            ArcticSpaFiltrationFrequency(coordinator, entry.entry_id),
-        ]
+        included(
+            entry,
+            [
+                ArcticSpaTemperature(coordinator, entry.entry_id),
+                ArcticSpaFiltrationDuration(coordinator, entry.entry_id),
+                ArcticSpaFiltrationFrequency(coordinator, entry.entry_id),
+            ],
+        )
     )
 
 
@@ -58,8 +61,10 @@ class ArcticSpaTemperature(ArcticSpaEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set the temperature setpoint."""
         try:
-            await self.coordinator.client.async_set_temperature(int(value))
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_temperature(int(value)),
+                {"setpointF": int(value)},
+            )
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to set temperature: %s", err)
 
@@ -90,8 +95,10 @@ class ArcticSpaFiltrationDuration(ArcticSpaEntity, NumberEntity):
         """Set filtration duration."""
         freq = (self.coordinator.data or {}).get("filtration_frequency", 1)
         try:
-            await self.coordinator.client.async_set_filtration(int(value), int(freq))
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_filtration(int(value), int(freq)),
+                {"filtration_duration": int(value), "filtration_frequency": int(freq)},
+            )
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to set filtration duration: %s", err)
 
@@ -122,7 +129,9 @@ class ArcticSpaFiltrationFrequency(ArcticSpaEntity, NumberEntity):
         """Set filtration frequency."""
         dur = (self.coordinator.data or {}).get("filtration_duration", 1)
         try:
-            await self.coordinator.client.async_set_filtration(int(dur), int(value))
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_filtration(int(dur), int(value)),
+                {"filtration_duration": int(dur), "filtration_frequency": int(value)},
+            )
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to set filtration frequency: %s", err)
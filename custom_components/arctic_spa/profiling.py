@@ -0,0 +1,74 @@
+"""On-demand cProfile capture of coordinator refreshes and commands."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# Functions listed in the text summary
+SUMMARY_LINES = 40
+
+
+class Profiler:
+    """Profiles the next ``runs`` refreshes or commands.
+
+    The profiler is enabled while at least one profiled operation is running,
+    so overlapping operations share (and count as) a single run. cProfile sees
+    everything the event loop executes in that window, including other tasks
+    that run while the operation awaits the network.
+    """
+
+    def __init__(self, runs: int) -> None:
+        """Initialize the profiler."""
+        self.remaining = runs
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        # Why the profiler could not be enabled; it then profiles nothing
+        self.error: ValueError | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Return True once every requested run has completed."""
+        return self.remaining <= 0 and not self._depth
+
+    @contextmanager
+    def run(self) -> Iterator[None]:
+        """Profile the enclosed operation.
+
+        If the profiler cannot be enabled, e.g. because Python 3.12+ already
+        has another profiler active, the operation runs unprofiled and the
+        reason is kept in ``error``.
+        """
+        if not self._depth and self.error is None:
+            try:
+                self._profile.enable()
+            except ValueError as err:
+                self.error = err
+        if self.error is not None:
+            yield
+            return
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._profile.disable()
+                self.remaining -= 1
+
+    def write(self, path: str | Path) -> tuple[Path, Path]:
+        """Write ``<path>.prof`` and a text summary ``<path>.txt`` (blocking)."""
+        prof = Path(f"{path}.prof")
+        summary = Path(f"{path}.txt")
+        prof.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(prof)
+        text = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=text)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(SUMMARY_LINES)
+        summary.write_text(text.getvalue(), encoding="utf-8")
+        return prof, summary
@@ -2,154 +2,125 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from .const import ACTUATION_HISTOGRAM_BOUNDS
+from .entity import ArcticSpaEntity, included
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArcticSpaSensorEntityDescription(SensorEntityDescription):
+    """Describes an Arctic Spa sensor; shared by the sensors of every spa."""
+
+    json_key: str
+    value_fn: Callable[[Any], StateType] | None = None
 
-from .entity import ArcticSpaEntity
-
-SENSORS = [
-    # (key, name, json_key, unit, device_class, state_class, icon, value_fn, entity_category)
-    (
-        "temperature",
-        "Temperature",
-        "temperatureF",
-        UnitOfTemperature.FAHRENHEIT,
-        SensorDeviceClass.TEMPERATURE,
-        SensorStateClass.MEASUREMENT,
-        None,
-        None,
-        None,
+
+SENSORS: tuple[ArcticSpaSensorEntityDescription, ...] = (
+    ArcticSpaSensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        json_key="temperatureF",
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
     ),
-    (
-        "setpoint",
-        "Setpoint",
-        "setpointF",
-        UnitOfTemperature.FAHRENHEIT,
-        SensorDeviceClass.TEMPERATURE,
-        None,
-        None,
-        None,
-        None,
+    ArcticSpaSensorEntityDescription(
+        key="setpoint",
+        name="Setpoint",
+        json_key="setpointF",
+        native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
+        device_class=SensorDeviceClass.TEMPERATURE,
     ),
-    (
-        "ph",
-        "pH",
-        "ph",
-        "pH",
-        None,
-        SensorStateClass.MEASUREMENT,
-        "mdi:test-tube",
-        None,
-        None,
+    ArcticSpaSensorEntityDescription(
+        key="ph",
+        name="pH",
+        json_key="ph",
+        native_unit_of_measurement="pH",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:test-tube",
     ),
-    (
-        "ph_status",
-        "pH Status",
-        "ph_status",
-        None,
-        None,
-        None,
-        "mdi:test-tube",
-        lambda v: v.replace("_", " ").title() if isinstance(v, str) else v,
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaSensorEntityDescription(
+        key="ph_status",
+        name="pH Status",
+        json_key="ph_status",
+        icon="mdi:test-tube",
+        value_fn=lambda v: v.replace("_", " ").title() if isinstance(v, str) else v,
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    (
-        "orp",
-        "ORP",
-        "orp",
-        "mV",
-        None,
-        SensorStateClass.MEASUREMENT,
-        "mdi:flash",
-        None,
-        None,
+    ArcticSpaSensorEntityDescription(
+        key="orp",
+        name="ORP",
+        json_key="orp",
+        native_unit_of_measurement="mV",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:flash",
     ),
-    (
-        "orp_status",
-        "ORP Status",
-        "orp_status",
-        None,
-        None,
-        None,
-        "mdi:flash",
-        lambda v: v.replace("_", " ").title() if isinstance(v, str) else v,
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaSensorEntityDescription(
+        key="orp_status",
+        name="ORP Status",
+        json_key="orp_status",
+        icon="mdi:flash",
+        value_fn=lambda v: v.replace("_", " ").title() if isinstance(v, str) else v,
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    (
-        "filter_status",
-        "Filter Status",
-        "filter_status",
-        None,
-        None,
-        None,
-        "mdi:air-filter",
-        None,
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaSensorEntityDescription(
+        key="filter_status",
+        name="Filter Status",
+        json_key="filter_status",
+        icon="mdi:air-filter",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    (
-        "filtration_duration",
-        "Filtration Duration",
-        "filtration_duration",
-        UnitOfTime.HOURS,
-        None,
-        None,
-        "mdi:timer-outline",
-        None,
-        None,
+    ArcticSpaSensorEntityDescription(
+        key="filtration_duration",
+        name="Filtration Duration",
+        json_key="filtration_duration",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        icon="mdi:timer-outline",
     ),
-    (
-        "filtration_frequency",
-        "Filtration Frequency",
-        "filtration_frequency",
-        "x/day",
-        None,
-        None,
-        "mdi:refresh",
-        None,
-        None,
+    ArcticSpaSensorEntityDescription(
+        key="filtration_frequency",
+        name="Filtration Frequency",
+        json_key="filtration_frequency",
+        native_unit_of_measurement="x/day",
+        icon="mdi:refresh",
     ),
-    (
-        "pump1_state",
-        "Pump 1 State",
-        "pump1",
-        None,
-        None,
-        None,
-        "mdi:pump",
-        None,
-        None,
+    ArcticSpaSensorEntityDescription(
+        key="pump1_state",
+        name="Pump 1 State",
+        json_key="pump1",
+        icon="mdi:pump",
     ),
-    (
-        "pump2_state",
-        "Pump 2 State",
-        "pump2",
-        None,
-        None,
-        None,
-        "mdi:pump",
-        None,
-        None,
+    ArcticSpaSensorEntityDescription(
+        key="pump2_state",
+        name="Pump 2 State",
+        json_key="pump2",
+        icon="mdi:pump",
     ),
-    (
-        "errors",
-        "Errors",
-        "errors",
-        None,
-        None,
-        None,
-        "mdi:alert-circle-outline",
-        lambda v: ", ".join(v) if isinstance(v, list) and v else "None",
-        EntityCategory.DIAGNOSTIC,
+    ArcticSpaSensorEntityDescription(
+        key="errors",
+        name="Errors",
+        json_key="errors",
+        icon="mdi:alert-circle-outline",
+        value_fn=lambda v: ", ".join(v) if isinstance(v, list) and v else "None",
+        entity_category=EntityCategory.DIAGNOSTIC,
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -160,59 +131,88 @@ async def async_setup_entry(
     """Set up Arctic Spa sensors."""
     coordinator = entry.runtime_data
 
-    entities = []
-    for key, name, json_key, unit, dev_cls, state_cls, icon, value_fn, entity_cat in SENSORS:
-        entities.append(
-            ArcticSpaSensor(
-                coordinator,
-                entry.entry_id,
-                key,
-                name,
-                json_key,
-                unit,
-                dev_cls,
-                state_cls,
-                icon,
-                value_fn,
-                entity_cat,
-            )
-        )
-    async_add_entities(entities)
+    entities: list[ArcticSpaEntity] = [
+        ArcticSpaSensor(coordinator, entry.entry_id, description) for description in SENSORS
+    ]
+    entities.append(ArcticSpaCommandLatencySensor(coordinator, entry.entry_id))
+    async_add_entities(included(entry, entities))
 
 
 class ArcticSpaSensor(ArcticSpaEntity, SensorEntity):
     """Representation of an Arctic Spa sensor."""
 
-    def __init__(
-        self,
-        coordinator,
-        entry_id,
-        key,
-        name,
-        json_key,
-        unit,
-        device_class,
-        state_class,
-        icon,
-        value_fn,
-        entity_category,
-    ):
+    entity_description: ArcticSpaSensorEntityDescription
+    # Last value and availability written, for the deadband check
+    _reported: StateType = None
+    _reported_available: bool | None = None
+
+    def __init__(self, coordinator, entry_id, description: ArcticSpaSensorEntityDescription):
         """Initialize the sensor."""
-        super().__init__(coordinator, entry_id, key, name)
-        self._json_key = json_key
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_icon = icon
-        self._value_fn = value_fn
-        self._attr_entity_category = entity_category
+        super().__init__(coordinator, entry_id, description.key)
+        self.entity_description = description
 
     @property
     def native_value(self):
         """Return the sensor value."""
         if self.coordinator.data is None:
             return None
-        val = self.coordinator.data.get(self._json_key)
-        if self._value_fn and val is not None:
-            return self._value_fn(val)
+        description = self.entity_description
+        val = self.coordinator.data.get(description.json_key)
+        if description.value_fn and val is not None:
+            return description.value_fn(val)
         return val
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new value unless it moved less than the key's deadband.
+
+        Failed polls and changes in availability are always written, so the
+        sensor goes unavailable and recovers even when the value is unchanged.
+        """
+        value = self.native_value
+        available = self.available
+        deadband = self.coordinator.deadbands.get(self.entity_description.json_key)
+        if (
+            deadband
+            and self.coordinator.last_update_success
+            and available == self._reported_available
+            and isinstance(value, int | float)
+            and isinstance(self._reported, int | float)
+            and abs(value - self._reported) < deadband
+        ):
+            return
+        self._reported = value
+        self._reported_available = available
+        super()._handle_coordinator_update()
+
+
+class ArcticSpaCommandLatencySensor(ArcticSpaEntity, SensorEntity):
+    """Time from a command being accepted until /status reflected it."""
+
+    _attr_icon = "mdi:timer-sand"
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, entry_id):
+        """Initialize the command latency sensor."""
+        super().__init__(coordinator, entry_id, "command_latency", "Command Latency")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the most recent confirmed command latency."""
+        return self.coordinator.actuation_stats.last
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return latency percentiles and histogram buckets."""
+        stats = self.coordinator.actuation_stats
+        return {
+            "confirmed": stats.count,
+            "not_confirmed": stats.errors,
+            "p50": stats.percentile(50),
+            "p95": stats.percentile(95),
+            "histogram": stats.histogram(ACTUATION_HISTOGRAM_BOUNDS),
+        }
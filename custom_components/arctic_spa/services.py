@@ -0,0 +1,314 @@
+"""Services for the Arctic Spa integration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import ArcticSpaApiError, PumpState
+from .const import DOMAIN, TELEMETRY_QUERY_MAX_SAMPLES
+from .coordinator import status_capture
+
+if TYPE_CHECKING:
+    from .telemetry import TelemetryStore
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+SERVICE_APPLY_SCENE = "apply_scene"
+SERVICE_REPLAY_CAPTURE = "replay_capture"
+SERVICE_QUERY_TELEMETRY = "query_telemetry"
+SERVICE_IMPORT_STATISTICS = "import_statistics"
+SERVICE_PROFILE = "profile"
+SERVICE_SCHEDULE_READY = "schedule_ready"
+
+_PUMP_STATES = [str(state) for state in PumpState]
+
+APPLY_SCENE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional("lights"): cv.boolean,
+        vol.Optional("pump1"): vol.In(_PUMP_STATES),
+        vol.Optional("pump2"): vol.In(_PUMP_STATES),
+        vol.Optional("setpoint"): vol.All(vol.Coerce(int), vol.Range(min=80, max=104)),
+        vol.Optional("filtration_duration"): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+        vol.Optional("filtration_frequency"): vol.All(vol.Coerce(int), vol.Range(min=1, max=24)),
+        vol.Optional("boost"): cv.boolean,
+    }
+)
+
+
+REPLAY_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional("file"): cv.string,
+        vol.Optional("speed", default=0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+
+QUERY_TELEMETRY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("step"): vol.All(
+            cv.time_period, vol.Range(min=timedelta(minutes=1), max=timedelta(days=1))
+        ),
+    }
+)
+
+
+IMPORT_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+    }
+)
+
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional("count", default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+
+
+SCHEDULE_READY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required("ready_by"): cv.datetime,
+        vol.Required("temperature"): vol.All(vol.Coerce(int), vol.Range(min=80, max=104)),
+        vol.Optional("boost"): cv.boolean,
+    }
+)
+
+
+def _async_get_entries(hass: HomeAssistant, call: ServiceCall) -> list[ConfigEntry]:
+    """Return the loaded entries targeted by a service call (all spas if none given)."""
+    if entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID):
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None or entry.domain != DOMAIN:
+            raise ServiceValidationError(f"Unknown Arctic Spa config entry {entry_id}")
+        entries = [entry]
+    else:
+        entries = hass.config_entries.async_entries(DOMAIN)
+    loaded = [entry for entry in entries if entry.state is ConfigEntryState.LOADED]
+    if not loaded:
+        raise ServiceValidationError("No loaded Arctic Spa config entry")
+    return loaded
+
+
+async def _async_apply_scene(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Apply several spa settings in one call."""
+    settings = {key: value for key, value in call.data.items() if key != ATTR_CONFIG_ENTRY_ID}
+    if not settings:
+        raise ServiceValidationError("apply_scene needs at least one setting")
+    results = await asyncio.gather(
+        *(
+            entry.runtime_data.async_apply_scene(**settings)
+            for entry in _async_get_entries(hass, call)
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, ArcticSpaApiError):
+            raise HomeAssistantError(f"Failed to apply scene: {result}") from result
+        if isinstance(result, Exception):
+            raise result
+
+
+def _load_capture(paths: list[str | Path]) -> list[tuple[float, dict]]:
+    """Read every record of a status capture (blocking)."""
+    from .capture import read_capture
+
+    return list(read_capture(paths))
+
+
+async def _async_replay_capture(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Replay a status capture through a spa's coordinator and entities."""
+    (entry,) = _async_get_entries(hass, call)
+    coordinator = entry.runtime_data
+    if path := call.data.get("file"):
+        if not hass.config.is_allowed_path(path):
+            raise ServiceValidationError(f"Access to {path} is not allowed")
+        paths = [path]
+    else:
+        await coordinator.async_flush_capture()
+        paths = status_capture(hass, entry.entry_id).files()
+    try:
+        records = await hass.async_add_executor_job(_load_capture, paths)
+    except (OSError, ValueError) as err:
+        raise HomeAssistantError(f"Cannot read status capture: {err}") from err
+    if not records:
+        raise ServiceValidationError("The status capture is empty")
+
+    writes = coordinator.entity_writes.total()
+    start = time.monotonic()
+    replayed = await coordinator.async_replay(records, call.data["speed"])
+    return {
+        "records": replayed,
+        "seconds": round(time.monotonic() - start, 3),
+        "entity_writes": coordinator.entity_writes.total() - writes,
+    }
+
+
+def _query_telemetry(
+    store: TelemetryStore, start: float, end: float, step: timedelta | None
+) -> dict:
+    """Read samples or downsampled buckets from a telemetry store (blocking)."""
+    if step is not None:
+        buckets = store.downsample(start, end, int(step.total_seconds()))
+        return {
+            "buckets": [
+                {**asdict(bucket), "start": dt_util.utc_from_timestamp(bucket.start).isoformat()}
+                for bucket in buckets
+            ]
+        }
+    samples = []
+    for sample in store.samples(start, end):
+        if len(samples) == TELEMETRY_QUERY_MAX_SAMPLES:
+            raise ServiceValidationError(
+                f"More than {TELEMETRY_QUERY_MAX_SAMPLES} samples, set a step to downsample"
+            )
+        samples.append(
+            {
+                **asdict(sample),
+                "timestamp": dt_util.utc_from_timestamp(sample.timestamp).isoformat(),
+            }
+        )
+    return {"samples": samples}
+
+
+async def _async_query_telemetry(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return a spa's stored telemetry for a time range."""
+    (entry,) = _async_get_entries(hass, call)
+    store = entry.runtime_data.telemetry
+    if store is None:
+        raise ServiceValidationError("Telemetry history is not enabled for this spa")
+    start: datetime = dt_util.as_utc(call.data["start"])
+    end: datetime = dt_util.as_utc(call.data.get("end") or dt_util.utcnow())
+    try:
+        return await hass.async_add_executor_job(
+            _query_telemetry, store, start.timestamp(), end.timestamp(), call.data.get("step")
+        )
+    except (OSError, ValueError) as err:
+        raise HomeAssistantError(f"Cannot read telemetry history: {err}") from err
+
+
+async def _async_import_statistics(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Backfill hourly long-term statistics from each spa's telemetry history."""
+    from .statistics import async_import_statistics
+
+    entries = [
+        entry
+        for entry in _async_get_entries(hass, call)
+        if entry.runtime_data.telemetry is not None
+    ]
+    if not entries:
+        raise ServiceValidationError("Telemetry history is not enabled for any targeted spa")
+    start = dt_util.as_utc(call.data.get("start") or dt_util.utc_from_timestamp(0))
+    end = dt_util.as_utc(call.data.get("end") or dt_util.utcnow())
+    imported = {}
+    for entry in entries:
+        try:
+            imported[entry.entry_id] = await async_import_statistics(
+                hass, entry.runtime_data, start, end
+            )
+        except (OSError, ValueError) as err:
+            raise HomeAssistantError(f"Cannot read telemetry history: {err}") from err
+    return {"hours": imported}
+
+
+async def _async_profile(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Profile a spa's next refreshes and commands."""
+    (entry,) = _async_get_entries(hass, call)
+    if entry.runtime_data.profiler is not None:
+        raise ServiceValidationError("A profile is already being captured for this spa")
+    entry.runtime_data.async_start_profile(call.data["count"])
+
+
+async def _async_schedule_ready(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Plan pre-heating so each spa is at temperature by the requested time."""
+    ready_by = dt_util.as_utc(call.data["ready_by"])
+    if ready_by <= dt_util.utcnow():
+        raise ServiceValidationError("ready_by must be in the future")
+    plans = {}
+    for entry in _async_get_entries(hass, call):
+        plan = entry.runtime_data.async_schedule_ready(
+            ready_by.timestamp(), call.data["temperature"], call.data.get("boost")
+        )
+        plans[entry.entry_id] = {
+            "start": dt_util.utc_from_timestamp(plan.start).isoformat(),
+            "target": plan.target,
+            "boost": plan.boost,
+            "expected_ready": dt_util.utc_from_timestamp(plan.expected_ready).isoformat(),
+        }
+    return {"plans": plans}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Arctic Spa services."""
+
+    async def apply_scene(call: ServiceCall) -> None:
+        await _async_apply_scene(hass, call)
+
+    async def replay_capture(call: ServiceCall) -> ServiceResponse:
+        return await _async_replay_capture(hass, call)
+
+    async def query_telemetry(call: ServiceCall) -> ServiceResponse:
+        return await _async_query_telemetry(hass, call)
+
+    async def import_statistics(call: ServiceCall) -> ServiceResponse:
+        return await _async_import_statistics(hass, call)
+
+    async def profile(call: ServiceCall) -> None:
+        await _async_profile(hass, call)
+
+    async def schedule_ready(call: ServiceCall) -> ServiceResponse:
+        return await _async_schedule_ready(hass, call)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY_SCENE, apply_scene, schema=APPLY_SCENE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY_CAPTURE,
+        replay_capture,
+        schema=REPLAY_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_TELEMETRY,
+        query_telemetry,
+        schema=QUERY_TELEMETRY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_STATISTICS,
+        import_statistics,
+        schema=IMPORT_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, profile, schema=PROFILE_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SCHEDULE_READY,
+        schedule_ready,
+        schema=SCHEDULE_READY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,90 @@
+"""Long-term statistics backfill from the telemetry history."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STATISTICS_IMPORT_BATCH_HOURS
+from .coordinator import ArcticSpaCoordinator
+from .telemetry import TelemetryStore
+
+_HOUR = 3600
+
+# (telemetry field, statistic id suffix, name, unit)
+STATISTICS = (
+    ("temperature", "temperature", "Temperature", UnitOfTemperature.FAHRENHEIT),
+    ("ph", "ph", "pH", "pH"),
+    ("orp", "orp", "ORP", "mV"),
+)
+
+
+def statistic_id(entry_id: str, suffix: str) -> str:
+    """Return the external statistic id of a spa reading."""
+    return f"{DOMAIN}:{entry_id.lower()}_{suffix}"
+
+
+def hourly_statistics(store: TelemetryStore, start: float, end: float) -> dict[str, list[dict]]:
+    """Return hourly mean/min/max rows per telemetry field (blocking)."""
+    rows: dict[str, list[dict]] = {field: [] for field, *_ in STATISTICS}
+    for bucket in store.downsample(start, end, _HOUR):
+        bucket_start = dt_util.utc_from_timestamp(bucket.start)
+        for field in rows:
+            if (aggregate := getattr(bucket, field)) is not None:
+                rows[field].append(
+                    {
+                        "start": bucket_start,
+                        "mean": aggregate.mean,
+                        "min": aggregate.min,
+                        "max": aggregate.max,
+                    }
+                )
+    return rows
+
+
+async def async_import_statistics(
+    hass: HomeAssistant, coordinator: ArcticSpaCoordinator, start: datetime, end: datetime
+) -> int:
+    """Import hourly statistics for the completed hours from ``start`` to ``end``.
+
+    Both ends are rounded down to the hour, so the hour ``start`` falls in is
+    imported whole. Returns the number of hours imported.
+
+    Aggregation runs in an executor and rows are handed to the recorder in
+    batches. Importing an hour again overwrites it, so backfills can overlap.
+    """
+    from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+    try:
+        from homeassistant.components.recorder.models import StatisticMeanType
+    except ImportError:  # Home Assistant before 2025.4
+        mean: dict = {"has_mean": True}
+    else:
+        mean = {"mean_type": StatisticMeanType.ARITHMETIC}
+
+    entry = coordinator.config_entry
+    # Only whole hours: an hour cut off at either end would overwrite its complete
+    # row, and the current hour is still being sampled
+    start_ts = start.timestamp() // _HOUR * _HOUR
+    end_ts = min(end.timestamp(), dt_util.utcnow().timestamp()) // _HOUR * _HOUR
+    rows = await hass.async_add_executor_job(
+        hourly_statistics, coordinator.telemetry, start_ts, end_ts
+    )
+    for field, suffix, name, unit in STATISTICS:
+        metadata = {
+            **mean,
+            "has_sum": False,
+            "name": f"{entry.title} {name}",
+            "source": DOMAIN,
+            "statistic_id": statistic_id(entry.entry_id, suffix),
+            "unit_of_measurement": unit,
+        }
+        field_rows = rows[field]
+        for index in range(0, len(field_rows), STATISTICS_IMPORT_BATCH_HOURS):
+            async_add_external_statistics(
+                hass, metadata, field_rows[index : index + STATISTICS_IMPORT_BATCH_HOURS]
+            )
+    return max(len(field_rows) for field_rows in rows.values())
@@ -11,7 +11,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .api import ArcticSpaApiError, LightState, PumpState
-from .entity import ArcticSpaEntity
+from .entity import ArcticSpaEntity, included
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,12 +25,15 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     async_add_entities(
-        [
-            ArcticSpaLightSwitch(coordinator, entry.entry_id),
-            ArcticSpaPumpSwitch(coordinator, entry.entry_id, 1, "Pump 1 Jets", PumpState.HIGH),
-            ArcticSpaPumpSwitch(coordinator, entry.entry_id, 2, "Pump 2 Jets", PumpState.HIGH),
-            ArcticSpaBoostSwitch(coordinator, entry.entry_id),
-        ]
+        included(
+            entry,
+            [
+                ArcticSpaLightSwitch(coordinator, entry.entry_id),
+                ArcticSpaPumpSwitch(coordinator, entry.entry_id, 1, "Pump 1 Jets", PumpState.HIGH),
+                ArcticSpaPumpSwitch(coordinator, entry.entry_id, 2, "Pump 2 Jets", PumpState.HIGH),
+                ArcticSpaBoostSwitch(coordinator, entry.entry_id),
+            ],
+        )
     )
 
 
@@ -56,16 +59,20 @@ class ArcticSpaLightSwitch(ArcticSpaEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the lights."""
         try:
-            await self.coordinator.client.async_set_lights(LightState.ON)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_lights(LightState.ON),
+                {"lights": str(LightState.ON)},
+            )
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to turn on lights: %s", err)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the lights."""
         try:
-            await self.coordinator.client.async_set_lights(LightState.OFF)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_lights(LightState.OFF),
+                {"lights": str(LightState.OFF)},
+            )
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to turn off lights: %s", err)
 
@@ -94,16 +101,20 @@ class ArcticSpaPumpSwitch(ArcticSpaEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the pump."""
         try:
-            await self.coordinator.client.async_set_pump(self._pump_id, self._on_state)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_pump(self._pump_id, self._on_state),
+                {f"pump{self._pump_id}": str(self._on_state)},
+            )
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to turn on pump %s: %s", self._pump_id, err)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the pump."""
         try:
-            await self.coordinator.client.async_set_pump(self._pump_id, PumpState.OFF)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_pump(self._pump_id, PumpState.OFF),
+                {f"pump{self._pump_id}": str(PumpState.OFF)},
+            )
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to turn off pump %s: %s", self._pump_id, err)
 
@@ -117,28 +128,27 @@ class ArcticSpaBoostSwitch(ArcticSpaEntity, SwitchEntity):
     def __init__(self, coordinator, entry_id):
         """Initialize the boost switch."""
         super().__init__(coordinator, entry_id, "boost_switch", "Boost Mode")
-        self._is_on = False
+
+    async def async_added_to_hass(self) -> None:
+        """Follow boost changes, which the status API does not report."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_boost_listener(self.async_write_ha_state))
 
     @property
     def is_on(self) -> bool:
         """Return true if boost is on."""
-        # Boost state isn't exposed in the status API, track locally
-        return self._is_on
+        return self.coordinator.boost
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on boost mode."""
         try:
-            await self.coordinator.client.async_set_boost(True)
-            self._is_on = True
-            self.async_write_ha_state()
+            await self.coordinator.async_set_boost(True)
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to enable boost mode: %s", err)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off boost mode."""
         try:
-            await self.coordinator.client.async_set_boost(False)
-            self._is_on = False
-            self.async_write_ha_state()
+            await self.coordinator.async_set_boost(False)
         except ArcticSpaApiError as err:
             _LOGGER.error("Failed to disable boost mode: %s", err)
@@ -0,0 +1,263 @@
+"""Compact on-disk telemetry history for a spa.
+
+Every poll appends one fixed-width binary record to a per-spa file, which is
+read back through a memory map. At one sample a minute a year of history is
+about 7 MB, small enough to keep months per spa without the recorder.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+_MAGIC = b"ASPT\x01\x00\x00\x00"
+
+# timestamp (s), temperature (0.1 °F), setpoint (0.1 °F), pH (0.01), ORP (mV), flags
+_RECORD = struct.Struct("<IhhHHH")
+_TIMESTAMP = struct.Struct("<I")
+_MISSING_SIGNED = -0x8000
+_MISSING_UNSIGNED = 0xFFFF
+
+FLAG_CONNECTED = 1 << 0
+FLAG_LIGHTS = 1 << 1
+FLAG_PUMP1_LOW = 1 << 2
+FLAG_PUMP1_HIGH = 1 << 3
+FLAG_PUMP2_LOW = 1 << 4
+FLAG_PUMP2_HIGH = 1 << 5
+FLAG_FILTERING = 1 << 6
+FLAG_PRODUCING = 1 << 7
+FLAG_ERRORS = 1 << 8
+
+_PUMP_FLAGS = {
+    "pump1": {"low": FLAG_PUMP1_LOW, "high": FLAG_PUMP1_HIGH},
+    "pump2": {"low": FLAG_PUMP2_LOW, "high": FLAG_PUMP2_HIGH},
+}
+
+FIELDS = ("temperature", "setpoint", "ph", "orp")
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    """One decoded telemetry record."""
+
+    timestamp: int
+    temperature: float | None
+    setpoint: float | None
+    ph: float | None
+    orp: int | None
+    flags: int
+
+
+@dataclass(frozen=True, slots=True)
+class Aggregate:
+    """Mean, minimum and maximum of one field over a bucket."""
+
+    mean: float
+    min: float
+    max: float
+
+
+@dataclass(frozen=True, slots=True)
+class Bucket:
+    """Samples downsampled into one time bucket starting at ``start``."""
+
+    start: int
+    count: int
+    temperature: Aggregate | None
+    setpoint: Aggregate | None
+    ph: Aggregate | None
+    orp: Aggregate | None
+
+
+def _scaled(value, scale: int, missing: int) -> int:
+    """Return a reading as a scaled integer, or the missing marker."""
+    if value is None or isinstance(value, bool):
+        return missing
+    try:
+        return round(float(value) * scale)
+    except (TypeError, ValueError):
+        return missing
+
+
+def encode(timestamp: float, data: dict) -> bytes:
+    """Encode a raw status payload as a fixed-width record."""
+    flags = 0
+    if data.get("connected"):
+        flags |= FLAG_CONNECTED
+    if data.get("lights") == "on":
+        flags |= FLAG_LIGHTS
+    for pump, states in _PUMP_FLAGS.items():
+        flags |= states.get(data.get(pump), 0)
+    if data.get("filter_status") not in (None, "Idle"):
+        flags |= FLAG_FILTERING
+    if data.get("spaboy_producing"):
+        flags |= FLAG_PRODUCING
+    if data.get("errors"):
+        flags |= FLAG_ERRORS
+    temperature = _scaled(data.get("temperatureF"), 10, _MISSING_SIGNED)
+    setpoint = _scaled(data.get("setpointF"), 10, _MISSING_SIGNED)
+    ph = _scaled(data.get("ph"), 100, _MISSING_UNSIGNED)
+    orp = _scaled(data.get("orp"), 1, _MISSING_UNSIGNED)
+    return _RECORD.pack(
+        int(timestamp),
+        temperature if -0x8000 <= temperature < 0x8000 else _MISSING_SIGNED,
+        setpoint if -0x8000 <= setpoint < 0x8000 else _MISSING_SIGNED,
+        ph if 0 <= ph < 0xFFFF else _MISSING_UNSIGNED,
+        orp if 0 <= orp < 0xFFFF else _MISSING_UNSIGNED,
+        flags,
+    )
+
+
+def _decode(buffer, offset: int) -> Sample:
+    """Decode the record at ``offset``."""
+    timestamp, temperature, setpoint, ph, orp, flags = _RECORD.unpack_from(buffer, offset)
+    return Sample(
+        timestamp,
+        None if temperature == _MISSING_SIGNED else temperature / 10,
+        None if setpoint == _MISSING_SIGNED else setpoint / 10,
+        None if ph == _MISSING_UNSIGNED else ph / 100,
+        None if orp == _MISSING_UNSIGNED else orp,
+        flags,
+    )
+
+
+class _Timestamps:
+    """Sequence view of the record timestamps, for bisecting a memory map."""
+
+    def __init__(self, buffer, count: int) -> None:
+        self._buffer = buffer
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        return _TIMESTAMP.unpack_from(self._buffer, len(_MAGIC) + index * _RECORD.size)[0]
+
+
+class TelemetryStore:
+    """Append-only file of fixed-width telemetry records, oldest first.
+
+    All methods do blocking file I/O and belong in an executor. Records must
+    arrive in time order; samples at or before the last stored second are
+    ignored. A torn record left by a crash is truncated on the next append.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the store; the file is created on the first append."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._last: int | None = None
+
+    def _last_timestamp(self) -> int:
+        """Return the timestamp of the newest record, repairing a torn tail."""
+        if self._last is None:
+            self._last = 0
+            if self.path.exists():
+                with self.path.open("r+b") as file:
+                    size = file.seek(0, os.SEEK_END)
+                    whole = size - (size - len(_MAGIC)) % _RECORD.size if size >= len(_MAGIC) else 0
+                    if whole != size:
+                        file.truncate(whole)
+                    if whole > len(_MAGIC):
+                        file.seek(whole - _RECORD.size)
+                        self._last = _TIMESTAMP.unpack(file.read(_TIMESTAMP.size))[0]
+        return self._last
+
+    def append(self, timestamp: float, data: dict) -> bool:
+        """Store a status payload; return False if it is not newer than the last record."""
+        return self.extend([(timestamp, data)]) == 1
+
+    def extend(self, samples: Iterable[tuple[float, dict]]) -> int:
+        """Store timestamped status payloads with one write; return the number stored.
+
+        Like append, a sample not newer than the one before it is skipped.
+        """
+        with self._lock:
+            last = self._last_timestamp()
+            records = []
+            for timestamp, data in samples:
+                if int(timestamp) > last:
+                    records.append(encode(timestamp, data))
+                    last = int(timestamp)
+            if not records:
+                return 0
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as file:
+                if file.tell() == 0:
+                    file.write(_MAGIC)
+                file.write(b"".join(records))
+            self._last = last
+            return len(records)
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+        return max(0, size - len(_MAGIC)) // _RECORD.size
+
+    def samples(self, start: float, end: float) -> Iterator[Sample]:
+        """Yield the samples with ``start <= timestamp < end``."""
+        count = len(self)
+        if not count:
+            return
+        with (
+            self.path.open("rb") as file,
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            if buffer[: len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{self.path} is not an Arctic Spa telemetry file")
+            timestamps = _Timestamps(buffer, count)
+            first = bisect_left(timestamps, start)
+            last = bisect_left(timestamps, end, lo=first)
+            for index in range(first, last):
+                yield _decode(buffer, len(_MAGIC) + index * _RECORD.size)
+
+    def downsample(self, start: float, end: float, step: int) -> list[Bucket]:
+        """Return mean/min/max per field in ``step``-second buckets aligned to the epoch."""
+        buckets: list[Bucket] = []
+        bucket_start: int | None = None
+        values: dict[str, list[float]] = {}
+        count = 0
+
+        def close() -> None:
+            buckets.append(
+                Bucket(
+                    bucket_start,
+                    count,
+                    *(
+                        Aggregate(sum(v) / len(v), min(v), max(v)) if (v := values[name]) else None
+                        for name in FIELDS
+                    ),
+                )
+            )
+
+        for sample in self.samples(start, end):
+            sample_bucket = sample.timestamp - sample.timestamp % step
+            if sample_bucket != bucket_start:
+                if bucket_start is not None:
+                    close()
+                bucket_start = sample_bucket
+                values = {name: [] for name in FIELDS}
+                count = 0
+            count += 1
+            for name in FIELDS:
+                if (value := getattr(sample, name)) is not None:
+                    values[name].append(value)
+        if bucket_start is not None:
+            close()
+        return buckets
+
+    def remove(self) -> None:
+        """Delete the store."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+            self._last = None
@@ -0,0 +1,358 @@
+"""Transports that carry Arctic Spa API requests.
+
+ArcticSpaClient builds requests (URL, headers, JSON payload) and interprets the
+responses; a transport only moves them. Besides the aiohttp transport used in
+production there is an in-process fake spa and a record/replay pair, so tests
+and benchmarks can run the full client → coordinator → entity pipeline without
+sockets. FallbackTransport chains two transports, e.g. a local one with the
+cloud behind it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keep idle connections open this long past the poll interval so the next poll
+# and any command in between reuse the poll's connection instead of a new TLS handshake
+_KEEPALIVE_MARGIN = 15
+_DNS_CACHE_TTL = 300
+
+# Responses to these statuses never carry a body
+_NO_BODY_STATUSES = frozenset({204, 304})
+
+
+class TransportError(Exception):
+    """The request could not be delivered or no response was received."""
+
+
+@dataclass(slots=True)
+class TransportResponse:
+    """Status, headers and raw body of a response."""
+
+    status: int
+    headers: Mapping[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+
+class Transport(ABC):
+    """Carries one HTTP-style request to the spa API and returns its response."""
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        json_payload: dict | None = None,
+    ) -> TransportResponse:
+        """Send a request, raising TransportError if no response was received."""
+
+    async def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """Release any resources held by the transport."""
+
+
+def create_session(pool_size: int = 4, poll_interval: float = 60) -> aiohttp.ClientSession:
+    """Create a session tuned for the spa API.
+
+    The connector keeps up to ``pool_size`` keep-alive connections to the API
+    host, holds idle ones open a little longer than ``poll_interval`` seconds
+    and caches its DNS lookups.
+    """
+    connector = aiohttp.TCPConnector(
+        limit_per_host=pool_size,
+        keepalive_timeout=poll_interval + _KEEPALIVE_MARGIN,
+        ttl_dns_cache=_DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+class AiohttpTransport(Transport):
+    """Transport over an aiohttp session."""
+
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the transport.
+
+        Args:
+            session: Optional aiohttp session (one will be created if not provided)
+        """
+        self._session = session
+        self._own_session = session is None
+        self._timeouts: dict[float, aiohttp.ClientTimeout] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create an aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._own_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session if we own it."""
+        if self._own_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        json_payload: dict | None = None,
+    ) -> TransportResponse:
+        """Send a request over the session."""
+        session = await self._get_session()
+        client_timeout = self._timeouts.get(timeout)
+        if client_timeout is None:
+            client_timeout = self._timeouts[timeout] = aiohttp.ClientTimeout(total=timeout)
+        send = session.get if method == "GET" else session.put
+        try:
+            async with send(
+                url, headers=headers, json=json_payload, timeout=client_timeout
+            ) as resp:
+                body = b"" if resp.status in _NO_BODY_STATUSES else await resp.read()
+                return TransportResponse(resp.status, resp.headers, body)
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise TransportError(str(err) or type(err).__name__) from err
+
+
+class FallbackTransport(Transport):
+    """Sends requests through a primary transport, falling back to another.
+
+    After the primary fails, requests go straight to the fallback for
+    ``retry_after`` seconds before the primary is tried again.
+    """
+
+    def __init__(self, primary: Transport, fallback: Transport, retry_after: float = 60) -> None:
+        """Initialize the transport."""
+        self.primary = primary
+        self.fallback = fallback
+        self.retry_after = retry_after
+        self.fallbacks = 0
+        self._retry_at = 0.0
+
+    @property
+    def using_fallback(self) -> bool:
+        """Return True while the primary is skipped after a failure."""
+        return time.monotonic() < self._retry_at
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        json_payload: dict | None = None,
+    ) -> TransportResponse:
+        """Send the request through the primary, or the fallback if it fails."""
+        if not self.using_fallback:
+            try:
+                return await self.primary.request(method, url, headers, timeout, json_payload)
+            except TransportError as err:
+                _LOGGER.debug("Primary transport failed, falling back: %s", err)
+                self._retry_at = time.monotonic() + self.retry_after
+        self.fallbacks += 1
+        return await self.fallback.request(method, url, headers, timeout, json_payload)
+
+    async def close(self) -> None:
+        """Close both transports."""
+        await self.primary.close()
+        await self.fallback.close()
+
+
+DEFAULT_FAKE_STATE: dict = {
+    "connected": True,
+    "temperatureF": 100,
+    "setpointF": 100,
+    "lights": "off",
+    "pump1": "off",
+    "pump2": "off",
+    "spaboy_connected": True,
+    "spaboy_producing": False,
+    "ph": 7.4,
+    "ph_status": "OK",
+    "orp": 550,
+    "orp_status": "OK",
+    "filter_status": "Idle",
+    "filtration_duration": 1,
+    "filtration_frequency": 1,
+    "filter_suspension": "off",
+    "errors": [],
+}
+
+
+class FakeSpa:
+    """A simulated spa that understands the cloud API's endpoints."""
+
+    def __init__(self, state: dict | None = None) -> None:
+        """Initialize the spa from DEFAULT_FAKE_STATE and optional overrides."""
+        self.state = {**DEFAULT_FAKE_STATE, **(state or {})}
+        self.boost = False
+        self.version = 0
+
+    def apply(self, endpoint: str, payload: dict) -> bool:
+        """Apply a command to the spa state; return False for an unknown endpoint."""
+        if endpoint == "lights":
+            self.state["lights"] = payload["state"]
+        elif endpoint in ("pumps/1", "pumps/2"):
+            self.state[f"pump{endpoint[-1]}"] = payload["state"]
+        elif endpoint == "temperature":
+            self.state["setpointF"] = payload["setpointF"]
+        elif endpoint == "filter":
+            self.state["filtration_duration"] = payload["duration"]
+            self.state["filtration_frequency"] = payload["frequency"]
+        elif endpoint == "boost":
+            self.boost = payload["state"] == "on"
+        else:
+            return False
+        self.version += 1
+        return True
+
+    def update(self, **changes) -> None:
+        """Change readings directly, as the spa itself would."""
+        self.state.update(changes)
+        self.version += 1
+
+    @property
+    def etag(self) -> str:
+        """Return the ETag of the current state."""
+        return f'"{self.version}"'
+
+
+class FakeSpaTransport(Transport):
+    """In-process stand-in for the cloud API backed by a FakeSpa.
+
+    Status responses carry an ETag and honour If-None-Match. Commands can be
+    applied after ``apply_delay`` seconds to mimic the spa lagging the cloud,
+    and setting ``offline`` makes every request fail like a network outage.
+    """
+
+    def __init__(
+        self,
+        spa: FakeSpa | None = None,
+        *,
+        api_key: str | None = None,
+        latency: float = 0.0,
+        apply_delay: float = 0.0,
+    ) -> None:
+        """Initialize the fake; ``api_key`` (if given) is the only key accepted."""
+        self.spa = spa or FakeSpa()
+        self.api_key = api_key
+        self.latency = latency
+        self.apply_delay = apply_delay
+        self.offline = False
+        self.requests: list[tuple[str, str]] = []
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        json_payload: dict | None = None,
+    ) -> TransportResponse:
+        """Answer a request from the simulated spa."""
+        endpoint = url.split("/spa/", 1)[-1]
+        self.requests.append((method, endpoint))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.offline:
+            raise TransportError("Fake spa cloud is offline")
+        if self.api_key is not None and headers.get("X-API-KEY") != self.api_key:
+            return TransportResponse(401)
+
+        if method == "GET":
+            if endpoint != "status":
+                return TransportResponse(404)
+            etag = self.spa.etag
+            if headers.get("If-None-Match") == etag:
+                return TransportResponse(304, {"ETag": etag})
+            return TransportResponse(200, {"ETag": etag}, json.dumps(self.spa.state).encode())
+
+        if self.apply_delay:
+            asyncio.get_running_loop().call_later(
+                self.apply_delay, self.spa.apply, endpoint, json_payload
+            )
+            return TransportResponse(200)
+        return TransportResponse(200 if self.spa.apply(endpoint, json_payload) else 404)
+
+
+class RecordingTransport(Transport):
+    """Wraps another transport and appends every exchange to a JSON-lines file."""
+
+    def __init__(self, inner: Transport, path: str | Path) -> None:
+        """Initialize the recorder."""
+        self._inner = inner
+        self._path = Path(path)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        json_payload: dict | None = None,
+    ) -> TransportResponse:
+        """Forward the request and record the exchange."""
+        response = await self._inner.request(method, url, headers, timeout, json_payload)
+        line = {
+            "method": method,
+            "url": url,
+            "payload": json_payload,
+            "status": response.status,
+            "headers": dict(response.headers),
+            "body": response.body.decode(),
+        }
+        with self._path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(line) + "\n")
+        return response
+
+    async def close(self) -> None:
+        """Close the wrapped transport."""
+        await self._inner.close()
+
+
+class ReplayTransport(Transport):
+    """Serves responses recorded by RecordingTransport, in recorded order.
+
+    Responses are matched by method and URL; once a URL's recording is used up
+    its last response repeats, so a short capture can drive a long benchmark.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Load a recording."""
+        self._responses: dict[tuple[str, str], deque[TransportResponse]] = defaultdict(deque)
+        with Path(path).open(encoding="utf-8") as file:
+            for line in file:
+                exchange = json.loads(line)
+                self._responses[exchange["method"], exchange["url"]].append(
+                    TransportResponse(
+                        exchange["status"], exchange["headers"], exchange["body"].encode()
+                    )
+                )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        json_payload: dict | None = None,
+    ) -> TransportResponse:
+        """Return the next recorded response for this request."""
+        responses = self._responses.get((method, url))
+        if not responses:
+            raise TransportError(f"No recorded response for {method} {url}")
+        return responses.popleft() if len(responses) > 1 else responses[0]
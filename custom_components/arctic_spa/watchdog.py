@@ -0,0 +1,84 @@
+"""Per-cycle cost and event-loop lag tracking for the coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+
+from .api import LatencyStats
+
+# Phases of an update cycle; everything but "http" runs on the event loop
+PHASES = ("http", "decode", "process", "fanout")
+SYNC_PHASES = ("decode", "process", "fanout")
+
+
+class CycleWatchdog:
+    """Rolling statistics of update cycle phases and event-loop lag.
+
+    ``begin`` starts a cycle and a lag probe: a timer re-armed every
+    ``lag_interval`` seconds whose lateness is how long the loop was blocked.
+    Phase durations are recorded as they happen and ``end`` closes the cycle,
+    reporting it if the synchronous phases together exceeded ``budget``.
+    """
+
+    def __init__(self, budget: float, lag_interval: float) -> None:
+        """Initialize the watchdog."""
+        self.budget = budget
+        self.phases = {phase: LatencyStats() for phase in PHASES}
+        self.sync = LatencyStats()
+        self.lag = LatencyStats()
+        self.over_budget = 0
+        self._lag_interval = lag_interval
+        self._cycle: dict[str, float] | None = None
+        self._cycle_lag = 0.0
+        self._probe: asyncio.TimerHandle | None = None
+
+    def begin(self) -> None:
+        """Start timing a cycle and sampling loop lag."""
+        self._cycle = dict.fromkeys(PHASES, 0.0)
+        self._cycle_lag = 0.0
+        if self._probe is None:
+            self._schedule_probe(asyncio.get_running_loop())
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Record time spent in a phase, inside or outside a cycle."""
+        self.phases[phase].record(seconds)
+        if self._cycle is not None:
+            self._cycle[phase] += seconds
+
+    def end(self) -> dict[str, float] | None:
+        """Finish the cycle; return its phases, sync total and max lag if over budget."""
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        cycle, self._cycle = self._cycle, None
+        if cycle is None:
+            return None
+        sync = sum(cycle[phase] for phase in SYNC_PHASES)
+        self.sync.record(sync)
+        if sync <= self.budget:
+            return None
+        self.over_budget += 1
+        return {**cycle, "sync": sync, "lag": self._cycle_lag}
+
+    def _schedule_probe(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Arm the next lag probe."""
+        self._probe = loop.call_later(
+            self._lag_interval, self._on_probe, loop, loop.time() + self._lag_interval
+        )
+
+    def _on_probe(self, loop: asyncio.AbstractEventLoop, expected: float) -> None:
+        """Record how late the probe fired and re-arm it."""
+        lag = max(0.0, loop.time() - expected)
+        self.lag.record(lag)
+        self._cycle_lag = max(self._cycle_lag, lag)
+        self._schedule_probe(loop)
+
+    def as_dict(self) -> dict:
+        """Return the statistics as a JSON-serializable dict."""
+        return {
+            "budget": self.budget,
+            "over_budget": self.over_budget,
+            "sync": self.sync.as_dict(),
+            "loop_lag": self.lag.as_dict(),
+            "phases": {phase: stats.as_dict() for phase, stats in self.phases.items()},
+        }
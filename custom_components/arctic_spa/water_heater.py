@@ -0,0 +1,93 @@
+"""Water heater platform for Arctic Spa."""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.water_heater import (
+    STATE_ELECTRIC,
+    STATE_PERFORMANCE,
+    WaterHeaterEntity,
+    WaterHeaterEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_TEMPERATURE, PRECISION_WHOLE, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .api import ArcticSpaApiError
+from .entity import ArcticSpaEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Arctic Spa water heater."""
+    async_add_entities([ArcticSpaWaterHeater(entry.runtime_data, entry.entry_id)])
+
+
+class ArcticSpaWaterHeater(ArcticSpaEntity, WaterHeaterEntity):
+    """Spa heater: water temperature, setpoint and boost in one entity.
+
+    Boost is exposed as the performance operation mode.
+    """
+
+    _attr_supported_features = (
+        WaterHeaterEntityFeature.TARGET_TEMPERATURE | WaterHeaterEntityFeature.OPERATION_MODE
+    )
+    _attr_operation_list = [STATE_ELECTRIC, STATE_PERFORMANCE]
+    _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
+    _attr_precision = PRECISION_WHOLE
+    _attr_target_temperature_step = 1
+    _attr_min_temp = 80
+    _attr_max_temp = 104
+
+    def __init__(self, coordinator, entry_id):
+        """Initialize the water heater."""
+        super().__init__(coordinator, entry_id, "water_heater", None)
+
+    async def async_added_to_hass(self) -> None:
+        """Follow boost changes, which the status API does not report."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_boost_listener(self.async_write_ha_state))
+
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the water temperature."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("temperatureF")
+
+    @property
+    def target_temperature(self) -> float | None:
+        """Return the setpoint."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("setpointF")
+
+    @property
+    def current_operation(self) -> str:
+        """Return performance while boost is on."""
+        return STATE_PERFORMANCE if self.coordinator.boost else STATE_ELECTRIC
+
+    async def async_set_temperature(self, **kwargs) -> None:
+        """Set the setpoint."""
+        setpoint = int(kwargs[ATTR_TEMPERATURE])
+        try:
+            await self.coordinator.async_send_command(
+                self.coordinator.client.async_set_temperature(setpoint),
+                {"setpointF": setpoint},
+            )
+        except ArcticSpaApiError as err:
+            _LOGGER.error("Failed to set temperature: %s", err)
+
+    async def async_set_operation_mode(self, operation_mode: str) -> None:
+        """Turn boost on for performance mode and off otherwise."""
+        try:
+            await self.coordinator.async_set_boost(operation_mode == STATE_PERFORMANCE)
+        except ArcticSpaApiError as err:
+            _LOGGER.error("Failed to set operation mode: %s", err)
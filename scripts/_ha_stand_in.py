@@ -0,0 +1,143 @@
+"""Minimal stand-ins for the Home Assistant modules the integration imports.
+
+Lets scripts/bench_memory.py build coordinators and entities without Home
+Assistant installed. The stand-in base classes hold no state of their own, so
+the benchmark then measures only what the integration itself allocates per
+spa; Home Assistant's per-entity bookkeeping is not included.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import ModuleType
+from typing import Any
+
+MODULES = (
+    "homeassistant",
+    "homeassistant.components",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.number",
+    "homeassistant.components.sensor",
+    "homeassistant.components.switch",
+    "homeassistant.components.water_heater",
+    "homeassistant.config_entries",
+    "homeassistant.const",
+    "homeassistant.core",
+    "homeassistant.exceptions",
+    "homeassistant.helpers",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.typing",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+)
+
+
+class _Constant(str):
+    """An enum member or feature flag; only its name matters here."""
+
+    __slots__ = ()
+
+    def __or__(self, other: object) -> _Constant:
+        return self
+
+
+class _ConstantsType(type):
+    """Metaclass of enum-like stand-ins: any attribute is a constant of that name."""
+
+    def __getattr__(cls, name: str) -> _Constant:
+        return _Constant(name)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EntityDescription:
+    """Stand-in for Home Assistant's entity descriptions."""
+
+    key: str
+    name: str | None = None
+    icon: str | None = None
+    device_class: str | None = None
+    entity_category: str | None = None
+    native_unit_of_measurement: str | None = None
+    state_class: str | None = None
+
+
+class _Subscriptable:
+    """Accepts ``Class[T]`` as the generic base classes do."""
+
+    def __class_getitem__(cls, item: Any) -> type:
+        return cls
+
+
+class DataUpdateCoordinator(_Subscriptable):
+    """Stand-in for the update coordinator: keeps its arguments and data."""
+
+    def __init__(self, hass: Any, logger: Any, **kwargs: Any) -> None:
+        self.hass = hass
+        self.logger = logger
+        self.name = kwargs.get("name")
+        self.update_interval = kwargs.get("update_interval")
+        self.config_entry = kwargs.get("config_entry")
+        self.always_update = kwargs.get("always_update", True)
+        self.data: Any = None
+        self.last_update_success = True
+        self._listeners: dict = {}
+
+    def async_update_listeners(self) -> None:
+        pass
+
+
+class CoordinatorEntity(_Subscriptable):
+    """Stand-in for the coordinator entity base class."""
+
+    def __init__(self, coordinator: Any) -> None:
+        self.coordinator = coordinator
+
+
+class HomeAssistant:
+    """Stand-in for the core object; only its config directory is used."""
+
+    def __init__(self, config_dir: str) -> None:
+        self.config_dir = config_dir
+
+
+def _callback(func: Any) -> Any:
+    return func
+
+
+def _module_getattr(name: str) -> Any:
+    """Resolve any other imported name to a class or constant."""
+    if name.isupper():
+        return _Constant(name)
+    if name.endswith("EntityDescription"):
+        return EntityDescription
+    if name.endswith("Entity"):
+        return type(name, (), {})
+    if name[0].isupper():
+        return _ConstantsType(name, (), {})
+    return lambda *args, **kwargs: lambda: None
+
+
+def install() -> None:
+    """Register the stand-in modules in ``sys.modules``."""
+    modules = {}
+    for name in MODULES:
+        module = modules[name] = sys.modules[name] = ModuleType(name)
+        module.__path__ = []
+        module.__getattr__ = _module_getattr
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(modules[parent], child, module)
+    modules["homeassistant.core"].HomeAssistant = HomeAssistant
+    modules["homeassistant.core"].callback = _callback
+    modules["homeassistant.helpers.entity"].DeviceInfo = dict
+    update_coordinator = modules["homeassistant.helpers.update_coordinator"]
+    update_coordinator.DataUpdateCoordinator = DataUpdateCoordinator
+    update_coordinator.CoordinatorEntity = CoordinatorEntity
+    modules["homeassistant.helpers.typing"].UNDEFINED = object()
+    modules["homeassistant.util.dt"].utcnow = lambda: datetime.now(UTC)
@@ -0,0 +1,118 @@
+"""Measure the memory the integration holds per spa.
+
+Builds the coordinator and every entity of N simulated spas (no platform
+setup, no network) and reports the bytes allocated per spa and per entity,
+measured with tracemalloc::
+
+    python scripts/bench_memory.py --spas 200 --profile full
+
+With Home Assistant installed the spas are built inside a Home Assistant core
+instance. Without it, minimal stand-ins for its modules are used and only the
+integration's own allocations are counted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib
+import sys
+import tempfile
+import tracemalloc
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+
+try:
+    import homeassistant.core  # noqa: F401
+
+    WITH_HOME_ASSISTANT = True
+except ImportError:
+    import _ha_stand_in
+
+    _ha_stand_in.install()
+    WITH_HOME_ASSISTANT = False
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+# Load the integration as a bare package, as cli.py does, so its Home Assistant
+# __init__ (and the dependencies only setup needs) is not imported
+_package = types.ModuleType("arctic_spa")
+_package.__path__ = [str(ROOT / "custom_components" / "arctic_spa")]
+sys.modules["arctic_spa"] = _package
+
+PLATFORMS = tuple(
+    importlib.import_module(f"arctic_spa.{name}")
+    for name in ("sensor", "binary_sensor", "switch", "number", "water_heater")
+)
+ArcticSpaClient = importlib.import_module("arctic_spa.api").ArcticSpaClient
+ENTITY_PROFILES = importlib.import_module("arctic_spa.const").ENTITY_PROFILES
+CONF_ENTITY_PROFILE = importlib.import_module("arctic_spa.const").CONF_ENTITY_PROFILE
+ArcticSpaCoordinator = importlib.import_module("arctic_spa.coordinator").ArcticSpaCoordinator
+FakeSpaTransport = importlib.import_module("arctic_spa.transport").FakeSpaTransport
+
+
+class BenchConfigEntry:
+    """The parts of a config entry the coordinator and platforms use."""
+
+    def __init__(self, entry_id: str, title: str, options: dict) -> None:
+        """Initialize the entry."""
+        self.entry_id = entry_id
+        self.title = title
+        self.data: dict = {}
+        self.options = options
+        self.runtime_data = None
+        self._on_unload: list = []
+
+    def async_on_unload(self, func) -> None:
+        """Keep a function to call on unload, as a real entry does."""
+        self._on_unload.append(func)
+
+
+async def _async_build_spa(hass: HomeAssistant, index: int, profile: str) -> tuple:
+    """Create one spa's client, coordinator and entities."""
+    entry = BenchConfigEntry(f"spa{index:06d}", f"Spa {index}", {CONF_ENTITY_PROFILE: profile})
+    client = ArcticSpaClient(f"key{index}", transport=FakeSpaTransport())
+    entry.runtime_data = ArcticSpaCoordinator(hass, client, entry)
+    entities: list = []
+    for platform in PLATFORMS:
+        await platform.async_setup_entry(hass, entry, entities.extend)
+    return entry, entities
+
+
+async def async_main(argv: list[str] | None = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spas", type=int, default=100, help="number of spas to build")
+    parser.add_argument("--profile", choices=list(ENTITY_PROFILES), default="full")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Warm up so imports and one-off caches are not counted
+        await _async_build_spa(hass, -1, args.profile)
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        spas = [await _async_build_spa(hass, index, args.profile) for index in range(args.spas)]
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        entities = sum(len(spa[1]) for spa in spas)
+        print(f"{args.spas} spas, {entities} entities ({args.profile} profile)")
+        if not WITH_HOME_ASSISTANT:
+            print("Home Assistant not installed: its own per-entity state is not counted")
+        print(f"{total / args.spas:,.0f} bytes per spa")
+        print(f"{total / entities:,.0f} bytes per entity, including the spa's share")
+        print("Top allocation sites:")
+        for stat in after.compare_to(before, "lineno")[:10]:
+            print(f"  {stat.size_diff / args.spas:10,.0f} B/spa  {stat.traceback[0]}")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
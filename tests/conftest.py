@@ -0,0 +1,45 @@
+"""Shared test setup for the Arctic Spa tests."""
+
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+# Stub out homeassistant modules so we can import api.py without HA installed
+ha_mock = ModuleType("homeassistant")
+ha_mock.config_entries = MagicMock()
+ha_mock.const = MagicMock()
+ha_mock.const.CONF_API_KEY = "api_key"
+ha_mock.core = MagicMock()
+ha_mock.helpers = MagicMock()
+ha_mock.helpers.update_coordinator = MagicMock()
+ha_mock.helpers.entity = MagicMock()
+ha_mock.helpers.device_registry = MagicMock()
+ha_mock.helpers.aiohttp_client = MagicMock()
+ha_mock.helpers.entity_platform = MagicMock()
+ha_mock.components = MagicMock()
+for mod in [
+    "homeassistant",
+    "homeassistant.config_entries",
+    "homeassistant.const",
+    "homeassistant.core",
+    "homeassistant.exceptions",
+    "homeassistant.helpers",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.device_registry",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.typing",
+    "homeassistant.components",
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.switch",
+    "homeassistant.components.number",
+    "homeassistant.util",
+    "homeassistant.util.dt",
+    "voluptuous",
+]:
+    sys.modules.setdefault(mod, MagicMock())
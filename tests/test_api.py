@@ -1,53 +1,31 @@
 """Tests for the Arctic Spa API client."""
 
-import sys
-from types import ModuleType
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
-# Stub out homeassistant modules so we can import api.py without HA installed
-ha_mock = ModuleType("homeassistant")
-ha_mock.config_entries = MagicMock()
-ha_mock.const = MagicMock()
-ha_mock.const.CONF_API_KEY = "api_key"
-ha_mock.core = MagicMock()
-ha_mock.helpers = MagicMock()
-ha_mock.helpers.update_coordinator = MagicMock()
-ha_mock.helpers.entity = MagicMock()
-ha_mock.helpers.device_registry = MagicMock()
-ha_mock.helpers.aiohttp_client = MagicMock()
-ha_mock.helpers.entity_platform = MagicMock()
-ha_mock.components = MagicMock()
-for mod in [
-    "homeassistant",
-    "homeassistant.config_entries",
-    "homeassistant.const",
-    "homeassistant.core",
-    "homeassistant.exceptions",
-    "homeassistant.helpers",
-    "homeassistant.helpers.update_coordinator",
-    "homeassistant.helpers.entity",
-    "homeassistant.helpers.device_registry",
-    "homeassistant.helpers.aiohttp_client",
-    "homeassistant.helpers.entity_platform",
-    "homeassistant.components",
-    "homeassistant.components.sensor",
-    "homeassistant.components.binary_sensor",
-    "homeassistant.components.switch",
-    "homeassistant.components.number",
-]:
-    sys.modules.setdefault(mod, MagicMock())
-
-import aiohttp  # noqa: E402
-import pytest  # noqa: E402
-
-from custom_components.arctic_spa.api import (  # noqa: E402
+import aiohttp
+import pytest
+
+from custom_components.arctic_spa.api import (
     ArcticSpaApiError,
     ArcticSpaAuthError,
     ArcticSpaClient,
     ArcticSpaConnectionError,
+    ArcticSpaPayloadError,
+    LatencyStats,
     LightState,
     PumpState,
+    RequestPriority,
+    RequestScheduler,
     SpaStatus,
+    decode_status,
+)
+from custom_components.arctic_spa.transport import (
+    FakeSpa,
+    FakeSpaTransport,
+    TransportError,
+    create_session,
 )
 
 MOCK_STATUS_RESPONSE = {
@@ -76,13 +54,16 @@ MOCK_STATUS_RESPONSE = {
 # ---------------------------------------------------------------------------
 
 
-def _make_response(status: int = 200, json_data: dict | None = None) -> AsyncMock:
+def _make_response(
+    status: int = 200, json_data: dict | None = None, headers: dict | None = None
+) -> AsyncMock:
     """Return a mock aiohttp response."""
     response = AsyncMock()
     response.status = status
-    response.json = AsyncMock(
-        return_value=json_data if json_data is not None else MOCK_STATUS_RESPONSE
-    )
+    response.headers = headers or {}
+    body = json_data if json_data is not None else MOCK_STATUS_RESPONSE
+    response.json = AsyncMock(return_value=body)
+    response.read = AsyncMock(return_value=json.dumps(body).encode())
     return response
 
 
@@ -173,6 +154,240 @@ class TestSpaStatus:
         assert status.pump2 == "high"
 
 
+# ---------------------------------------------------------------------------
+# decode_status
+# ---------------------------------------------------------------------------
+
+
+class TestDecodeStatus:
+    """Tests for the validating status decoder."""
+
+    def test_valid_payload(self):
+        """A well-formed payload decodes to the same dict."""
+        assert decode_status(json.dumps(MOCK_STATUS_RESPONSE).encode()) == MOCK_STATUS_RESPONSE
+
+    def test_integer_ph_accepted(self):
+        """pH may arrive as a whole number."""
+        data = decode_status(json.dumps({**MOCK_STATUS_RESPONSE, "ph": 7}).encode())
+        assert data["ph"] == 7
+
+    def test_null_optional_field_accepted(self):
+        """JSON null in an optional field is treated like a missing key."""
+        data = decode_status(json.dumps({**MOCK_STATUS_RESPONSE, "orp": None}).encode())
+        assert "orp" not in data
+
+    def test_null_errors_read_as_empty(self):
+        """Null errors decode like a missing list, so the error count is zero."""
+        data = decode_status(json.dumps({**MOCK_STATUS_RESPONSE, "errors": None}).encode())
+        assert len(data.get("errors", [])) == 0
+        assert SpaStatus.from_dict(data).errors == []
+
+    def test_null_pump_defaults_to_off(self):
+        """A null pump state reads as off, not as running."""
+        data = decode_status(json.dumps({**MOCK_STATUS_RESPONSE, "pump1": None}).encode())
+        assert data.get("pump1", "off") == "off"
+        assert SpaStatus.from_dict(data).pump1 == "off"
+
+    def test_invalid_json(self):
+        """Non-JSON bodies are rejected."""
+        with pytest.raises(ArcticSpaPayloadError, match="Invalid JSON"):
+            decode_status(b"<html>Bad gateway</html>")
+
+    def test_not_an_object(self):
+        """A JSON array is rejected."""
+        with pytest.raises(ArcticSpaPayloadError, match="not a JSON object"):
+            decode_status(b"[]")
+
+    def test_missing_required_key(self):
+        """The connected flag is required."""
+        payload = {k: v for k, v in MOCK_STATUS_RESPONSE.items() if k != "connected"}
+        with pytest.raises(ArcticSpaPayloadError, match="missing 'connected'"):
+            decode_status(json.dumps(payload).encode())
+
+    def test_wrong_type(self):
+        """A string temperature is rejected rather than defaulted."""
+        payload = {**MOCK_STATUS_RESPONSE, "temperatureF": "100"}
+        with pytest.raises(ArcticSpaPayloadError, match="temperatureF"):
+            decode_status(json.dumps(payload).encode())
+
+    def test_bool_not_accepted_as_int(self):
+        """Booleans are not valid numbers."""
+        payload = {**MOCK_STATUS_RESPONSE, "orp": True}
+        with pytest.raises(ArcticSpaPayloadError, match="orp"):
+            decode_status(json.dumps(payload).encode())
+
+    def test_errors_must_be_strings(self):
+        """Every error code must be a string."""
+        payload = {**MOCK_STATUS_RESPONSE, "errors": ["E01", 2]}
+        with pytest.raises(ArcticSpaPayloadError, match="errors"):
+            decode_status(json.dumps(payload).encode())
+
+
+# ---------------------------------------------------------------------------
+# LatencyStats
+# ---------------------------------------------------------------------------
+
+
+class TestLatencyStats:
+    """Tests for the rolling latency window."""
+
+    def test_empty(self):
+        """No samples yields empty summary values."""
+        stats = LatencyStats()
+        assert stats.percentile(50) is None
+        assert stats.as_dict() == {
+            "count": 0,
+            "errors": 0,
+            "last": None,
+            "p50": None,
+            "p95": None,
+            "max": None,
+        }
+
+    def test_percentiles(self):
+        """Nearest-rank percentiles over the window."""
+        stats = LatencyStats()
+        for value in range(1, 101):
+            stats.record(value / 100)
+        assert stats.percentile(50) == 0.5
+        assert stats.percentile(95) == 0.95
+        assert stats.as_dict()["max"] == 1.0
+        assert stats.last == 1.0
+
+    def test_window_is_bounded(self):
+        """Old samples fall out of the window but still count."""
+        stats = LatencyStats(window=3)
+        for value in (10.0, 1.0, 2.0, 3.0):
+            stats.record(value)
+        assert stats.count == 4
+        assert stats.as_dict()["max"] == 3.0
+
+    def test_unbounded_window(self):
+        """Without a window every sample counts towards the percentiles."""
+        stats = LatencyStats(window=None)
+        for value in range(1, 201):
+            stats.record(float(value))
+        assert stats.percentile(50) == 100.0
+        assert stats.percentile(100) == 200.0
+
+    def test_histogram(self):
+        """Samples fall into the first bucket whose bound they do not exceed."""
+        stats = LatencyStats()
+        for value in (0.5, 1.0, 1.5, 7.0, 99.0):
+            stats.record(value)
+        assert stats.histogram((1, 2, 10)) == {"le_1": 2, "le_2": 1, "le_10": 1, "gt_10": 1}
+
+    def test_record_error(self):
+        """Errors are counted separately from samples."""
+        stats = LatencyStats()
+        stats.record_error()
+        assert stats.errors == 1
+        assert stats.count == 0
+
+
+# ---------------------------------------------------------------------------
+# RequestScheduler
+# ---------------------------------------------------------------------------
+
+
+class TestRequestScheduler:
+    """Tests for the priority request scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_command_preempts_in_flight_poll(self):
+        """A command cancels an in-flight poll, which is retried afterwards."""
+        scheduler = RequestScheduler()
+        order = []
+        poll_started = asyncio.Event()
+        attempts = 0
+
+        async def poll():
+            nonlocal attempts
+            attempts += 1
+            poll_started.set()
+            if attempts == 1:
+                await asyncio.sleep(10)
+            order.append("poll")
+            return "status"
+
+        async def command():
+            order.append("command")
+
+        poll_task = asyncio.create_task(scheduler.run(RequestPriority.POLL, poll))
+        await poll_started.wait()
+        await scheduler.run(RequestPriority.COMMAND, command)
+        assert await asyncio.wait_for(poll_task, 1) == "status"
+        assert order == ["command", "poll"]
+        assert attempts == 2
+        assert scheduler.preempted == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_waits_for_running_command(self):
+        """A poll does not start while a command is in flight."""
+        scheduler = RequestScheduler()
+        release = asyncio.Event()
+        order = []
+
+        async def command():
+            await release.wait()
+            order.append("command")
+
+        async def poll():
+            order.append("poll")
+
+        command_task = asyncio.create_task(scheduler.run(RequestPriority.COMMAND, command))
+        await asyncio.sleep(0)
+        poll_task = asyncio.create_task(scheduler.run(RequestPriority.POLL, poll))
+        await asyncio.sleep(0)
+        assert order == []
+        release.set()
+        await asyncio.gather(command_task, poll_task)
+        assert order == ["command", "poll"]
+
+    @pytest.mark.asyncio
+    async def test_queued_requests_start_in_priority_order(self):
+        """When a slot frees up, the most urgent queued request goes first."""
+        scheduler = RequestScheduler(max_concurrent=1)
+        release = asyncio.Event()
+        order = []
+
+        async def blocker():
+            await release.wait()
+
+        def record(name):
+            async def request():
+                order.append(name)
+
+            return request
+
+        blocking = asyncio.create_task(scheduler.run(RequestPriority.CONFIRM, blocker))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.create_task(scheduler.run(RequestPriority.POLL, record("poll"))),
+            asyncio.create_task(scheduler.run(RequestPriority.CONFIRM, record("confirm"))),
+            asyncio.create_task(scheduler.run(RequestPriority.COMMAND, record("command"))),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(blocking, *queued)
+        assert order == ["command", "confirm", "poll"]
+
+    @pytest.mark.asyncio
+    async def test_external_cancel_propagates(self):
+        """Cancelling the caller of a poll is not mistaken for preemption."""
+        scheduler = RequestScheduler()
+
+        async def poll():
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(scheduler.run(RequestPriority.POLL, poll))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert scheduler.preempted == 0
+
+
 # ---------------------------------------------------------------------------
 # GET request paths
 # ---------------------------------------------------------------------------
@@ -197,6 +412,32 @@ class TestGetRequests:
         data = await client.async_get_status_raw()
         assert data == MOCK_STATUS_RESPONSE
 
+    @pytest.mark.asyncio
+    async def test_get_records_latency(self):
+        """Successful GETs are recorded in get_stats."""
+        client = ArcticSpaClient("test_key", session=_make_session(_make_response()))
+        await client.async_get_status_raw()
+        assert client.get_stats.count == 1
+        assert client.get_stats.errors == 0
+
+    @pytest.mark.asyncio
+    async def test_get_error_counted(self):
+        """Failed GETs are counted as errors."""
+        client = ArcticSpaClient("test_key", session=_make_session(_make_response(status=500)))
+        with pytest.raises(ArcticSpaApiError):
+            await client.async_get_status_raw()
+        assert client.get_stats.count == 0
+        assert client.get_stats.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_get_malformed_payload_raises_payload_error(self):
+        """A mistyped status payload surfaces as ArcticSpaPayloadError."""
+        response = _make_response(json_data={**MOCK_STATUS_RESPONSE, "setpointF": "hot"})
+        client = ArcticSpaClient("test_key", session=_make_session(response))
+        with pytest.raises(ArcticSpaPayloadError):
+            await client.async_get_status_raw()
+        assert client.get_stats.errors == 1
+
     @pytest.mark.asyncio
     async def test_get_401_raises_auth_error(self):
         """HTTP 401 on GET raises ArcticSpaAuthError."""
@@ -254,6 +495,170 @@ class TestGetRequests:
             await client.async_get_status()
 
 
+# ---------------------------------------------------------------------------
+# Conditional requests
+# ---------------------------------------------------------------------------
+
+
+def _make_sequence_session(*responses: AsyncMock) -> MagicMock:
+    """Return a session whose successive GETs return the given responses."""
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    cms = []
+    for response in responses:
+        cm = AsyncMock()
+        cm.__aenter__ = AsyncMock(return_value=response)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        cms.append(cm)
+    session.get = MagicMock(side_effect=cms)
+    return session
+
+
+class TestConditionalRequests:
+    """Tests for ETag / Last-Modified handling."""
+
+    @pytest.mark.asyncio
+    async def test_etag_sent_and_304_reuses_data(self):
+        """A 304 returns the cached object and skips decoding."""
+        not_modified = _make_response(status=304)
+        session = _make_sequence_session(
+            _make_response(headers={"ETag": '"v1"'}),
+            not_modified,
+        )
+        client = ArcticSpaClient("test_key", session=session)
+        first = await client.async_get_status_raw()
+        second = await client.async_get_status_raw()
+        assert second is first
+        assert client.not_modified == 1
+        not_modified.read.assert_not_called()
+        first_headers = session.get.call_args_list[0].kwargs["headers"]
+        second_headers = session.get.call_args_list[1].kwargs["headers"]
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == '"v1"'
+        assert second_headers["Accept-Encoding"] == "gzip, deflate"
+
+    @pytest.mark.asyncio
+    async def test_last_modified_sent(self):
+        """Last-Modified is echoed back as If-Modified-Since."""
+        stamp = "Mon, 19 Oct 2026 10:00:00 GMT"
+        session = _make_sequence_session(
+            _make_response(headers={"Last-Modified": stamp}),
+            _make_response(status=304),
+        )
+        client = ArcticSpaClient("test_key", session=session)
+        await client.async_get_status_raw()
+        await client.async_get_status_raw()
+        assert session.get.call_args_list[1].kwargs["headers"]["If-Modified-Since"] == stamp
+
+    @pytest.mark.asyncio
+    async def test_parsed_status_reused_on_304(self):
+        """async_get_status returns the same SpaStatus object when not modified."""
+        session = _make_sequence_session(
+            _make_response(headers={"ETag": '"v1"'}),
+            _make_response(status=304),
+        )
+        client = ArcticSpaClient("test_key", session=session)
+        first = await client.async_get_status()
+        second = await client.async_get_status()
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_304_without_cache_is_error(self):
+        """A 304 with nothing cached is an API error."""
+        client = ArcticSpaClient("test_key", session=_make_session(_make_response(status=304)))
+        with pytest.raises(ArcticSpaApiError):
+            await client.async_get_status_raw()
+
+    @pytest.mark.asyncio
+    async def test_no_validators_means_unconditional(self):
+        """Without ETag or Last-Modified the request headers stay unconditional."""
+        session = _make_sequence_session(_make_response(), _make_response())
+        client = ArcticSpaClient("test_key", session=session)
+        await client.async_get_status_raw()
+        await client.async_get_status_raw()
+        assert "If-None-Match" not in session.get.call_args_list[1].kwargs["headers"]
+
+
+# ---------------------------------------------------------------------------
+# Hedged GETs
+# ---------------------------------------------------------------------------
+
+
+def _make_slow_then_fast_session(slow_seconds: float) -> MagicMock:
+    """Return a session whose first GET stalls and whose later GETs answer at once."""
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    calls = 0
+
+    def get(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        delay = slow_seconds if calls == 1 else 0
+
+        async def enter():
+            await asyncio.sleep(delay)
+            return _make_response(json_data={**MOCK_STATUS_RESPONSE, "temperatureF": calls})
+
+        cm = AsyncMock()
+        cm.__aenter__ = AsyncMock(side_effect=enter)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        return cm
+
+    session.get = MagicMock(side_effect=get)
+    return session
+
+
+def _warm_client(session: MagicMock) -> ArcticSpaClient:
+    """Return a hedging client with enough fast samples and budget to hedge."""
+    client = ArcticSpaClient("test_key", session=session, hedge=True)
+    for _ in range(20):
+        client.get_stats.record(0.01)
+    client._hedge_budget = 1.0
+    return client
+
+
+class TestHedgedRequests:
+    """Tests for hedged status GETs."""
+
+    @pytest.mark.asyncio
+    async def test_slow_get_is_hedged(self, monkeypatch):
+        """A GET slower than the threshold is raced by a second request that wins."""
+        monkeypatch.setattr("custom_components.arctic_spa.api._HEDGE_MIN_DELAY", 0.01)
+        session = _make_slow_then_fast_session(slow_seconds=5)
+        client = _warm_client(session)
+        data = await asyncio.wait_for(client.async_get_status_raw(), 1)
+        assert data["temperatureF"] == 2
+        assert client.hedged == 1
+        assert session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fast_get_not_hedged(self, monkeypatch):
+        """A GET that answers before the threshold sends no hedge."""
+        monkeypatch.setattr("custom_components.arctic_spa.api._HEDGE_MIN_DELAY", 0.5)
+        session = _make_slow_then_fast_session(slow_seconds=0)
+        client = _warm_client(session)
+        assert (await client.async_get_status_raw())["temperatureF"] == 1
+        assert client.hedged == 0
+        assert session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_budget(self, monkeypatch):
+        """Hedging is skipped until enough budget has accrued."""
+        monkeypatch.setattr("custom_components.arctic_spa.api._HEDGE_MIN_DELAY", 0.01)
+        session = _make_slow_then_fast_session(slow_seconds=0.05)
+        client = _warm_client(session)
+        client._hedge_budget = 0.0
+        assert (await client.async_get_status_raw())["temperatureF"] == 1
+        assert client.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_disabled(self):
+        """Hedging is opt-in."""
+        client = ArcticSpaClient("test_key", session=_make_session(_make_response()))
+        await client.async_get_status_raw()
+        assert client.hedged == 0
+
+
 # ---------------------------------------------------------------------------
 # PUT request paths
 # ---------------------------------------------------------------------------
@@ -337,6 +742,35 @@ class TestPutRequests:
         result = await client.async_set_boost(False)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_put_records_latency(self):
+        """Successful PUTs are recorded in put_stats."""
+        client = ArcticSpaClient("test_key", session=_make_session(_make_response()))
+        await client.async_set_lights(LightState.ON)
+        assert client.put_stats.count == 1
+        assert client.get_stats.count == 0
+
+    @pytest.mark.asyncio
+    async def test_put_notifies_command_listener(self):
+        """The command listener sees each PUT and its outcome."""
+        client = ArcticSpaClient("test_key", session=_make_session(_make_response()))
+        listener = MagicMock()
+        client.command_listener = listener
+        await client.async_set_temperature(99)
+        listener.assert_called_once_with("temperature", {"setpointF": 99}, None)
+
+    @pytest.mark.asyncio
+    async def test_put_failure_notifies_command_listener(self):
+        """Failed PUTs pass the error to the command listener before raising."""
+        client = ArcticSpaClient("test_key", session=_make_session(_make_response(status=500)))
+        listener = MagicMock()
+        client.command_listener = listener
+        with pytest.raises(ArcticSpaApiError):
+            await client.async_set_lights(LightState.ON)
+        endpoint, payload, err = listener.call_args.args
+        assert (endpoint, payload) == ("lights", {"state": "on"})
+        assert isinstance(err, ArcticSpaApiError)
+
     @pytest.mark.asyncio
     async def test_put_401_raises_auth_error(self):
         """HTTP 401 on PUT raises ArcticSpaAuthError."""
@@ -420,32 +854,140 @@ class TestSessionLifecycle:
         mock_session.close = AsyncMock()
 
         with patch(
-            "custom_components.arctic_spa.api.aiohttp.ClientSession", return_value=mock_session
+            "custom_components.arctic_spa.transport.aiohttp.ClientSession",
+            return_value=mock_session,
         ):
             client = ArcticSpaClient("test_key")  # no session → will create one
-            await client._get_session()  # trigger session creation
+            await client._transport._get_session()  # trigger session creation
             await client.close()
 
         mock_session.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_session_recreates_closed_session(self):
-        """_get_session() creates a fresh session when the current one is closed."""
+        """The transport creates a fresh session when the current one is closed."""
         original_session = _make_session(_make_response())
         original_session.closed = True  # simulate a closed session
 
         new_session = _make_session(_make_response())
 
         with patch(
-            "custom_components.arctic_spa.api.aiohttp.ClientSession", return_value=new_session
+            "custom_components.arctic_spa.transport.aiohttp.ClientSession", return_value=new_session
         ):
             client = ArcticSpaClient("test_key", session=original_session)
-            session = await client._get_session()
+            session = await client._transport._get_session()
 
         assert session is new_session
 
+    @pytest.mark.asyncio
+    async def test_headers_and_timeout_reused(self):
+        """Requests share one headers dict and one timeout object."""
+        session = _make_session(_make_response())
+        client = ArcticSpaClient("test_key", session=session)
+        await client.async_get_status_raw()
+        await client.async_get_status_raw()
+        first, second = session.get.call_args_list
+        assert first.kwargs["headers"] is second.kwargs["headers"]
+        assert first.kwargs["timeout"] is second.kwargs["timeout"]
+        assert first.kwargs["headers"]["X-API-KEY"] == "test_key"
+
+    @pytest.mark.asyncio
+    async def test_create_session_tunes_connector(self):
+        """create_session sizes the keep-alive pool and enables DNS caching."""
+        session = create_session(pool_size=6, poll_interval=300)
+        try:
+            assert session.connector.limit_per_host == 6
+            assert session.connector._keepalive_timeout > 300
+            assert session.connector.use_dns_cache
+        finally:
+            await session.close()
+
     @pytest.mark.asyncio
     async def test_close_noop_when_no_session(self):
         """close() with no session ever created does not raise."""
         client = ArcticSpaClient("test_key")
         await client.close()  # should not raise
+
+
+# ---------------------------------------------------------------------------
+# Runtime tuning
+# ---------------------------------------------------------------------------
+
+
+class _FlakyTransport(FakeSpaTransport):
+    """Fake spa whose first ``failures`` requests fail to connect."""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+        self.timeouts: list[float] = []
+
+    async def request(self, method, url, headers, timeout, json_payload=None):
+        self.timeouts.append(timeout)
+        if self.failures:
+            self.failures -= 1
+            raise TransportError("connection reset")
+        return await super().request(method, url, headers, timeout, json_payload)
+
+
+class TestRuntimeTuning:
+    """Timeouts and retries can be changed on a live client."""
+
+    @pytest.mark.asyncio
+    async def test_poll_retries_with_backoff(self):
+        """Connection failures are retried with a doubling delay."""
+        transport = _FlakyTransport(failures=2)
+        client = ArcticSpaClient("test_key", transport=transport)
+        client.poll_retries = 2
+        client.retry_delay = 0.5
+        with patch("asyncio.sleep", AsyncMock()) as sleep:
+            data = await client.async_get_status_raw()
+        assert data["temperatureF"] == 100
+        assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+        assert client.get_stats.errors == 2
+
+    @pytest.mark.asyncio
+    async def test_no_retries_by_default(self):
+        """Without retries a connection failure fails the poll."""
+        client = ArcticSpaClient("test_key", transport=_FlakyTransport(failures=1))
+        with pytest.raises(ArcticSpaConnectionError):
+            await client.async_get_status_raw()
+
+    @pytest.mark.asyncio
+    async def test_retries_run_out(self):
+        """The last failure is raised once the retries are used up."""
+        client = ArcticSpaClient("test_key", transport=_FlakyTransport(failures=3))
+        client.poll_retries = 2
+        client.retry_delay = 0
+        with pytest.raises(ArcticSpaConnectionError):
+            await client.async_get_status_raw()
+
+    @pytest.mark.asyncio
+    async def test_timeouts_apply_to_next_request(self):
+        """Changed timeouts are used from the next request on."""
+        transport = _FlakyTransport(failures=0)
+        client = ArcticSpaClient("test_key", transport=transport)
+        await client.async_get_status_raw()
+        await client.async_set_lights(LightState.ON)
+        client.get_timeout = 30
+        client.put_timeout = 5
+        await client.async_get_status_raw()
+        await client.async_set_lights(LightState.OFF)
+        assert transport.timeouts == [15, 10, 30, 5]
+
+    @pytest.mark.asyncio
+    async def test_set_api_key_on_live_client(self):
+        """A new key is used from the next request, which is unconditional."""
+        transport = FakeSpaTransport(FakeSpa(), api_key="old_key")
+        client = ArcticSpaClient("old_key", transport=transport)
+        await client.async_get_status_raw()
+        transport.api_key = "new_key"
+        with pytest.raises(ArcticSpaAuthError):
+            await client.async_get_status_raw()
+
+        client.set_api_key("new_key")
+        data = await client.async_get_status_raw()
+        assert data["temperatureF"] == 100
+        assert client.not_modified == 0
+        await client.async_set_lights(LightState.ON)
+        assert transport.spa.state["lights"] == "on"
@@ -0,0 +1,46 @@
+"""Tests for the raw status capture."""
+
+import gzip
+
+from custom_components.arctic_spa.capture import StatusCapture, read_capture
+
+
+def test_buffered_until_written(tmp_path):
+    """Appended records stay in memory until drained and written."""
+    capture = StatusCapture(tmp_path / "spa.jsonl.gz", max_bytes=1 << 20, backups=2)
+    capture.append(1.0, {"connected": True})
+    assert len(capture) == 1
+    assert capture.files() == []
+
+    capture.write(capture.drain())
+    assert len(capture) == 0
+    assert list(read_capture(capture.files())) == [(1.0, {"connected": True})]
+
+
+def test_batches_append_to_one_stream(tmp_path):
+    """Each write adds a gzip member that reads back as one stream."""
+    capture = StatusCapture(tmp_path / "spa.jsonl.gz", max_bytes=1 << 20, backups=2)
+    capture.write([(1.0, {"connected": True})])
+    capture.write([(2.0, {"connected": False}), (3.0, {"connected": True})])
+    with gzip.open(capture.path, "rt") as file:
+        assert len(file.readlines()) == 3
+    assert [timestamp for timestamp, _ in read_capture(capture.files())] == [1.0, 2.0, 3.0]
+
+
+def test_rotation_keeps_backups_in_order(tmp_path):
+    """Full files rotate to numbered backups and the oldest is dropped."""
+    capture = StatusCapture(tmp_path / "spa.jsonl.gz", max_bytes=1, backups=2)
+    for timestamp in range(4):
+        capture.write([(float(timestamp), {"connected": True})])
+    files = capture.files()
+    assert [path.name for path in files] == ["spa.jsonl.gz.2", "spa.jsonl.gz.1"]
+    assert [timestamp for timestamp, _ in read_capture(files)] == [2.0, 3.0]
+
+
+def test_remove(tmp_path):
+    """remove() deletes the capture and its backups."""
+    capture = StatusCapture(tmp_path / "spa.jsonl.gz", max_bytes=1, backups=2)
+    capture.write([(1.0, {})])
+    capture.write([(2.0, {})])
+    capture.remove()
+    assert capture.files() == []
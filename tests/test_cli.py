@@ -0,0 +1,95 @@
+"""Tests for the Arctic Spa command line tool."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.arctic_spa import cli
+
+STATUS = {"connected": True, "temperatureF": 101, "setpointF": 102}
+
+
+@pytest.fixture
+async def base_url():
+    """Serve a minimal /status stand-in and return its API root."""
+
+    async def status(request):
+        if request.headers.get("X-API-KEY") == "bad_key":
+            return web.Response(status=401)
+        return web.json_response(STATUS)
+
+    app = web.Application()
+    app.router.add_get("/v2/spa/status", status)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("/v2/spa"))
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_poll_records_payloads(base_url, tmp_path, capsys):
+    """poll prints per-request latency and appends payloads to the record file."""
+    record = tmp_path / "status.jsonl"
+    args = ["--api-key", "key_1234", "--base-url", base_url]
+    args += ["poll", "--count", "2", "--interval", "0", "--record", str(record)]
+    assert await cli.async_main(args) == 0
+    lines = [json.loads(line) for line in record.read_text().splitlines()]
+    assert [line["status"] for line in lines] == [STATUS, STATUS]
+    assert all(line["spa"] == "…1234" for line in lines)
+    assert "ok=2 errors=0" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_load_reports_totals(base_url, capsys):
+    """load sends the requested number of GETs per spa."""
+    args = ["--api-key", "key_a", "--api-key", "key_b", "--base-url", base_url]
+    args += ["load", "--requests", "10", "--concurrency", "3"]
+    assert await cli.async_main(args) == 0
+    out = capsys.readouterr().out
+    assert "20 requests" in out
+    assert out.count("ok=10 errors=0") == 2
+
+
+@pytest.mark.asyncio
+async def test_load_runs_every_worker_concurrently(capsys):
+    """load keeps --concurrency requests in flight and counts all of them."""
+    in_flight = peak = 0
+
+    async def status(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response(STATUS)
+
+    app = web.Application()
+    app.router.add_get("/v2/spa/status", status)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        args = ["--api-key", "key_a", "--base-url", str(server.make_url("/v2/spa"))]
+        args += ["load", "--requests", "240", "--concurrency", "8"]
+        assert await cli.async_main(args) == 0
+    finally:
+        await server.close()
+    assert peak == 8
+    assert "ok=240 errors=0" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio
+async def test_failures_set_exit_code(base_url, capsys):
+    """A spa with no successful request makes the tool exit non-zero."""
+    args = ["--api-key", "bad_key", "--base-url", base_url, "poll"]
+    assert await cli.async_main(args) == 1
+    assert "Invalid API key" in capsys.readouterr().out
+
+
+def test_missing_api_key_is_an_error(monkeypatch):
+    """With neither --api-key nor ARCTIC_SPA_API_KEYS the tool exits with usage."""
+    monkeypatch.delenv("ARCTIC_SPA_API_KEYS", raising=False)
+    with pytest.raises(SystemExit):
+        cli.main(["poll"])
@@ -0,0 +1,156 @@
+"""Tests for command tracking, confirm polls and scenes against the simulated spa."""
+
+import pytest
+
+from custom_components.arctic_spa.api import (
+    ArcticSpaClient,
+    ArcticSpaConnectionError,
+    LatencyStats,
+    PumpState,
+)
+from custom_components.arctic_spa.commands import CommandTracker, async_send_scene
+from custom_components.arctic_spa.transport import FakeSpaTransport
+
+# Short stand-ins for CONFIRM_POLL_DELAYS so the tests run in well under a second
+DELAYS = (0.05, 0.1, 0.2)
+
+
+@pytest.fixture
+def tracker():
+    """Return an empty tracker with a 180 second timeout."""
+    return CommandTracker(LatencyStats(), 180)
+
+
+class TestCommandTracker:
+    """Tests for tracking commands until the status reflects them."""
+
+    def test_confirmed_command_records_latency(self, tracker):
+        """A command is confirmed once every expected field matches."""
+        tracker.track({"lights": "on", "pump1": "high"}, sent=100)
+        assert tracker.resolve({"lights": "on", "pump1": "off"}, now=101) == []
+        assert len(tracker.pending) == 1
+        assert tracker.resolve({"lights": "on", "pump1": "high"}, now=102.5) == []
+        assert tracker.pending == []
+        assert tracker.stats.last == 2.5
+
+    def test_newer_command_supersedes_older(self, tracker):
+        """A command replaces pending commands for any of the same fields."""
+        tracker.track({"lights": "on"}, sent=1)
+        tracker.track({"pump1": "high"}, sent=2)
+        tracker.track({"lights": "off", "pump2": "low"}, sent=3)
+        assert [command.expected for command in tracker.pending] == [
+            {"pump1": "high"},
+            {"lights": "off", "pump2": "low"},
+        ]
+
+    def test_unconfirmed_command_times_out(self, tracker):
+        """A command unconfirmed after the timeout is dropped, returned and counted."""
+        tracker.track({"setpointF": 104}, sent=0)
+        assert tracker.resolve({"setpointF": 100}, now=180) == []
+        ((command, elapsed),) = tracker.resolve({"setpointF": 100}, now=181)
+        assert command.expected == {"setpointF": 104}
+        assert elapsed == 181
+        assert tracker.pending == []
+        assert tracker.stats.errors == 1
+
+
+class TestConfirmPolls:
+    """Tests for the confirm-poll loop, driven against a spa that lags the cloud."""
+
+    @staticmethod
+    async def _send_and_confirm(tracker, fake):
+        client = ArcticSpaClient("key", transport=fake)
+        await client.async_set_lights("on")
+        tracker.track({"lights": "on"}, sent=0)
+        await tracker.async_confirm(
+            client.async_get_status_raw, lambda data: tracker.resolve(data, now=1), DELAYS
+        )
+        return [request for request in fake.requests if request[0] == "GET"]
+
+    @pytest.mark.asyncio
+    async def test_stops_once_confirmed(self, tracker):
+        """Polling stops at the first status reflecting the command."""
+        fake = FakeSpaTransport(apply_delay=0.1)
+        polls = await self._send_and_confirm(tracker, fake)
+        assert len(polls) == 2
+        assert tracker.pending == []
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_the_schedule(self, tracker):
+        """A command the spa has not applied stays pending for the regular poll."""
+        fake = FakeSpaTransport(apply_delay=10)
+        polls = await self._send_and_confirm(tracker, fake)
+        assert len(polls) == len(DELAYS)
+        assert len(tracker.pending) == 1
+
+    @pytest.mark.asyncio
+    async def test_stops_on_error(self, tracker):
+        """A failed confirm poll ends the loop quietly."""
+        fake = FakeSpaTransport()
+        client = ArcticSpaClient("key", transport=fake)
+        tracker.track({"lights": "on"}, sent=0)
+        fake.offline = True
+        statuses = []
+        await tracker.async_confirm(client.async_get_status_raw, statuses.append, DELAYS)
+        assert statuses == []
+        assert fake.requests == [("GET", "status")]
+
+
+class TestSendScene:
+    """Tests for sending several settings at once."""
+
+    @pytest.mark.asyncio
+    async def test_applies_every_setting(self):
+        """Every setting reaches the spa and is expected in the status."""
+        fake = FakeSpaTransport(latency=0.01)
+        client = ArcticSpaClient("key", transport=fake)
+        expected, errors = await async_send_scene(
+            client,
+            client.async_set_boost,
+            {"filtration_duration": 4, "filtration_frequency": 2},
+            lights=True,
+            pump2=PumpState.LOW,
+            setpoint=103,
+            filtration_frequency=3,
+            boost=True,
+        )
+        assert errors == []
+        assert expected == {
+            "lights": "on",
+            "pump2": "low",
+            "setpointF": 103,
+            "filtration_duration": 4,
+            "filtration_frequency": 3,
+        }
+        assert {key: fake.spa.state[key] for key in expected} == expected
+        assert fake.spa.boost
+
+    @pytest.mark.asyncio
+    async def test_boost_after_setpoint(self):
+        """Boost is only sent once the new setpoint has been accepted."""
+        fake = FakeSpaTransport(latency=0.01)
+        client = ArcticSpaClient("key", transport=fake)
+        setpoints_at_boost = []
+
+        async def set_boost(on):
+            setpoints_at_boost.append(fake.spa.state["setpointF"])
+            await client.async_set_boost(on)
+
+        await async_send_scene(client, set_boost, {}, lights=True, setpoint=104, boost=True)
+        assert setpoints_at_boost == [104]
+
+    @pytest.mark.asyncio
+    async def test_failed_setpoint_skips_boost(self):
+        """Boost is not sent when the setpoint change fails."""
+        fake = FakeSpaTransport()
+        client = ArcticSpaClient("key", transport=fake)
+        fake.offline = True
+        boosts = []
+
+        async def set_boost(on):
+            boosts.append(on)
+
+        expected, errors = await async_send_scene(client, set_boost, {}, setpoint=104, boost=True)
+        assert expected == {}
+        assert [type(error) for error in errors] == [ArcticSpaConnectionError]
+        assert boosts == []
@@ -0,0 +1,23 @@
+"""Tests for entity profiles."""
+
+from custom_components.arctic_spa.const import (
+    CONF_ENTITY_PROFILE,
+    PROFILE_FULL,
+    PROFILE_MINIMAL,
+    PROFILE_STANDARD,
+)
+from custom_components.arctic_spa.entity import excluded_keys
+
+
+def test_entries_without_profile_keep_everything():
+    """Entries created before profiles existed keep every entity."""
+    assert excluded_keys({}) == frozenset()
+    assert excluded_keys({CONF_ENTITY_PROFILE: PROFILE_FULL}) == frozenset()
+
+
+def test_profiles_nest():
+    """Each smaller profile leaves out everything the larger one does."""
+    standard = excluded_keys({CONF_ENTITY_PROFILE: PROFILE_STANDARD})
+    minimal = excluded_keys({CONF_ENTITY_PROFILE: PROFILE_MINIMAL})
+    assert standard
+    assert standard < minimal
@@ -0,0 +1,120 @@
+"""Tests for the heating model and pre-heat planner."""
+
+import pytest
+
+from custom_components.arctic_spa.heating import (
+    BOOST,
+    HEAT,
+    IDLE,
+    PRIOR_RATES,
+    HeatingModel,
+    plan_ready,
+)
+
+HOUR = 3600
+
+
+def _heat(model, start, minutes, rate, boost=False, temperature=90.0, setpoint=104):
+    """Feed one sample a minute of water heating at ``rate`` °F per hour."""
+    for minute in range(minutes + 1):
+        model.observe(start + minute * 60, temperature + rate * minute / 60, setpoint, boost)
+
+
+def test_new_model_uses_priors():
+    """Without samples every rate is its prior."""
+    model = HeatingModel()
+    assert {mode: model.rate(mode) for mode in PRIOR_RATES} == PRIOR_RATES
+
+
+def test_model_learns_heating_rate():
+    """Rates move from the prior towards what the spa actually does."""
+    model = HeatingModel()
+    _heat(model, 0, 600, 8.0, setpoint=200)
+    assert 7.0 < model.rate(HEAT) < 8.0
+    assert model.rate(BOOST) == PRIOR_RATES[BOOST]
+    _heat(model, 10 * HOUR, 600, 10.0, boost=True, setpoint=200)
+    assert 9.0 < model.rate(BOOST) < 10.0
+
+
+def test_model_learns_cooling_and_ignores_holding():
+    """Water above the setpoint teaches the idle rate; holding teaches nothing."""
+    model = HeatingModel()
+    assert not model.observe(0, 100, 100, False)
+    assert not model.observe(60, 100, 100, False)
+    _heat(model, HOUR, 600, -2.0, temperature=100.0, setpoint=80)
+    assert -2.0 < model.rate(IDLE) < -1.5
+    assert model.rate(HEAT) == PRIOR_RATES[HEAT]
+
+
+def test_model_ignores_gaps_and_missing_values():
+    """Samples far apart or without a temperature are not learned from."""
+    model = HeatingModel()
+    model.observe(0, 90, 104, False)
+    assert not model.observe(HOUR, 95, 104, False)
+    assert not model.observe(HOUR + 60, None, 104, False)
+    assert not model.observe(HOUR + 120, 96, 104, False)
+    assert model.rate(HEAT) == PRIOR_RATES[HEAT]
+
+
+def test_model_round_trips_through_dict():
+    """A model restored from as_dict has the same rates."""
+    model = HeatingModel()
+    _heat(model, 0, 300, 7.0)
+    restored = HeatingModel(model.as_dict())
+    assert restored.rate(HEAT) == model.rate(HEAT)
+    assert restored.as_dict() == model.as_dict()
+
+
+def test_plan_starts_as_late_as_possible():
+    """7 °F at 4 °F/h takes 1.75 h, so a 3 h window starts heating after 1.25 h."""
+    model = HeatingModel({"sums": {IDLE: [0.0, 1000.0]}})  # water holds its temperature
+    plan = plan_ready(model, 0, 3 * HOUR, 95, 95, 102)
+    assert plan.start == pytest.approx(1.25 * HOUR, abs=1)
+    assert not plan.boost
+    assert plan.expected_ready == 3 * HOUR
+
+
+def test_plan_accounts_for_cooling_and_margin():
+    """Cooling before the start and the margin both move the start earlier."""
+    model = HeatingModel()
+    plain = plan_ready(model, 0, 6 * HOUR, 95, 80, 102)
+    held = plan_ready(model, 0, 6 * HOUR, 95, 95, 102)
+    padded = plan_ready(model, 0, 6 * HOUR, 95, 95, 102, margin=600)
+    assert plain.start < held.start
+    assert padded.start == pytest.approx(held.start - 600, abs=1)
+
+
+def test_plan_escalates_to_boost():
+    """Boost is used only when normal heating cannot make it in time."""
+    model = HeatingModel()
+    plan = plan_ready(model, 0, 2 * HOUR, 95, 95, 104)
+    assert plan.boost
+    assert plan.start > 0
+    assert not plan_ready(model, 0, 2 * HOUR, 95, 95, 100).boost
+    assert plan_ready(model, 0, 2 * HOUR, 95, 95, 100, boost=True).boost
+
+
+def test_plan_too_late_starts_now():
+    """When even boost is too slow the plan starts now and says when it will be ready."""
+    model = HeatingModel()
+    plan = plan_ready(model, 0, HOUR, 90, 90, 102)
+    assert plan.start == 0
+    assert plan.boost
+    assert plan.expected_ready == pytest.approx(2 * HOUR)
+    assert not plan_ready(model, 0, HOUR, 90, 90, 102, boost=False).boost
+
+
+def test_plan_heated():
+    """A plan is done at its target temperature or once its expected ready time passes."""
+    plan = plan_ready(HeatingModel(), 0, HOUR, 90, 90, 102)
+    assert not plan.heated(HOUR, 101)
+    assert not plan.heated(HOUR, None)
+    assert plan.heated(HOUR, 102)
+    assert plan.heated(plan.expected_ready, 95)
+
+
+def test_plan_already_at_target():
+    """A spa already at the target starts at the deadline without boost."""
+    plan = plan_ready(HeatingModel(), 0, HOUR, 102, 102, 102)
+    assert plan.start == pytest.approx(HOUR, abs=1)
+    assert not plan.boost
@@ -0,0 +1,61 @@
+"""Tests for the Arctic Spa offline command journal."""
+
+from custom_components.arctic_spa.journal import CommandJournal
+
+
+class TestCommandJournal:
+    """Tests for CommandJournal."""
+
+    def test_last_value_wins_per_endpoint(self):
+        """A newer command for the same endpoint replaces the older one."""
+        journal = CommandJournal(ttl=60)
+        journal.record("lights", {"state": "on"}, now=0)
+        journal.record("lights", {"state": "off"}, now=1)
+        entries = journal.pending(now=2)
+        assert len(entries) == 1
+        assert entries[0].payload == {"state": "off"}
+
+    def test_pending_in_queue_order(self):
+        """Commands replay in the order they were (last) queued."""
+        journal = CommandJournal(ttl=60)
+        journal.record("lights", {"state": "on"}, now=0)
+        journal.record("temperature", {"setpointF": 95}, now=1)
+        journal.record("lights", {"state": "off"}, now=2)
+        assert [entry.endpoint for entry in journal.pending(now=3)] == ["temperature", "lights"]
+
+    def test_identical_command_keeps_its_age(self):
+        """Re-recording the same command does not extend its lifetime."""
+        journal = CommandJournal(ttl=60)
+        assert journal.record("boost", {"state": "on"}, now=0)
+        assert not journal.record("boost", {"state": "on"}, now=50)
+        assert journal.pending(now=61) == []
+
+    def test_expired_commands_dropped(self):
+        """Commands older than the TTL are dropped."""
+        journal = CommandJournal(ttl=60)
+        journal.record("lights", {"state": "on"}, now=0)
+        journal.record("pumps/1", {"state": "high"}, now=30)
+        assert [entry.endpoint for entry in journal.pending(now=70)] == ["pumps/1"]
+        assert len(journal) == 1
+
+    def test_discard(self):
+        """Discarding removes the endpoint's command and reports whether it existed."""
+        journal = CommandJournal(ttl=60)
+        journal.record("lights", {"state": "on"}, now=0)
+        assert journal.discard("lights")
+        assert not journal.discard("lights")
+        assert len(journal) == 0
+
+    def test_round_trip(self):
+        """Saved entries restore with their order and sequence numbers."""
+        journal = CommandJournal(ttl=60)
+        journal.record("lights", {"state": "on"}, now=0)
+        journal.record("temperature", {"setpointF": 95}, now=1)
+        restored = CommandJournal(ttl=60, entries=journal.as_list())
+        assert restored.as_list() == journal.as_list()
+        restored.record("boost", {"state": "on"}, now=2)
+        assert [entry.endpoint for entry in restored.pending(now=3)] == [
+            "lights",
+            "temperature",
+            "boost",
+        ]
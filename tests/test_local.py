@@ -0,0 +1,174 @@
+"""Tests for the local bridge transport and its stand-in server."""
+
+import asyncio
+
+import pytest
+
+from custom_components.arctic_spa import local as local_module
+from custom_components.arctic_spa.api import ArcticSpaClient, decode_status
+from custom_components.arctic_spa.local import (
+    DEFAULT_LOCAL_PORT,
+    LocalSpaServer,
+    LocalTransport,
+    parse_address,
+)
+from custom_components.arctic_spa.transport import (
+    FakeSpaTransport,
+    FallbackTransport,
+    TransportError,
+)
+
+
+@pytest.fixture
+async def server():
+    """Start a stand-in bridge on a free port."""
+    server = LocalSpaServer()
+    await server.start()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def local(server):
+    """Return a transport connected to the stand-in bridge."""
+    transport = LocalTransport(server.host, server.port)
+    yield transport
+    await transport.close()
+
+
+def test_parse_address():
+    """A port is optional and defaults to the bridge's port."""
+    assert parse_address("192.168.1.20") == ("192.168.1.20", DEFAULT_LOCAL_PORT)
+    assert parse_address(" spa.local:9000 ") == ("spa.local", 9000)
+
+
+@pytest.mark.asyncio
+async def test_client_polls_and_commands_over_bridge(server, local):
+    """The API client works unchanged over the local transport."""
+    client = ArcticSpaClient("key", transport=local)
+    status = await client.async_get_status()
+    assert status.temperature_f == 100
+    await client.async_set_temperature(103)
+    assert server.spa.state["setpointF"] == 103
+    assert (await client.async_get_status_raw())["setpointF"] == 103
+
+
+@pytest.mark.asyncio
+async def test_state_changes_are_pushed(server, local):
+    """Commands and changed readings are pushed to connected clients."""
+    pushed = []
+    received = asyncio.Event()
+
+    def listener(body):
+        pushed.append(decode_status(body))
+        received.set()
+
+    local.push_listener = listener
+    client = ArcticSpaClient("key", transport=local)
+    await client.async_set_lights("on")
+    await received.wait()
+    assert pushed[-1]["lights"] == "on"
+
+    received.clear()
+    server.update(temperatureF=97)
+    await asyncio.wait_for(received.wait(), 1)
+    assert pushed[-1]["temperatureF"] == 97
+    assert local.pushes == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_endpoint_is_not_found(local):
+    """The bridge answers unknown endpoints with 404."""
+    response = await local.request("PUT", "http://x/spa/sauna", {}, 1, {"state": "on"})
+    assert response.status == 404
+
+
+@pytest.mark.asyncio
+async def test_reconnects_after_the_bridge_restarts(server, local):
+    """A dropped connection fails pending requests and the next one reconnects."""
+    await local.request("GET", "http://x/spa/status", {}, 1)
+    port = server.port
+    await server.close()
+    await asyncio.sleep(0.01)
+    assert not local.connected
+    with pytest.raises(TransportError):
+        await local.request("GET", "http://x/spa/status", {}, 1)
+
+    restarted = LocalSpaServer(port=port)
+    await restarted.start()
+    try:
+        response = await local.request("GET", "http://x/spa/status", {}, 1)
+        assert response.status == 200
+    finally:
+        await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_pushes_resume_after_the_bridge_restarts(server, local, monkeypatch):
+    """With a push listener set, the transport reconnects without waiting for a request."""
+    monkeypatch.setattr(local_module, "_RECONNECT_DELAY", 0.01)
+    pushed = asyncio.Queue()
+    local.push_listener = lambda body: pushed.put_nowait(decode_status(body))
+    while not local.connected:
+        await asyncio.sleep(0.01)
+    port = server.port
+    await server.close()
+
+    restarted = LocalSpaServer(port=port)
+    await restarted.start()
+    try:
+        while not local.connected:
+            await asyncio.sleep(0.01)
+        restarted.update(temperatureF=98)
+        data = await asyncio.wait_for(pushed.get(), 1)
+        assert data["temperatureF"] == 98
+    finally:
+        await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_malformed_response_drops_the_connection():
+    """A response header without a status fails the request instead of killing the reader."""
+
+    async def handle(reader, writer):
+        await reader.readline()
+        await reader.readline()
+        writer.write(b'{"id": 1}\n\n')
+        await writer.drain()
+
+    bridge = await asyncio.start_server(handle, "127.0.0.1", 0)
+    transport = LocalTransport("127.0.0.1", bridge.sockets[0].getsockname()[1])
+    try:
+        with pytest.raises(TransportError, match="closed the connection"):
+            await transport.request("GET", "http://x/spa/status", {}, 1)
+        assert not transport.connected
+    finally:
+        await transport.close()
+        bridge.close()
+        await bridge.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_fallback_when_bridge_unreachable(server):
+    """Requests fall back to the cloud and skip the bridge until retry_after."""
+    port = server.port
+    await server.close()
+    cloud = FakeSpaTransport()
+    transport = FallbackTransport(LocalTransport("127.0.0.1", port), cloud, retry_after=60)
+    client = ArcticSpaClient("key", transport=transport)
+    await client.async_get_status_raw()
+    await client.async_set_lights("on")
+    assert transport.using_fallback
+    assert transport.fallbacks == 2
+    assert cloud.spa.state["lights"] == "on"
+
+    transport._retry_at = 0
+    restarted = LocalSpaServer(port=port)
+    await restarted.start()
+    try:
+        await client.async_set_lights("off")
+        assert restarted.spa.state["lights"] == "off"
+        assert transport.fallbacks == 2
+    finally:
+        await transport.close()
+        await restarted.close()
@@ -0,0 +1,67 @@
+"""Tests for the on-demand profiler."""
+
+import pstats
+
+from custom_components.arctic_spa.profiling import Profiler
+
+
+def _work():
+    return sum(range(1000))
+
+
+def test_counts_runs():
+    """Each profiled operation counts as one run."""
+    profiler = Profiler(2)
+    with profiler.run():
+        _work()
+    assert not profiler.finished
+    with profiler.run():
+        _work()
+    assert profiler.finished
+
+
+def test_overlapping_runs_count_once():
+    """Operations that overlap share a single run."""
+    profiler = Profiler(2)
+    with profiler.run():
+        with profiler.run():
+            _work()
+        assert not profiler.finished
+    assert profiler.remaining == 1
+
+
+def test_write(tmp_path):
+    """The .prof file loads in pstats and the summary names profiled functions."""
+    profiler = Profiler(1)
+    with profiler.run():
+        _work()
+    prof, summary = profiler.write(tmp_path / "profiles" / "spa")
+    assert prof.name == "spa.prof"
+    assert pstats.Stats(str(prof)).total_calls > 0
+    assert "_work" in summary.read_text()
+
+
+def test_enable_failure_runs_unprofiled(monkeypatch):
+    """An operation still runs when another profiler is already active."""
+    profiler = Profiler(2)
+    error = ValueError("Another profiling tool is already active")
+
+    def enable():
+        raise error
+
+    monkeypatch.setattr(profiler._profile, "enable", enable)
+    with profiler.run():
+        assert _work() == 499500
+    assert profiler.error is error
+    assert profiler.remaining == 2
+
+
+def test_run_counts_when_operation_raises():
+    """A failing operation still completes its run."""
+    profiler = Profiler(1)
+    try:
+        with profiler.run():
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert profiler.finished
@@ -0,0 +1,127 @@
+"""Tests for the long-term statistics backfill."""
+
+import sys
+from datetime import UTC, datetime
+from enum import Enum
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from custom_components.arctic_spa import statistics
+from custom_components.arctic_spa.telemetry import TelemetryStore
+
+HOUR = 3600
+# 2024-01-01 00:00 UTC
+MIDNIGHT = 1704067200
+
+
+def _utc(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, UTC)
+
+
+@pytest.fixture(autouse=True)
+def dt_util(monkeypatch):
+    """Give statistics.py real UTC helpers, with the clock at 05:30 on the test day."""
+    monkeypatch.setattr(
+        statistics,
+        "dt_util",
+        SimpleNamespace(utc_from_timestamp=_utc, utcnow=lambda: _utc(MIDNIGHT + 5.5 * HOUR)),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Return an empty telemetry store."""
+    return TelemetryStore(tmp_path / "spa.telemetry.bin")
+
+
+def test_rows_start_on_the_hour(store):
+    """Samples are aggregated per clock hour, each row starting on the hour."""
+    store.append(MIDNIGHT + HOUR + 60, {"temperatureF": 100, "ph": 7.2, "orp": 600})
+    store.append(MIDNIGHT + HOUR + 1800, {"temperatureF": 102, "ph": 7.4, "orp": 650})
+    store.append(MIDNIGHT + 2 * HOUR + 5, {"temperatureF": 104, "ph": 7.6, "orp": 700})
+
+    rows = statistics.hourly_statistics(store, MIDNIGHT, MIDNIGHT + 3 * HOUR)
+
+    assert rows["temperature"] == [
+        {"start": _utc(MIDNIGHT + HOUR), "mean": 101, "min": 100, "max": 102},
+        {"start": _utc(MIDNIGHT + 2 * HOUR), "mean": 104, "min": 104, "max": 104},
+    ]
+    assert [row["max"] for row in rows["orp"]] == [650, 700]
+
+
+def test_missing_fields_are_skipped(store):
+    """An hour without a reading of a field has no row for that field."""
+    store.append(MIDNIGHT + 60, {"temperatureF": 100})
+    store.append(MIDNIGHT + HOUR + 60, {"temperatureF": 101, "ph": 7.3})
+
+    rows = statistics.hourly_statistics(store, MIDNIGHT, MIDNIGHT + 2 * HOUR)
+
+    assert len(rows["temperature"]) == 2
+    assert rows["ph"] == [{"start": _utc(MIDNIGHT + HOUR), "mean": 7.3, "min": 7.3, "max": 7.3}]
+    assert rows["orp"] == []
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    """Stand in for the recorder's statistics module; return the imported batches."""
+    imported = []
+    module = ModuleType("homeassistant.components.recorder.statistics")
+    module.async_add_external_statistics = lambda hass, metadata, rows: imported.append(
+        (metadata, rows)
+    )
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return imported
+
+
+async def _import(store, start, end):
+    async def async_add_executor_job(func, *args):
+        return func(*args)
+
+    hass = SimpleNamespace(async_add_executor_job=async_add_executor_job)
+    coordinator = SimpleNamespace(
+        config_entry=SimpleNamespace(entry_id="ABC", title="Spa"), telemetry=store
+    )
+    return await statistics.async_import_statistics(hass, coordinator, _utc(start), _utc(end))
+
+
+@pytest.mark.asyncio
+async def test_import_leaves_out_the_current_hour(store, recorder):
+    """Only completed hours are imported, even when the range reaches into the future."""
+    for hour in range(3, 6):
+        store.append(MIDNIGHT + hour * HOUR + 60, {"temperatureF": 100 + hour})
+
+    hours = await _import(store, MIDNIGHT, MIDNIGHT + 24 * HOUR)
+
+    assert hours == 2
+    metadata, rows = recorder[0]
+    assert metadata["statistic_id"] == "arctic_spa:abc_temperature"
+    assert metadata["has_mean"]
+    assert [row["start"] for row in rows] == [_utc(MIDNIGHT + 3 * HOUR), _utc(MIDNIGHT + 4 * HOUR)]
+
+
+@pytest.mark.asyncio
+async def test_import_starts_on_the_hour(store, recorder):
+    """A start within an hour still imports that hour whole, not a partial row."""
+    store.append(MIDNIGHT + HOUR + 60, {"temperatureF": 100})
+    store.append(MIDNIGHT + HOUR + 2400, {"temperatureF": 104})
+
+    await _import(store, MIDNIGHT + HOUR + 1800, MIDNIGHT + 2 * HOUR)
+
+    _, rows = recorder[0]
+    assert rows == [{"start": _utc(MIDNIGHT + HOUR), "mean": 102, "min": 100, "max": 104}]
+
+
+@pytest.mark.asyncio
+async def test_import_uses_the_mean_type(store, recorder, monkeypatch):
+    """Recorders that know mean types get one instead of the legacy has_mean flag."""
+    models = ModuleType("homeassistant.components.recorder.models")
+    models.StatisticMeanType = Enum("StatisticMeanType", ["NONE", "ARITHMETIC", "CIRCULAR"])
+    monkeypatch.setitem(sys.modules, models.__name__, models)
+    store.append(MIDNIGHT + 60, {"temperatureF": 100})
+
+    await _import(store, MIDNIGHT, MIDNIGHT + HOUR)
+
+    metadata, _ = recorder[0]
+    assert metadata["mean_type"] is models.StatisticMeanType.ARITHMETIC
+    assert "has_mean" not in metadata
@@ -0,0 +1,111 @@
+"""Tests for the on-disk telemetry store."""
+
+import pytest
+
+from custom_components.arctic_spa.telemetry import (
+    FLAG_CONNECTED,
+    FLAG_FILTERING,
+    FLAG_LIGHTS,
+    FLAG_PUMP1_HIGH,
+    FLAG_PUMP2_LOW,
+    TelemetryStore,
+)
+
+STATUS = {
+    "connected": True,
+    "temperatureF": 100,
+    "setpointF": 102,
+    "lights": "on",
+    "pump1": "high",
+    "pump2": "low",
+    "ph": 7.46,
+    "orp": 553,
+    "filter_status": "Filtering",
+    "errors": [],
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Return an empty store."""
+    return TelemetryStore(tmp_path / "spa.telemetry.bin")
+
+
+def test_round_trip(store):
+    """A payload decodes back to its readings and flags."""
+    assert store.append(1000.7, STATUS)
+    (sample,) = store.samples(0, 2000)
+    assert sample.timestamp == 1000
+    assert sample.temperature == 100
+    assert sample.setpoint == 102
+    assert sample.ph == 7.46
+    assert sample.orp == 553
+    assert sample.flags == (
+        FLAG_CONNECTED | FLAG_LIGHTS | FLAG_PUMP1_HIGH | FLAG_PUMP2_LOW | FLAG_FILTERING
+    )
+
+
+def test_missing_readings(store):
+    """Absent or invalid readings are stored as missing."""
+    store.append(1000, {"connected": False, "ph": None, "orp": "n/a"})
+    (sample,) = store.samples(0, 2000)
+    assert sample.temperature is None
+    assert sample.ph is None
+    assert sample.orp is None
+    assert sample.flags == 0
+
+
+def test_out_of_order_ignored(store):
+    """Samples not newer than the last record are dropped."""
+    assert store.append(1000, STATUS)
+    assert not store.append(1000, STATUS)
+    assert not store.append(999, STATUS)
+    assert len(store) == 1
+
+
+def test_extend(store):
+    """A batch is stored in one write, skipping samples that are not newer."""
+    assert store.append(1000, STATUS)
+    batch = [(1000, STATUS), (1060, STATUS), (1030, STATUS), (1120, {**STATUS, "orp": 560})]
+    assert store.extend(batch) == 2
+    assert [sample.timestamp for sample in store.samples(0, 2000)] == [1000, 1060, 1120]
+    assert list(store.samples(1100, 2000))[0].orp == 560
+    assert store.extend([(1120, STATUS)]) == 0
+
+
+def test_time_range(store):
+    """Queries return only samples in [start, end)."""
+    for timestamp in range(0, 600, 60):
+        store.append(timestamp + 1, {**STATUS, "temperatureF": timestamp // 60})
+    temperatures = [sample.temperature for sample in store.samples(121, 301)]
+    assert temperatures == [2, 3, 4]
+    assert list(store.samples(1000, 2000)) == []
+
+
+def test_downsample(store):
+    """Buckets report mean, minimum and maximum per field."""
+    for minute, temperature in enumerate((98, 100, 102, 104)):
+        store.append(3600 + minute * 1800, {**STATUS, "temperatureF": temperature})
+    first, second = store.downsample(0, 10_000, 3600)
+    assert (first.start, first.count) == (3600, 2)
+    assert (first.temperature.mean, first.temperature.min, first.temperature.max) == (99, 98, 100)
+    assert (second.start, second.count) == (7200, 2)
+    assert second.temperature.mean == 103
+    assert second.ph.mean == pytest.approx(7.46)
+
+
+def test_torn_record_repaired(store, tmp_path):
+    """A partial trailing record is truncated before the next append."""
+    store.append(1000, STATUS)
+    with store.path.open("ab") as file:
+        file.write(b"\x01\x02\x03")
+    reopened = TelemetryStore(store.path)
+    assert reopened.append(1060, STATUS)
+    assert [sample.timestamp for sample in reopened.samples(0, 2000)] == [1000, 1060]
+
+
+def test_empty_store(store):
+    """An absent file has no samples."""
+    assert len(store) == 0
+    assert list(store.samples(0, 1)) == []
+    assert store.downsample(0, 1, 60) == []
@@ -0,0 +1,147 @@
+"""Tests for the Arctic Spa transports."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.arctic_spa.api import (
+    ArcticSpaApiError,
+    ArcticSpaAuthError,
+    ArcticSpaClient,
+    ArcticSpaConnectionError,
+    LightState,
+    PumpState,
+)
+from custom_components.arctic_spa.transport import (
+    AiohttpTransport,
+    FakeSpa,
+    FakeSpaTransport,
+    RecordingTransport,
+    ReplayTransport,
+    TransportError,
+)
+
+
+class TestFakeSpaTransport:
+    """Tests for driving the client against the in-process fake spa."""
+
+    @pytest.mark.asyncio
+    async def test_status_round_trip(self):
+        """The client decodes the fake spa's state."""
+        fake = FakeSpaTransport(FakeSpa({"temperatureF": 98}))
+        client = ArcticSpaClient("key", transport=fake)
+        status = await client.async_get_status()
+        assert status.temperature_f == 98
+        assert fake.requests == [("GET", "status")]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_not_modified(self):
+        """The fake honours If-None-Match until the state changes."""
+        fake = FakeSpaTransport()
+        client = ArcticSpaClient("key", transport=fake)
+        await client.async_get_status_raw()
+        await client.async_get_status_raw()
+        assert client.not_modified == 1
+
+        fake.spa.update(temperatureF=104)
+        data = await client.async_get_status_raw()
+        assert data["temperatureF"] == 104
+        assert client.not_modified == 1
+
+    @pytest.mark.asyncio
+    async def test_commands_change_state(self):
+        """PUTs are applied to the simulated spa."""
+        fake = FakeSpaTransport()
+        client = ArcticSpaClient("key", transport=fake)
+        await client.async_set_lights(LightState.ON)
+        await client.async_set_pump(2, PumpState.HIGH)
+        await client.async_set_temperature(103)
+        await client.async_set_filtration(4, 2)
+        await client.async_set_boost(True)
+        assert fake.spa.state["lights"] == "on"
+        assert fake.spa.state["pump2"] == "high"
+        assert fake.spa.state["setpointF"] == 103
+        assert fake.spa.state["filtration_duration"] == 4
+        assert fake.spa.boost is True
+
+    @pytest.mark.asyncio
+    async def test_apply_delay(self):
+        """With an apply delay the command lands after the PUT returns."""
+        fake = FakeSpaTransport(apply_delay=0.01)
+        client = ArcticSpaClient("key", transport=fake)
+        await client.async_set_lights(LightState.ON)
+        assert fake.spa.state["lights"] == "off"
+        await asyncio.sleep(0.02)
+        assert fake.spa.state["lights"] == "on"
+
+    @pytest.mark.asyncio
+    async def test_wrong_key_rejected(self):
+        """Only the configured API key is accepted."""
+        client = ArcticSpaClient("wrong", transport=FakeSpaTransport(api_key="right"))
+        with pytest.raises(ArcticSpaAuthError):
+            await client.async_get_status()
+
+    @pytest.mark.asyncio
+    async def test_unknown_endpoint(self):
+        """Unknown command endpoints return 404."""
+        client = ArcticSpaClient("key", transport=FakeSpaTransport())
+        with pytest.raises(ArcticSpaApiError, match="404"):
+            await client.async_put("jets", {"state": "on"})
+
+    @pytest.mark.asyncio
+    async def test_offline_raises_connection_error(self):
+        """An offline fake looks like a network failure to the client."""
+        fake = FakeSpaTransport()
+        fake.offline = True
+        client = ArcticSpaClient("key", transport=fake)
+        with pytest.raises(ArcticSpaConnectionError):
+            await client.async_get_status()
+        assert client.get_stats.errors == 1
+
+
+class TestRecordReplay:
+    """Tests for recording exchanges and replaying them."""
+
+    @pytest.mark.asyncio
+    async def test_replay_serves_recorded_responses(self, tmp_path):
+        """A replayed recording returns the same responses in order."""
+        path = tmp_path / "exchanges.jsonl"
+        fake = FakeSpaTransport()
+        recorder = ArcticSpaClient("key", transport=RecordingTransport(fake, path))
+        await recorder.async_get_status_raw()
+        fake.spa.update(temperatureF=101)
+        await recorder.async_get_status_raw()
+        await recorder.async_set_lights(LightState.ON)
+
+        replay = ArcticSpaClient("key", transport=ReplayTransport(path))
+        assert (await replay.async_get_status_raw())["temperatureF"] == 100
+        assert (await replay.async_get_status_raw())["temperatureF"] == 101
+        # The last response repeats once the recording is used up
+        assert (await replay.async_get_status_raw())["temperatureF"] == 101
+        await replay.async_set_lights(LightState.ON)
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_request(self, tmp_path):
+        """A request missing from the recording fails like a network error."""
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        client = ArcticSpaClient("key", transport=ReplayTransport(path))
+        with pytest.raises(ArcticSpaConnectionError, match="No recorded response"):
+            await client.async_get_status()
+
+
+class TestAiohttpTransport:
+    """Tests for the aiohttp transport."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_transport_error(self):
+        """A request timeout surfaces as a TransportError."""
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(side_effect=TimeoutError)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.closed = False
+        session.get = MagicMock(return_value=cm)
+        with pytest.raises(TransportError, match="TimeoutError"):
+            await AiohttpTransport(session).request("GET", "https://spa/status", {}, 15)
@@ -0,0 +1,62 @@
+"""Tests for the update cycle watchdog."""
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.arctic_spa.watchdog import CycleWatchdog
+
+
+@pytest.mark.asyncio
+async def test_cycle_within_budget():
+    """A cheap cycle is recorded but not reported."""
+    watchdog = CycleWatchdog(budget=0.05, lag_interval=0.01)
+    watchdog.begin()
+    watchdog.record("http", 0.3)
+    watchdog.record("decode", 0.001)
+    watchdog.record("fanout", 0.002)
+    assert watchdog.end() is None
+    assert watchdog.sync.last == pytest.approx(0.003)
+    assert watchdog.phases["http"].last == 0.3
+    assert watchdog.over_budget == 0
+
+
+@pytest.mark.asyncio
+async def test_cycle_over_budget():
+    """Slow synchronous phases are reported; network wait does not count."""
+    watchdog = CycleWatchdog(budget=0.05, lag_interval=0.01)
+    watchdog.begin()
+    watchdog.record("http", 5.0)
+    watchdog.record("process", 0.04)
+    watchdog.record("fanout", 0.03)
+    cycle = watchdog.end()
+    assert cycle["sync"] == pytest.approx(0.07)
+    assert cycle["http"] == 5.0
+    assert watchdog.over_budget == 1
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_sampled_during_cycle():
+    """A blocking call during a cycle shows up as loop lag."""
+    watchdog = CycleWatchdog(budget=1.0, lag_interval=0.01)
+    watchdog.begin()
+    await asyncio.sleep(0.005)
+    time.sleep(0.05)  # block the loop past the next probe
+    await asyncio.sleep(0.02)
+    watchdog.end()
+    assert watchdog.lag.count >= 1
+    assert watchdog.lag.as_dict()["max"] >= 0.03
+
+    samples = watchdog.lag.count
+    await asyncio.sleep(0.03)
+    assert watchdog.lag.count == samples  # probe stops with the cycle
+
+
+def test_record_outside_cycle():
+    """Phases recorded between cycles (e.g. confirm polls) only feed the stats."""
+    watchdog = CycleWatchdog(budget=0.05, lag_interval=0.01)
+    watchdog.record("fanout", 0.5)
+    assert watchdog.end() is None
+    assert watchdog.phases["fanout"].count == 1
+    assert watchdog.sync.count == 0